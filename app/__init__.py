@@ -1,5 +1,39 @@
-from .api.galaxy_life_api import Mobius
-from .database import db_connection
-from .extensions.mobius.mobius import Mobius as NewMobius
+import importlib
 
-mobius = NewMobius(db_connection)
+# Atributos del paquete y el módulo del que se obtienen
+_attributes = {
+    'Mobius': ('.api.galaxy_life_api', 'Mobius'),
+    'db_connection': ('.database', 'db_connection'),
+    'async_db_connection': ('.database', 'async_db_connection'),
+    'NewMobius': ('.extensions.mobius.mobius', 'Mobius'),
+}
+
+def __getattr__(name: str):
+    """
+    ## Objetos de la aplicación
+    Los objetos del paquete se importan y crean al usarse por primera vez,
+    para que importar un submódulo (como `app.extensions.dml_manager`) no
+    cree las conexiones a la base de datos ni requiera las dependencias del
+    API de Galaxy Life.
+
+    Uso:
+    >>> from app import db_connection, mobius
+    """
+
+    # Instancia de Mobius con la conexión de la aplicación
+    if name == 'mobius':
+        value = __getattr__('NewMobius')(__getattr__('db_connection'))
+
+    # Atributo de un submódulo
+    elif name in _attributes:
+        ( module, attribute ) = _attributes[name]
+        value = getattr(importlib.import_module(module, __name__), attribute)
+
+    # Atributo inexistente
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Registro en el paquete para no volver a crearlo
+    globals()[name] = value
+
+    return value
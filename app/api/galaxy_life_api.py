@@ -128,8 +128,13 @@ class Mobius():
             ]
         )
 
-        # Obtención de la información de los enemigos
-        enemies = db_connection.search_read('enemies', [('id', 'in', planets['enemy_id'].to_list())], fields=['name', 'avatar', 'level'])
+        # Obtención de la información de los enemigos con planetas en la alianza, filtrados
+        #       con una subconsulta en la base de datos
+        enemies = db_connection.search_read(
+            'enemies',
+            [('id', 'in', db_connection.subquery('coords', [('alliance_id', '=', alliance_id)], 'enemy_id'))],
+            fields=['name', 'avatar', 'level'],
+        )
 
         # Obtención de los usuarios
         users = db_connection.search_read('users', fields=['user', 'avatar'])
@@ -242,11 +247,22 @@ class Mobius():
                 .to_dict('records')
             )
 
-            # Registro de los enemigos en la base de datos
-            db_connection.create('enemies', records)
+            # Registro de los enemigos en la base de datos, o actualización en caso de existir
+            enemy_ids = db_connection.upsert(
+                'enemies',
+                records,
+                ['name'],
+                ['avatar', 'level', 'role', 'alliance_id'],
+            )
 
-            # Obtención de los registros de enemigos (Con ID de base de datos)
-            enemies = db_connection.search_read('enemies', [('alliance_id', '=', alliance_id)], fields=['name', 'alliance_id'])
+            # Registros de enemigos con ID de base de datos
+            enemies = pd.DataFrame(
+                {
+                    'id': enemy_ids,
+                    'name': [ record['name'] for record in records ],
+                    'alliance_id': alliance_id,
+                }
+            )
 
             # Obtención de los niveles de base estelar de cada enemigo
             planets = await Mobius._get_alliance_total_planets(alliance_name)
@@ -295,8 +311,13 @@ class Mobius():
                 .to_dict('records')
             )
 
-            # Registro de los planetas principales
-            db_connection.create('coords', coords_records)
+            # Registro de los planetas principales, o actualización en caso de existir
+            db_connection.upsert(
+                'coords',
+                coords_records,
+                ['enemy_id', 'planet'],
+                ['starbase_level', 'alliance_id', 'war'],
+            )
 
         # Retorno de la ID de la alianza en la base de datos
         return alliance_id
@@ -418,10 +439,7 @@ class Mobius():
             }
 
             # Creación del registro en la base de datos
-            db_connection.create('alliances', record)
-
-            # Búsqueda de la alianza en la base de datos
-            db_data = db_connection.search_read('alliances', [('name', '=', alliance_name.lower())], fields= ['name', 'logo', 'level'], output_format= 'dict')
+            db_data = db_connection.create('alliances', record, fields= ['name', 'logo', 'level'])
 
         # Obtención de la ID de la alianza
         alliance_id = db_data[0]['id']
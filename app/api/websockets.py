@@ -1,6 +1,7 @@
 from fastapi import WebSocket
 import functools
 from typing import Callable, Awaitable
+from app.extensions._changes import ChangeEvent
 
 class ConnectionManager():
 
@@ -12,13 +13,31 @@ class ConnectionManager():
         self._active_connections.append(ws)
 
     def disconnect(self, ws: WebSocket):
-        self._active_connections.remove(ws)
+        # La conexión pudo haberse retirado antes al fallar un envío
+        if ws in self._active_connections:
+            self._active_connections.remove(ws)
 
     async def broadcast(self, message: str) -> None:
         print("Websocket procesa mensaje")
         for connection in self._active_connections:
             await connection.send_text(message)
 
+    async def broadcast_change(self, event: ChangeEvent) -> None:
+        # Sólo se envían la tabla, la operación, las IDs y los campos modificados, nunca los
+        #   valores, para no exponer datos como contraseñas
+        message = {
+            'table': event['table'],
+            'operation': event['operation'],
+            'ids': event['ids'],
+            'fields': event['fields'],
+        }
+        for connection in list(self._active_connections):
+            # Una conexión cerrada se retira sin interrumpir el envío a las demás
+            try:
+                await connection.send_json(message)
+            except Exception:
+                self.disconnect(connection)
+
     def notify_update_to_client(self, callback: Callable[..., Awaitable]):
 
         @functools.wraps(callback)
@@ -32,3 +51,5 @@ class ConnectionManager():
         return wrapper
 
 ws_manager = ConnectionManager()
+# Conexiones que reciben los cambios de la base de datos
+changes_ws_manager = ConnectionManager()
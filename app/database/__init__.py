@@ -1,8 +1,29 @@
-from dml_manager import DMLManager
-from app.database.models import Base
-
-db_connection = DMLManager(
-    'env',
-    Base,
-    'dataframe'
-)
+from app.extensions.dml_manager import DMLManager
+from app.extensions.async_dml_manager import AsyncDMLManager
+
+# Creación de las conexiones de la aplicación
+_connections = {
+    'db_connection': lambda: DMLManager("db_config", _dir_sublevels= 2),
+    'async_db_connection': lambda: AsyncDMLManager("db_config", _dir_sublevels= 2),
+}
+
+def __getattr__(name: str):
+    """
+    ## Conexiones de la aplicación
+    Las conexiones `db_connection` y `async_db_connection` se crean al usarse
+    por primera vez en lugar de al importar el paquete, para que los módulos
+    de `app` (como `app.database.fixtures` o las pruebas) se puedan importar
+    sin el archivo `db_config.json` de la aplicación.
+
+    Uso:
+    >>> from app.database import db_connection
+    """
+
+    # Atributo inexistente
+    if name not in _connections:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Creación de la conexión y registro en el módulo para no volver a crearla
+    connection = globals()[name] = _connections[name]()
+
+    return connection
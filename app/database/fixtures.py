@@ -0,0 +1,165 @@
+import argparse
+import random
+import pytz
+from datetime import datetime, timedelta
+from typing import Iterator
+from app.extensions.dml_manager import DMLManager
+from app.database.models import AllianceRole, SolarSystemColor
+from app.security.passwords import hash_password
+
+# Cantidad de planetas por enemigo (planeta principal y 11 colonias)
+PLANETS_PER_ENEMY = 12
+
+def generate_fixtures(
+    db: DMLManager,
+    alliances: int = 10,
+    enemies: int = 50,
+    users: int = 10,
+    seed: int | None = None,
+    password: str = "password",
+    chunk_size: int = 5000,
+) -> dict[str, int]:
+    """
+    ## Generación de datos sintéticos
+    Esta función llena la base de datos con `alliances` alianzas de `enemies`
+    enemigos cada una, 12 planetas por enemigo y `users` usuarios, además del
+    registro de la guerra actual contra la primera alianza. Está pensada para
+    usarse con una base de datos de SQLite (ver `'sqlite'` en los parámetros de
+    conexión de `DMLManager`) para medir y probar la aplicación sin un servidor
+    de base de datos.
+
+    Con la misma `seed` se generan los mismos datos. Todos los usuarios usan la
+    contraseña provista. Retorna la cantidad de registros creados por tabla.
+
+    Uso:
+    >>> db = DMLManager("db_config", "bench")
+    >>> generate_fixtures(db, alliances= 20, enemies= 50, users= 15, seed= 1)
+    >>> # {'users': 15, 'alliances': 20, 'war': 1, 'enemies': 1000, 'coords': 12000}
+    """
+
+    # Generador de valores aleatorios
+    rng = random.Random(seed)
+
+    # Fecha de referencia de los ataques, en la zona horaria de `app.utils.cdxm_now`
+    now = datetime.now(pytz.timezone('Etc/GMT+6')).replace(tzinfo= None)
+
+    with db.transaction():
+
+        # Creación de los usuarios con una misma contraseña
+        password_hash = hash_password(password)
+        user_ids = db.create(
+            'users',
+            [
+                {
+                    'user': f'user_{i}',
+                    'name': f'Usuario {i}',
+                    'password': password_hash,
+                    'active': True,
+                    'has_changed_password': True,
+                    'score_at_war_start': rng.randint(0, 50_000),
+                }
+                for i in range(users)
+            ]
+        )
+
+        # Creación de las alianzas
+        alliance_ids = db.create(
+            'alliances',
+            [
+                {
+                    'name': f'Alianza {i}',
+                    'logo': f'{rng.randint(1, 20)}-{rng.randint(1, 20)}-{rng.randint(1, 20)}',
+                    'level': rng.randint(1, 100),
+                }
+                for i in range(alliances)
+            ]
+        )
+
+        # Registro de la guerra actual contra la primera alianza
+        db.create(
+            'war',
+            {
+                'alliance_id': alliance_ids[0] if alliance_ids else None,
+                'enemy_alliance_regeneration_hours': 3,
+                'own_alliance_regeneration_hours': 3,
+            }
+        )
+
+        # Creación de los enemigos de cada alianza
+        enemy_records = [
+            {
+                'name': f'enemy_{a}_{e}',
+                'level': rng.randint(1, 100),
+                'role': rng.choice(list(AllianceRole)).value,
+                'online': rng.random() < 0.2,
+                'alliance_id': alliance_id,
+            }
+            for ( a, alliance_id ) in enumerate(alliance_ids)
+            for e in range(enemies)
+        ]
+        enemy_ids = []
+        for start in range(0, len(enemy_records), chunk_size):
+            enemy_ids += db.create('enemies', enemy_records[start:start + chunk_size])
+
+        # Creación de los planetas de cada enemigo con carga masiva
+        coords_stats = db.bulk_create('coords', _generate_coords(rng, now, user_ids, enemy_ids, enemy_records), chunk_size)
+
+    return {
+        'users': len(user_ids),
+        'alliances': len(alliance_ids),
+        'war': 1,
+        'enemies': len(enemy_ids),
+        'coords': coords_stats['rows'],
+    }
+
+def _generate_coords(
+    rng: random.Random,
+    now: datetime,
+    user_ids: list[int],
+    enemy_ids: list[int],
+    enemy_records: list[dict],
+) -> Iterator[dict]:
+    """
+    Generación de los planetas de cada enemigo, uno a la vez.
+    """
+
+    for ( enemy_id, enemy_record ) in zip(enemy_ids, enemy_records):
+        for planet in range(PLANETS_PER_ENEMY):
+
+            # Algunos planetas tienen coordenadas desconocidas o fueron atacados recientemente
+            known = planet == 0 or rng.random() < 0.8
+            attacked = rng.random() < 0.15
+            uid = rng.choice(user_ids)
+
+            yield {
+                'x': rng.randint(0, 1000) if known else None,
+                'y': rng.randint(0, 1000) if known else None,
+                'war': True,
+                'planet': planet,
+                'color': rng.choice(list(SolarSystemColor)).value,
+                'starbase_level': rng.randint(1, 9),
+                'attacked_at': now - timedelta(minutes= rng.randint(0, 600)) if attacked else None,
+                'attacked_by': rng.choice(user_ids) if attacked else None,
+                'enemy_id': enemy_id,
+                'create_uid': uid,
+                'write_uid': uid,
+                'alliance_id': enemy_record['alliance_id'],
+            }
+
+
+if __name__ == "__main__":
+
+    # Argumentos de la línea de comandos
+    parser = argparse.ArgumentParser(description= "Generación de datos sintéticos para pruebas y mediciones.")
+    parser.add_argument("--connection", default= "real", help= "Tipo de base de datos del archivo de configuración.")
+    parser.add_argument("--alliances", type= int, default= 10, help= "Cantidad de alianzas.")
+    parser.add_argument("--enemies", type= int, default= 50, help= "Cantidad de enemigos por alianza.")
+    parser.add_argument("--users", type= int, default= 10, help= "Cantidad de usuarios.")
+    parser.add_argument("--seed", type= int, default= None, help= "Semilla de los valores aleatorios.")
+    args = parser.parse_args()
+
+    # Conexión con la base de datos solicitada
+    db = DMLManager("db_config", args.connection, _dir_sublevels= 2)
+
+    # Generación de los datos
+    print(generate_fixtures(db, args.alliances, args.enemies, args.users, args.seed))
@@ -0,0 +1,27 @@
+import argparse
+from app.extensions.dml_manager import DMLManager
+
+
+if __name__ == "__main__":
+
+    # Argumentos de la línea de comandos
+    parser = argparse.ArgumentParser(description= "Verificación y creación de los índices declarados en los modelos.")
+    parser.add_argument("--connection", default= "real", help= "Tipo de base de datos del archivo de configuración.")
+    parser.add_argument("--check", action= "store_true", help= "Sólo reportar los índices faltantes, sin crearlos.")
+    args = parser.parse_args()
+
+    # Conexión con la base de datos solicitada
+    db = DMLManager("db_config", args.connection, _dir_sublevels= 2)
+
+    # Verificación y creación de índices
+    report = db.ensure_indexes(create= not args.check)
+
+    # Impresión del reporte
+    for entry in report:
+        print(f"{entry['status']:<8} {entry['table']:<10} {entry['index']} ({', '.join(entry['columns'])})")
+        if entry['error']:
+            print(f"         {entry['error']}")
+
+    # Código de salida de error si hay índices faltantes o con error
+    if any( entry['status'] in ('missing', 'error') for entry in report ):
+        raise SystemExit(1)
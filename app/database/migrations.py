@@ -0,0 +1,76 @@
+import argparse
+from app.extensions.dml_manager import DMLManager
+
+
+def deduplicate_enemies(db: DMLManager) -> dict[str, int]:
+    """
+    ## Eliminación de enemigos duplicados
+    Esta función prepara una base de datos existente para las restricciones de
+    unicidad de `enemies.name` y de `coords (enemy_id, planet)`, que no se
+    pueden crear mientras existan registros duplicados. De cada nombre de
+    enemigo repetido se conserva el registro con la menor ID, sus planetas
+    pasan a este registro y se eliminan los demás. Después, de cada planeta
+    repetido de un mismo enemigo se conserva el registro con la menor ID.
+
+    Todo se realiza en una sola transacción. Retorna la cantidad de registros
+    eliminados por tabla.
+
+    Uso:
+    >>> deduplicate_enemies(db)
+    >>> # {'enemies': 3, 'coords': 5}
+    >>> db.ensure_indexes()
+    """
+
+    with db.transaction():
+
+        # Obtención de los enemigos ordenados por ID
+        enemies = db.search_read('enemies', [], ['name'], sortby= 'id')
+
+        # ID conservada de cada enemigo, la menor de los que comparten el mismo nombre
+        kept_ids = enemies.groupby('name')['id'].transform('min')
+        duplicates = enemies.loc[enemies['id'] != kept_ids, 'id'].tolist()
+        replacements = dict(zip(enemies['id'], kept_ids))
+
+        # Obtención de los planetas ordenados por ID con la ID conservada de su enemigo
+        coords = db.search_read('coords', [], ['enemy_id', 'planet'], sortby= 'id')
+        coords['kept_enemy_id'] = coords['enemy_id'].map(replacements)
+
+        # Planetas repetidos de un mismo enemigo después de la unión de los duplicados
+        repeated = coords.duplicated(['kept_enemy_id', 'planet'])
+        repeated_ids = coords.loc[repeated, 'id'].tolist()
+
+        # Eliminación de los planetas repetidos
+        if repeated_ids:
+            db.delete('coords', repeated_ids)
+
+        # Reasignación de los planetas de los enemigos duplicados al enemigo conservado
+        moved = coords[~repeated & ( coords['enemy_id'] != coords['kept_enemy_id'] )]
+        for ( kept_enemy_id, group ) in moved.groupby('kept_enemy_id'):
+            db.update('coords', group['id'].tolist(), {'enemy_id': int(kept_enemy_id)})
+
+        # Eliminación de los enemigos duplicados
+        if duplicates:
+            db.delete('enemies', duplicates)
+
+    return {'enemies': len(duplicates), 'coords': len(repeated_ids)}
+
+
+if __name__ == "__main__":
+
+    # Argumentos de la línea de comandos
+    parser = argparse.ArgumentParser(description= "Eliminación de registros duplicados antes de crear las restricciones de unicidad.")
+    parser.add_argument("--connection", default= "real", help= "Tipo de base de datos del archivo de configuración.")
+    args = parser.parse_args()
+
+    # Conexión con la base de datos solicitada
+    db = DMLManager("db_config", args.connection, _dir_sublevels= 2)
+
+    # Eliminación de los duplicados
+    removed = deduplicate_enemies(db)
+
+    # Impresión del resultado
+    for ( table, count ) in removed.items():
+        print(f"{table:<10} {count} registros duplicados eliminados")
+
+    # Creación de las restricciones de unicidad
+    print("Ejecutar `python -m app.database.indexes` para crear las restricciones de unicidad.")
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, UniqueConstraint, Index, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.types import (
     Integer,
@@ -71,8 +71,19 @@ class Alliances(Base):
 class Enemies(Base):
 
     __tablename__ = "enemies"
-
-    name: Mapped[str] = mapped_column(String(25), nullable=False)
+    __table_args__ = (
+        # Búsqueda de los miembros de una alianza y de sus miembros conectados
+        Index('ix_enemies_alliance_id_online', 'alliance_id', 'online'),
+        # Búsqueda de nombres por expresión regular sin distinción de mayúsculas (requiere pg_trgm)
+        Index(
+            'ix_enemies_name_trgm',
+            'name',
+            postgresql_using= 'gin',
+            postgresql_ops= {'name': 'gin_trgm_ops'},
+        ).ddl_if(dialect= 'postgresql'),
+    )
+
+    name: Mapped[str] = mapped_column(String(25), nullable=False, unique= True)
     avatar: Mapped[str] = mapped_column(String(100), nullable= True)
     level: Mapped[int] = mapped_column(Integer, nullable= False)
     role: Mapped[AllianceRole] = mapped_column(SQLEnum(AllianceRole))
@@ -89,11 +100,25 @@ class Enemies(Base):
 class Coordinates(Base):
 
     __tablename__ = "coords"
+    __table_args__ = (
+        # Un jugador sólo puede tener un registro por planeta
+        UniqueConstraint('enemy_id', 'planet'),
+        # Coordenadas de una alianza ordenadas por nivel de base estelar
+        Index('ix_coords_alliance_id_starbase_level', 'alliance_id', 'starbase_level', 'id'),
+        # Planetas principales de una alianza para el cálculo de puntos de guerra
+        Index(
+            'ix_coords_alliance_id_main_planets',
+            'alliance_id',
+            postgresql_where= text('planet = 0'),
+            sqlite_where= text('planet = 0'),
+        ),
+    )
 
     x: Mapped[int] = mapped_column(Integer, nullable= True)
     y: Mapped[int] = mapped_column(Integer, nullable= True)
     war: Mapped[bool] = mapped_column(Boolean, nullable= False)
-    planet: Mapped[int] = mapped_column(Integer)
+    # Tipo de dato de pandas reducido para números de planeta (sólo se usan como etiqueta, no en operaciones)
+    planet: Mapped[int] = mapped_column(Integer, info= {'dtype': 'Int8'})
     color: Mapped[SolarSystemColor] = mapped_column(SQLEnum(SolarSystemColor), nullable= True)
     starbase_level: Mapped[int] = mapped_column(Integer)
     under_attack_since: Mapped[DateTime] = mapped_column(DateTime, nullable= True)
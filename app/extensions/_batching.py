@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+# Función que obtiene los registros de un lote de llaves
+BatchFetch = Callable[[Hashable, list[Hashable]], Awaitable[dict[Hashable, Any]]]
+
+class BatchLoader():
+    """
+    ## Agrupación de lecturas concurrentes
+    Esta clase agrupa las lecturas por llave hechas en un mismo ciclo del
+    event loop y las resuelve con una sola llamada a la función de obtención
+    por lote, descartando las llaves repetidas. Las lecturas se agrupan por
+    `batch_key` (por ejemplo, la tabla, el campo llave y los campos a leer) y
+    se envían al terminar el ciclo actual del event loop, en lotes de hasta
+    `max_batch_size` llaves.
+
+    Uso:
+    >>> async def fetch(batch_key, keys):
+    >>>     # Una sola consulta con todas las llaves
+    >>>     return { record['id']: record for record in await read_many(keys) }
+    >>> loader = BatchLoader(fetch)
+    >>> await asyncio.gather(loader.load('users', 2), loader.load('users', 3), loader.load('users', 2))
+    >>> # Una sola llamada a fetch('users', [2, 3])
+    """
+
+    def __init__(self, fetch: BatchFetch, max_batch_size: int = 1000) -> None:
+
+        # Función de obtención por lote
+        self._fetch = fetch
+        # Cantidad máxima de llaves por lote
+        self._max_batch_size = max_batch_size
+        # Lotes pendientes por event loop y llave de lote, con el futuro de cada llave
+        self._pending: dict[tuple[asyncio.AbstractEventLoop, Hashable], dict[Hashable, asyncio.Future]] = {}
+        # Tareas en ejecución, referenciadas para que no sean recolectadas antes de terminar
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, batch_key: Hashable, key: Hashable) -> Any:
+        """
+        ## Lectura de una llave
+        Este método agrega la llave al lote pendiente del ciclo actual y espera
+        su resultado. Las lecturas concurrentes de una misma llave comparten el
+        mismo resultado.
+        """
+
+        # Obtención del lote pendiente del event loop actual
+        loop = asyncio.get_running_loop()
+        pending_key = ( loop, batch_key )
+        batch = self._pending.get(pending_key)
+
+        # Creación del lote y programación de su envío al terminar el ciclo actual
+        if batch is None:
+            batch = self._pending[pending_key] = {}
+            loop.call_soon(self._dispatch, pending_key)
+
+        # Obtención o creación del futuro de la llave
+        future = batch.get(key)
+        if future is None:
+            future = batch[key] = loop.create_future()
+
+        # La cancelación de una lectura no cancela el resultado compartido con las demás
+        return await asyncio.shield(future)
+
+    def _dispatch(self, pending_key: tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        """
+        Envío de un lote pendiente como una tarea del event loop.
+        """
+
+        # Obtención y descarte del lote pendiente
+        ( loop, batch_key ) = pending_key
+        batch = self._pending.pop(pending_key)
+
+        # Ejecución del lote
+        task = loop.create_task(self._resolve(batch_key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch_key: Hashable, batch: dict[Hashable, asyncio.Future]) -> None:
+        """
+        ## Resolución de un lote
+        Este método interno obtiene los resultados de las llaves del lote por
+        bloques de `max_batch_size` llaves y los asigna a sus futuros. Las
+        llaves sin resultado reciben `None`. Si la obtención falla, el error se
+        asigna a los futuros del bloque.
+        """
+
+        # Llaves únicas del lote
+        keys = list(batch)
+
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = keys[start:start + self._max_batch_size]
+
+            # Obtención de los resultados del bloque
+            try:
+                results = await self._fetch(batch_key, chunk)
+            # Si se cancela el lote se cancelan las lecturas pendientes
+            except asyncio.CancelledError:
+                for future in batch.values():
+                    future.cancel()
+                raise
+            except Exception as error:
+                for key in chunk:
+                    if not batch[key].done():
+                        batch[key].set_exception(error)
+                continue
+
+            # Asignación de los resultados
+            for key in chunk:
+                if not batch[key].done():
+                    batch[key].set_result(results.get(key))
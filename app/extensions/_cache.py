@@ -0,0 +1,208 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Hashable, TypedDict
+
+class QueryCacheStats(TypedDict):
+    """
+    ## Estadísticas del caché de consultas
+    - `'size'`: Cantidad de resultados almacenados actualmente.
+    - `'max_size'`: Cantidad máxima de resultados almacenados.
+    - `'ttl'`: Segundos de vigencia de cada resultado (`None` si no expiran).
+    - `'hits'`: Consultas resueltas desde el caché.
+    - `'misses'`: Consultas que tuvieron que ejecutarse en la base de datos.
+    - `'evictions'`: Resultados descartados por exceder el tamaño máximo.
+    - `'expirations'`: Resultados descartados por exceder su tiempo de vigencia.
+    - `'invalidations'`: Resultados descartados por escrituras en su tabla.
+    - `'hit_ratio'`: Proporción de consultas resueltas desde el caché.
+    """
+    size: int
+    max_size: int
+    ttl: float | None
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+class QueryCache():
+    """
+    ## Caché de resultados de consultas
+    Esta clase almacena los resultados de las consultas de lectura con una
+    política LRU (se descarta el resultado usado menos recientemente al exceder
+    el tamaño máximo) y un tiempo de vigencia opcional. Los resultados se
+    indexan por tabla para descartar todos los de una tabla cuando ésta se
+    modifica.
+
+    Uso:
+    >>> cache = QueryCache(256, ttl= 30)
+    >>> generation = cache.generation(('users',))
+    >>> cache.set(('users',), key, rows, generation)
+    >>> cache.get(key)
+    >>> # (True, rows)
+    >>> cache.invalidate('users')
+    >>> cache.get(key)
+    >>> # (False, None)
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+
+        # Configuración del caché
+        self._max_size = max_size
+        self._ttl = ttl
+        # Candado para modificar el caché desde varios hilos
+        self._lock = Lock()
+
+        # Resultados almacenados por llave: (tablas, tiempo de expiración, valor)
+        self._entries: OrderedDict[Hashable, tuple[tuple[str, ...], float | None, Any]] = OrderedDict()
+        # Llaves almacenadas por tabla
+        self._table_keys: dict[str, set[Hashable]] = {}
+        # Generación de cada tabla, incrementada en cada invalidación
+        self._generations: dict[str, int] = {}
+
+        # Inicialización de contadores
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        ## Reinicio de contadores
+        Este método reinicia los contadores acumulados de las estadísticas.
+        """
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+            self._invalidations = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        ## Obtención de un resultado
+        Este método retorna si el resultado de la llave provista se encuentra
+        vigente en el caché y, en tal caso, el resultado.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            # Si no existe el resultado se registra la consulta fallida
+            if entry is None:
+                self._misses += 1
+                return ( False, None )
+
+            # Destructuración de valores
+            ( tables, expires_at, value ) = entry
+
+            # Si el resultado expiró se descarta
+            if expires_at is not None and expires_at <= monotonic():
+                self._remove(key, tables)
+                self._expirations += 1
+                self._misses += 1
+                return ( False, None )
+
+            # Se marca el resultado como usado recientemente
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return ( True, value )
+
+    def generation(self, tables: tuple[str, ...]) -> tuple[int, ...]:
+        """
+        ## Generación de las tablas
+        Este método retorna la generación actual de las tablas provistas. Se
+        debe obtener antes de ejecutar la consulta y proveerse a
+        `QueryCache.set` para no almacenar resultados leídos antes de una
+        escritura concurrente.
+        """
+
+        with self._lock:
+            return tuple( self._generations.get(table_name, 0) for table_name in tables )
+
+    def set(self, tables: tuple[str, ...], key: Hashable, value: Any, generation: tuple[int, ...]) -> None:
+        """
+        ## Almacenamiento de un resultado
+        Este método almacena el resultado de una consulta a una o más tablas,
+        siempre y cuando ninguna haya sido modificada desde la generación
+        provista.
+        """
+
+        with self._lock:
+            # Si alguna tabla se modificó durante la consulta se descarta el resultado
+            if tuple( self._generations.get(table_name, 0) for table_name in tables ) != generation:
+                return
+
+            # Cálculo del tiempo de expiración
+            expires_at = None if self._ttl is None else monotonic() + self._ttl
+
+            # Almacenamiento del resultado
+            self._entries[key] = ( tables, expires_at, value )
+            self._entries.move_to_end(key)
+            for table_name in tables:
+                self._table_keys.setdefault(table_name, set()).add(key)
+
+            # Descarte de los resultados usados menos recientemente
+            while len(self._entries) > self._max_size:
+                ( oldest_key, ( oldest_tables, _, _ ) ) = next(iter(self._entries.items()))
+                self._remove(oldest_key, oldest_tables)
+                self._evictions += 1
+
+    def invalidate(self, table_name: str) -> None:
+        """
+        ## Invalidación de una tabla
+        Este método descarta todos los resultados almacenados de una tabla.
+        """
+
+        with self._lock:
+            # Incremento de la generación de la tabla
+            self._generations[table_name] = self._generations.get(table_name, 0) + 1
+
+            # Descarte de los resultados de la tabla
+            keys = self._table_keys.pop(table_name, set())
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._remove(key, entry[0])
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        """
+        ## Vaciado del caché
+        Este método descarta todos los resultados almacenados.
+        """
+
+        with self._lock:
+            for table_name in self._table_keys:
+                self._generations[table_name] = self._generations.get(table_name, 0) + 1
+            self._entries.clear()
+            self._table_keys.clear()
+
+    def snapshot(self) -> QueryCacheStats:
+        """
+        ## Obtención de las estadísticas
+        Este método retorna las estadísticas actuales del caché.
+        """
+
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                'size': len(self._entries),
+                'max_size': self._max_size,
+                'ttl': self._ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'invalidations': self._invalidations,
+                'hit_ratio': self._hits / requests if requests else 0.0,
+            }
+
+    def _remove(self, key: Hashable, tables: tuple[str, ...]) -> None:
+        """
+        Descarte de un resultado y de su llave en el índice de sus tablas.
+        """
+
+        self._entries.pop(key, None)
+        for table_name in tables:
+            self._table_keys.get(table_name, set()).discard(key)
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from threading import Lock
+from typing import Any, Awaitable, Callable, Literal, TypedDict
+
+# Registro de errores de los suscriptores de cambios
+change_logger = logging.getLogger("dml_manager.changes")
+
+class ChangeEvent(TypedDict):
+    """
+    ## Evento de cambio
+    - `'table'`: Nombre de la tabla modificada.
+    - `'operation'`: `'create'`, `'upsert'`, `'update'` o `'delete'`.
+    - `'ids'`: IDs de los registros modificados, o `None` si no se conocen (cargas
+    masivas con `bulk_create`).
+    - `'fields'`: Campos escritos en la operación.
+    - `'values'`: Nuevos valores de cada registro, en el mismo orden de `'ids'`. Vacío
+    en eliminaciones y cargas masivas.
+    """
+    table: str
+    operation: Literal['create', 'upsert', 'update', 'delete']
+    ids: list[int] | None
+    fields: list[str]
+    values: list[dict[str, Any]]
+
+# Función asíncrona que recibe los eventos de cambio
+ChangeSubscriber = Callable[[ChangeEvent], Awaitable[None]]
+
+class ChangeFeed():
+    """
+    ## Publicación de cambios
+    Esta clase entrega los eventos de cambio de las escrituras a las funciones
+    asíncronas suscritas. Cada suscriptor se ejecuta como una tarea en el ciclo
+    de eventos en el que se suscribió, por lo que los eventos publicados desde
+    los hilos de las rutas síncronas también se entregan al ciclo de eventos de
+    la aplicación. Los errores de un suscriptor se reportan en el logger
+    `dml_manager.changes` sin afectar a la escritura ni a los demás suscriptores.
+
+    Uso:
+    >>> feed = ChangeFeed()
+    >>> async def on_change(event):
+    >>>     print(event['table'], event['ids'])
+    >>> unsubscribe = feed.subscribe(on_change)
+    >>> feed.publish([{'table': 'coords', 'operation': 'update', 'ids': [40], ...}])
+    >>> # coords [40]
+    """
+
+    def __init__(self) -> None:
+
+        # Suscriptores y el ciclo de eventos en el que se ejecutan
+        self._subscribers: list[tuple[ChangeSubscriber, asyncio.AbstractEventLoop | None]] = []
+        # Candado para modificar los suscriptores desde varios hilos
+        self._lock = Lock()
+        # Tareas en ejecución, referenciadas para que no sean recolectadas antes de terminar
+        self._tasks: set[asyncio.Task] = set()
+
+    def subscribe(
+        self,
+        callback: ChangeSubscriber,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> Callable[[], None]:
+        """
+        ## Suscripción a los cambios
+        Este método registra una función asíncrona que recibirá cada evento de
+        cambio. Si no se provee el ciclo de eventos se usa el que esté en
+        ejecución al suscribirse. Retorna una función que cancela la
+        suscripción.
+        """
+
+        # Obtención del ciclo de eventos en ejecución
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+        # Registro del suscriptor
+        subscriber = ( callback, loop )
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    def has_subscribers(self) -> bool:
+        """
+        Validación de si hay funciones suscritas a los cambios.
+        """
+
+        return len(self._subscribers) > 0
+
+    def publish(self, events: list[ChangeEvent]) -> None:
+        """
+        ## Publicación de eventos
+        Este método entrega cada evento a todos los suscriptores, en el orden
+        en el que fueron provistos, sin esperar a que éstos terminen.
+        """
+
+        # Copia de los suscriptores para no bloquear nuevas suscripciones
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        # Obtención del ciclo de eventos del contexto actual
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        for event in events:
+            for ( callback, loop ) in subscribers:
+                self._dispatch(callback, event, loop or running_loop, running_loop)
+
+    def _dispatch(
+        self,
+        callback: ChangeSubscriber,
+        event: ChangeEvent,
+        loop: asyncio.AbstractEventLoop | None,
+        running_loop: asyncio.AbstractEventLoop | None,
+    ) -> None:
+        """
+        ## Entrega de un evento a un suscriptor
+        Este método interno programa la ejecución del suscriptor en su ciclo de
+        eventos: como tarea si es el ciclo actual o de forma segura entre hilos
+        si es el ciclo de otro hilo.
+        """
+
+        # Sin ciclo de eventos disponible el evento no se puede entregar
+        if loop is None or loop.is_closed():
+            change_logger.warning("No hay ciclo de eventos para entregar el cambio en '%s'", event['table'])
+            return
+
+        # Ejecución en el ciclo de eventos actual
+        if loop is running_loop:
+            task = loop.create_task(callback(event))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_done)
+            return
+
+        # Ejecución en el ciclo de eventos de otro hilo
+        future = asyncio.run_coroutine_threadsafe(callback(event), loop)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future) -> None:
+        """
+        Liberación de la tarea terminada y registro de su error, en caso de haberlo.
+        """
+
+        self._tasks.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            change_logger.error("Error en un suscriptor de cambios", exc_info= future.exception())
@@ -0,0 +1,201 @@
+import logging
+from contextlib import nullcontext
+from sqlalchemy import Index, UniqueConstraint, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import DeclarativeBase
+from typing import Literal, TypedDict
+
+# Registro de la verificación de índices
+index_logger = logging.getLogger("dml_manager.indexes")
+
+class IndexReport(TypedDict):
+    """
+    ## Estado de un índice
+    - `'table'`: Nombre de la tabla.
+    - `'index'`: Nombre del índice.
+    - `'columns'`: Columnas del índice.
+    - `'unique'`: Si el índice es de una restricción de unicidad.
+    - `'status'`: `'present'` si ya existía, `'created'` si se creó, `'missing'` si no existe
+    y no se solicitó su creación, o `'error'` si no se pudo crear.
+    - `'error'`: Mensaje de error de la base de datos, en caso de haberlo.
+    """
+    table: str
+    index: str
+    columns: list[str]
+    unique: bool
+    status: Literal['present', 'created', 'missing', 'error']
+    error: str | None
+
+class IndexManager():
+    """
+    ## Gestión de índices
+    Esta clase compara los índices y restricciones de unicidad declarados en
+    los modelos con los existentes en la base de datos, y crea los faltantes.
+    Las restricciones de unicidad faltantes se crean como índices únicos, que
+    PostgreSQL y SQLite también usan para resolver `ON CONFLICT`. Los índices
+    de trigramas (`gin_trgm_ops`) sólo se consideran en PostgreSQL y requieren
+    la extensión `pg_trgm`, que se intenta crear si no existe.
+
+    Uso:
+    >>> manager = IndexManager(tables)
+    >>> with engine.begin() as conn:
+    >>>     manager.sync(conn, create= False)
+    >>> # [{'table': 'coords', 'index': 'ix_coords_alliance_id_starbase_level', 'status': 'missing', ...}]
+    """
+
+    def __init__(self, tables: dict[str, DeclarativeBase]) -> None:
+
+        # Tablas de los modelos declarados
+        self._tables = [ table_instance.__table__ for table_instance in tables.values() ]
+
+    def sync(self, conn: Connection, create: bool = True) -> list[IndexReport]:
+        """
+        ## Verificación y creación de índices
+        Este método retorna el estado de cada índice declarado en los modelos y,
+        si `create` es verdadero, crea los que no existan en la base de datos.
+        Cada creación se realiza en su propio punto de guardado en PostgreSQL
+        para que un error no impida crear los demás índices.
+        """
+
+        # Obtención del dialecto de la base de datos
+        dialect = conn.dialect.name
+
+        # Inicialización del reporte
+        report: list[IndexReport] = []
+
+        # Creación de la extensión de trigramas en caso de requerirse
+        extension_error = None
+        if create and dialect == 'postgresql' and self._requires_trigrams():
+            extension_error = self._execute(conn, lambda: conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm")))
+
+        for table in self._tables:
+
+            # Obtención de los índices existentes en la base de datos
+            inspector = inspect(conn)
+            existing_names = { index['name'] for index in inspector.get_indexes(table.name) }
+            existing_uniques = {
+                tuple(index['column_names']) for index in inspector.get_indexes(table.name) if index['unique']
+            } | {
+                tuple(constraint['column_names']) for constraint in inspector.get_unique_constraints(table.name)
+            }
+
+            # Índices declarados en la tabla
+            for index in sorted(table.indexes, key= lambda index: index.name):
+
+                # Los índices de trigramas sólo existen en PostgreSQL
+                if self._is_trigram(index) and dialect != 'postgresql':
+                    continue
+
+                columns = [ column.name for column in index.columns ]
+
+                # Índice existente
+                if index.name in existing_names:
+                    report.append(self._entry(table.name, index.name, columns, index.unique, 'present'))
+                    continue
+
+                # Índice faltante sin solicitud de creación
+                if not create:
+                    report.append(self._entry(table.name, index.name, columns, index.unique, 'missing'))
+                    continue
+
+                # Creación del índice
+                error = extension_error if self._is_trigram(index) and extension_error else self._execute(conn, lambda: index.create(conn))
+                report.append(self._entry(table.name, index.name, columns, index.unique, 'error' if error else 'created', error))
+
+            # Restricciones de unicidad declaradas en la tabla
+            for constraint in table.constraints:
+                if not isinstance(constraint, UniqueConstraint):
+                    continue
+
+                columns = [ column.name for column in constraint.columns ]
+                name = constraint.name or f"uq_{table.name}_{'_'.join(columns)}"
+
+                # Restricción existente, con cualquier nombre
+                if tuple(columns) in existing_uniques:
+                    report.append(self._entry(table.name, name, columns, True, 'present'))
+                    continue
+
+                # Restricción faltante sin solicitud de creación
+                if not create:
+                    report.append(self._entry(table.name, name, columns, True, 'missing'))
+                    continue
+
+                # Creación de la restricción como índice único
+                unique_index = Index(name, *[ table.c[column] for column in columns ], unique= True)
+                # El índice se desvincula de la tabla para no modificar los metadatos de los modelos
+                table.indexes.discard(unique_index)
+                error = self._execute(conn, lambda: unique_index.create(conn))
+                report.append(self._entry(table.name, name, columns, True, 'error' if error else 'created', error))
+
+        # Registro del resultado
+        self._log(report)
+
+        return report
+
+    def _requires_trigrams(self) -> bool:
+        """
+        Validación de si algún índice declarado usa trigramas.
+        """
+
+        return any( self._is_trigram(index) for table in self._tables for index in table.indexes )
+
+    def _is_trigram(self, index: Index) -> bool:
+        """
+        Validación de si un índice usa la clase de operadores de trigramas.
+        """
+
+        return 'gin_trgm_ops' in index.dialect_options['postgresql']['ops'].values()
+
+    def _execute(self, conn: Connection, operation) -> str | None:
+        """
+        ## Ejecución protegida de una sentencia DDL
+        Este método interno ejecuta una operación dentro de un punto de guardado
+        en PostgreSQL y retorna el mensaje de error en caso de fallar.
+        """
+
+        # Punto de guardado para no abortar la transacción completa
+        savepoint = conn.begin_nested() if conn.dialect.name == 'postgresql' else nullcontext()
+
+        try:
+            with savepoint:
+                operation()
+        except SQLAlchemyError as error:
+            return str(getattr(error, 'orig', error)).strip()
+
+        return None
+
+    def _entry(
+        self,
+        table: str,
+        index: str,
+        columns: list[str],
+        unique: bool,
+        status: str,
+        error: str | None = None,
+    ) -> IndexReport:
+        """
+        Creación de una entrada del reporte.
+        """
+
+        return {
+            'table': table,
+            'index': index,
+            'columns': columns,
+            'unique': unique,
+            'status': status,
+            'error': error,
+        }
+
+    def _log(self, report: list[IndexReport]) -> None:
+        """
+        Registro de los índices creados, faltantes o con error.
+        """
+
+        for entry in report:
+            if entry['status'] == 'created':
+                index_logger.info("Índice creado %s en '%s' (%s)", entry['index'], entry['table'], ", ".join(entry['columns']))
+            elif entry['status'] == 'missing':
+                index_logger.warning("Índice faltante %s en '%s' (%s)", entry['index'], entry['table'], ", ".join(entry['columns']))
+            elif entry['status'] == 'error':
+                index_logger.error("No se pudo crear el índice %s en '%s': %s", entry['index'], entry['table'], entry['error'])
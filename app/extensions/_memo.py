@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable
+
+def memoized(maxsize: int = 128) -> Callable[[Callable], Callable]:
+    """
+    ## Caché de resultados por instancia
+    Decorador de métodos que guarda sus resultados por argumentos en un caché
+    LRU de la propia instancia, dentro del diccionario `_memo_caches` creado en
+    su `__init__`. A diferencia de `functools.lru_cache`, el caché no se guarda
+    en la clase, por lo que no mantiene vivas a las instancias ni a las
+    sentencias que éstas compilaron.
+
+    Los resultados se calculan con el candado reentrante `_memo_lock` de la
+    instancia, para que las llamadas concurrentes con los mismos argumentos
+    obtengan el mismo objeto (por ejemplo, el mismo alias de una tabla).
+
+    Uso:
+    >>> class Manager():
+    >>>     def __init__(self):
+    >>>         self._memo_caches = {}
+    >>>         self._memo_lock = RLock()
+    >>>
+    >>>     @memoized(maxsize= 512)
+    >>>     def _compile(self, table_name: str) -> Select:
+    >>>         ...
+    """
+
+    def decorator(method: Callable) -> Callable:
+
+        # Nombre del caché del método en la instancia
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs) -> Any:
+
+            # Llave de los argumentos de la llamada
+            key = ( args, tuple(kwargs.items()) ) if kwargs else args
+
+            with self._memo_lock:
+                # Obtención o creación del caché del método
+                cache: OrderedDict = self._memo_caches.setdefault(name, OrderedDict())
+
+                # Retorno del resultado almacenado, marcándolo como el usado más recientemente
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+
+                # Cálculo y almacenamiento del resultado
+                value = cache[key] = method(self, *args, **kwargs)
+
+                # Descarte del resultado usado menos recientemente al exceder el tamaño máximo
+                if len(cache) > maxsize:
+                    cache.popitem(last= False)
+
+                return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,209 @@
+import logging
+from collections import deque
+from datetime import datetime
+from hashlib import sha1
+from threading import Lock
+from typing import TypedDict
+
+# Registro de consultas lentas
+slow_query_logger = logging.getLogger("dml_manager.slow_queries")
+
+class QueryStats(TypedDict):
+    """
+    ## Estadísticas de una consulta
+    - `'operation'`: Método de `DMLManager` que ejecutó la consulta.
+    - `'table'`: Nombre de la tabla consultada.
+    - `'fingerprint'`: Huella de la sentencia SQL normalizada.
+    - `'sql'`: Sentencia SQL normalizada, con parámetros enlazados en lugar de valores.
+    - `'count'`: Cantidad de ejecuciones.
+    - `'rows'`: Total de registros retornados o afectados.
+    - `'total_time'`: Tiempo total de ejecución, en segundos.
+    - `'max_time'`: Tiempo máximo de ejecución, en segundos.
+    - `'avg_time'`: Tiempo promedio de ejecución, en segundos.
+    - `'histogram'`: Cantidad de ejecuciones por límite superior de duración, en segundos.
+    """
+    operation: str
+    table: str
+    fingerprint: str
+    sql: str
+    count: int
+    rows: int
+    total_time: float
+    max_time: float
+    avg_time: float
+    histogram: dict[str, int]
+
+class SlowQuery(TypedDict):
+    """
+    ## Consulta lenta
+    - `'timestamp'`: Fecha y hora de término de la consulta.
+    - `'operation'`: Método de `DMLManager` que ejecutó la consulta.
+    - `'table'`: Nombre de la tabla consultada.
+    - `'fingerprint'`: Huella de la sentencia SQL normalizada.
+    - `'sql'`: Sentencia SQL normalizada.
+    - `'duration'`: Tiempo de ejecución, en segundos.
+    - `'rows'`: Registros retornados o afectados.
+    """
+    timestamp: datetime
+    operation: str
+    table: str
+    fingerprint: str
+    sql: str
+    duration: float
+    rows: int
+
+class QueryMetrics():
+    """
+    ## Instrumentación de consultas
+    Esta clase acumula, por operación, tabla y sentencia SQL normalizada, la
+    cantidad de ejecuciones, los registros retornados y un histograma de
+    tiempos de ejecución. Las consultas que exceden el umbral de consulta lenta
+    se guardan en un registro de tamaño limitado y se reportan en el logger
+    `dml_manager.slow_queries`.
+
+    Uso:
+    >>> metrics = QueryMetrics(slow_query_threshold= 0.2)
+    >>> metrics.record('search_read', 'coords', fingerprint, sql, 0.35, 120)
+    >>> metrics.snapshot()
+    >>> # [{'operation': 'search_read', 'table': 'coords', 'count': 1, ...}]
+    >>> metrics.slow_queries()
+    >>> # [{'operation': 'search_read', 'table': 'coords', 'duration': 0.35, ...}]
+    """
+
+    # Límites superiores de los intervalos del histograma, en segundos
+    _buckets = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, slow_query_threshold: float | None = None, slow_query_log_size: int = 100) -> None:
+
+        # Umbral de consulta lenta, en segundos
+        self._slow_query_threshold = slow_query_threshold
+        # Candado para actualizar los registros desde varios hilos
+        self._lock = Lock()
+
+        # Estadísticas por operación, tabla y huella de la sentencia
+        self._stats: dict[tuple[str, str, str], QueryStats] = {}
+        # Registro de consultas lentas
+        self._slow_queries: deque[SlowQuery] = deque(maxlen= slow_query_log_size)
+
+    def reset(self) -> None:
+        """
+        ## Reinicio de registros
+        Este método descarta las estadísticas y el registro de consultas lentas.
+        """
+
+        with self._lock:
+            self._stats.clear()
+            self._slow_queries.clear()
+
+    def record(self, operation: str, table: str, fingerprint: str, sql: str, duration: float, rows: int) -> None:
+        """
+        ## Registro de una ejecución
+        Este método registra la duración y los registros de una ejecución de
+        una consulta.
+        """
+
+        with self._lock:
+            # Obtención o inicialización de las estadísticas de la consulta
+            key = ( operation, table, fingerprint )
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    'operation': operation,
+                    'table': table,
+                    'fingerprint': fingerprint,
+                    'sql': sql,
+                    'count': 0,
+                    'rows': 0,
+                    'total_time': 0.0,
+                    'max_time': 0.0,
+                    'avg_time': 0.0,
+                    'histogram': { self._bucket_label(bucket): 0 for bucket in (*self._buckets, None) },
+                }
+
+            # Actualización de las estadísticas
+            stats['count'] += 1
+            stats['rows'] += rows
+            stats['total_time'] += duration
+            stats['max_time'] = max(stats['max_time'], duration)
+            stats['avg_time'] = stats['total_time'] / stats['count']
+            stats['histogram'][self._bucket_label(self._find_bucket(duration))] += 1
+
+            # Si la consulta no excede el umbral no se registra como lenta
+            if self._slow_query_threshold is None or duration < self._slow_query_threshold:
+                return
+
+            self._slow_queries.append(
+                {
+                    'timestamp': datetime.now(),
+                    'operation': operation,
+                    'table': table,
+                    'fingerprint': fingerprint,
+                    'sql': sql,
+                    'duration': duration,
+                    'rows': rows,
+                }
+            )
+
+        # Reporte de la consulta lenta
+        slow_query_logger.warning(
+            "Consulta lenta (%.3f s, %d registros) %s en '%s' [%s]: %s",
+            duration, rows, operation, table, fingerprint, sql,
+        )
+
+    def snapshot(self) -> list[QueryStats]:
+        """
+        ## Obtención de las estadísticas
+        Este método retorna las estadísticas de cada consulta, ordenadas de
+        mayor a menor tiempo total de ejecución.
+        """
+
+        with self._lock:
+            return sorted(
+                (
+                    { **stats, 'histogram': dict(stats['histogram']) }
+                    for stats in self._stats.values()
+                ),
+                key= lambda stats: stats['total_time'],
+                reverse= True,
+            )
+
+    def slow_queries(self) -> list[SlowQuery]:
+        """
+        ## Obtención de las consultas lentas
+        Este método retorna las consultas lentas registradas, de la más reciente
+        a la más antigua.
+        """
+
+        with self._lock:
+            return list(reversed(self._slow_queries))
+
+    @staticmethod
+    def fingerprint(sql: str) -> tuple[str, str]:
+        """
+        ## Huella de una sentencia SQL
+        Este método retorna la sentencia SQL con los espacios normalizados y una
+        huella corta de ésta para agrupar las ejecuciones de una misma consulta.
+        """
+
+        # Normalización de los espacios de la sentencia
+        sql = " ".join(sql.split())
+
+        return ( sha1(sql.encode()).hexdigest()[:12], sql )
+
+    def _find_bucket(self, duration: float) -> float | None:
+        """
+        Obtención del límite superior del intervalo del histograma de una duración.
+        """
+
+        for bucket in self._buckets:
+            if duration <= bucket:
+                return bucket
+
+        return None
+
+    def _bucket_label(self, bucket: float | None) -> str:
+        """
+        Etiqueta de un intervalo del histograma.
+        """
+
+        return "+inf" if bucket is None else f"{bucket:g}"
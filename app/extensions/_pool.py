@@ -0,0 +1,141 @@
+from threading import Lock
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import TypedDict
+
+class PoolStatsSnapshot(TypedDict):
+    """
+    ## Estadísticas del pool de conexiones
+    - `'pool_size'`: Tamaño configurado del pool (`None` si el pool no lo declara).
+    - `'checked_out'`: Conexiones actualmente en uso.
+    - `'checked_in'`: Conexiones inactivas disponibles en el pool.
+    - `'overflow'`: Conexiones abiertas actualmente por encima del tamaño del pool.
+    - `'overflow_hits'`: Conexiones creadas por encima del tamaño del pool desde el arranque.
+    - `'checkouts'`: Total de conexiones obtenidas del pool.
+    - `'timeouts'`: Veces que se agotó el tiempo de espera por una conexión.
+    - `'total_wait_time'`: Tiempo total de espera por conexiones, en segundos.
+    - `'max_wait_time'`: Tiempo máximo de espera por una conexión, en segundos.
+    - `'avg_wait_time'`: Tiempo promedio de espera por una conexión, en segundos.
+    """
+    pool_size: int | None
+    checked_out: int | None
+    checked_in: int | None
+    overflow: int | None
+    overflow_hits: int
+    checkouts: int
+    timeouts: int
+    total_wait_time: float
+    max_wait_time: float
+    avg_wait_time: float
+
+class PoolStats():
+    """
+    ## Instrumentación del pool de conexiones
+    Esta clase registra los eventos del pool de conexiones de un motor de
+    SQLAlchemy para conocer cuántas conexiones están en uso, cuánto tiempo se
+    espera por una conexión y cuántas veces se tuvo que recurrir al overflow
+    del pool.
+
+    Uso:
+    >>> stats = PoolStats(engine)
+    >>> stats.snapshot()
+    >>> # {'pool_size': 5, 'checked_out': 1, 'checked_in': 4, ...}
+    """
+
+    def __init__(self, engine: Engine) -> None:
+
+        # Pool del motor de conexión
+        self._pool = engine.pool
+        # Candado para actualizar los contadores desde varios hilos
+        self._lock = Lock()
+
+        # Inicialización de contadores
+        self.reset()
+
+        # Registro de eventos del pool
+        event.listen(self._pool, 'connect', self._on_connect)
+        event.listen(self._pool, 'checkout', self._on_checkout)
+
+    def reset(self) -> None:
+        """
+        ## Reinicio de contadores
+        Este método reinicia los contadores acumulados de las estadísticas.
+        """
+
+        with self._lock:
+            self._overflow_hits = 0
+            self._checkouts = 0
+            self._timeouts = 0
+            self._total_wait_time = 0.0
+            self._max_wait_time = 0.0
+            self._waits = 0
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        ## Registro de tiempo de espera
+        Este método registra el tiempo que se esperó para obtener una conexión
+        del pool.
+        """
+
+        with self._lock:
+            self._waits += 1
+            self._total_wait_time += seconds
+            if seconds > self._max_wait_time:
+                self._max_wait_time = seconds
+
+    def record_timeout(self) -> None:
+        """
+        ## Registro de tiempo de espera agotado
+        Este método registra que se agotó el tiempo de espera por una conexión
+        del pool.
+        """
+
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> PoolStatsSnapshot:
+        """
+        ## Obtención de las estadísticas
+        Este método retorna las estadísticas actuales del pool de conexiones.
+        """
+
+        with self._lock:
+            return {
+                'pool_size': self._pool_value('size'),
+                'checked_out': self._pool_value('checkedout'),
+                'checked_in': self._pool_value('checkedin'),
+                'overflow': self._pool_value('overflow'),
+                'overflow_hits': self._overflow_hits,
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'total_wait_time': self._total_wait_time,
+                'max_wait_time': self._max_wait_time,
+                'avg_wait_time': self._total_wait_time / self._waits if self._waits else 0.0,
+            }
+
+    def _pool_value(self, name: str) -> int | None:
+        """
+        Obtención de un valor del pool en caso de que éste lo declare.
+        """
+
+        method = getattr(self._pool, name, None)
+        return method() if callable(method) else None
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        """
+        Evento de creación de una nueva conexión en el pool.
+        """
+
+        # Si la nueva conexión excede el tamaño del pool se cuenta como overflow
+        overflow = self._pool_value('overflow')
+        if overflow is not None and overflow > 0:
+            with self._lock:
+                self._overflow_hits += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        """
+        Evento de obtención de una conexión del pool.
+        """
+
+        with self._lock:
+            self._checkouts += 1
@@ -1,7 +1,7 @@
-from typing import Literal, Union, TypedDict
+from typing import Any, Literal, NamedTuple, Union, TypedDict, NotRequired
 
 # Operadores de comparación para queries SQL
-_ComparisonOperator = Literal['=', '!=', '>', '>=', '<', '<=', '><', 'in', 'not in', 'ilike', 'not ilike']
+_ComparisonOperator = Literal['=', '!=', '>', '>=', '<', '<=', '><', 'in', 'not in', 'ilike', 'not ilike', '~*']
 # Operadores lógicos para queries SQL
 _LogicOperator = Literal['&', '|']
 # Tipo de dato de valor para queries SQL
@@ -48,6 +48,7 @@ Los operadores de comparación disponibles son:
 - `'not in'`: No está en
 - `'ilike'`: Contiene
 - `'not ilike'`: No contiene
+- `'~*'`: Coincide con la expresión regular (sin distinguir mayúsculas)
 
 Estas tuplas deben contenerse en una lista. En caso de haber más de una condición, se deben
 Unir por operadores lógicos `'AND'` u `'OR'`. Siendo el operador lógico el que toma la
@@ -60,10 +61,61 @@ primera posición:
 Los operadores lógicos disponibles son:
 - `'&'`: AND
 - `'|'`: OR
+
+El valor de los operadores `'in'` y `'not in'` también puede ser una subconsulta creada
+con `DMLManager.subquery`, que se ejecuta dentro de la misma sentencia SQL:
+>>> ('enemy_id', 'in', db.subquery('enemies', [('online', '=', False)]))
+>>> # "enemy_id" está en las IDs de los enemigos desconectados
 """
 
+class _Subquery(NamedTuple):
+    """
+    ## Subconsulta de un criterio de búsqueda
+    - `table`: Modelo de la tabla consultada.
+    - `field`: Campo retornado por la subconsulta.
+    - `criteria`: Criterio de búsqueda de la subconsulta.
+    """
+    table: Any
+    field: str
+    criteria: CriteriaStructure
+
 _CommonType = Union[str, int, float, list[int]]
-_OutputFormat = Literal["DataFrame", "dict"]
+# Forma de un criterio de búsqueda: operadores lógicos y tripletas de (campo, operador, tipo de valor)
+_CriteriaShape = tuple[
+    Union[
+        _LogicOperator,
+        tuple[
+            str,
+            _ComparisonOperator,
+            Literal['value', 'many', 'range', 'null'] | tuple[Literal['subquery'], Any, str, tuple]
+        ]
+    ],
+    ...
+]
+_OutputFormat = Literal["DataFrame", "dict", "records", "tuples", "numpy"]
+
+class _Page(TypedDict):
+    """
+    ## Página de registros
+    - `'data'`: Registros de la página en el formato de salida solicitado.
+    - `'count'`: Total de registros que cumplen con el criterio de búsqueda.
+    - `'cursor'`: Valores de los campos de ordenamiento del último registro de la
+    página para solicitar la siguiente (`None` si no hay más registros).
+    """
+    data: object
+    count: int
+    cursor: list | None
+
+class _BulkLoadStats(TypedDict):
+    """
+    ## Estadísticas de una carga masiva
+    - `'rows'`: Cantidad de registros cargados.
+    - `'seconds'`: Duración de la carga, en segundos.
+    - `'rows_per_second'`: Registros cargados por segundo.
+    """
+    rows: int
+    seconds: float
+    rows_per_second: float
 
 class _TablesMap(TypedDict):
     table_name: str
@@ -79,6 +131,24 @@ class _ConnectionParams(TypedDict):
     >>>     "name": ...,
     >>>     "user": ...,
     >>>     "password": ...,
+    >>>     "pool_size": ...,
+    >>>     "max_overflow": ...,
+    >>>     "pool_pre_ping": ...,
+    >>>     "pool_recycle": ...,
+    >>>     "pool_timeout": ...,
+    >>>     "statement_timeout": ...,
+    >>>     "cache_size": ...,
+    >>>     "cache_ttl": ...,
+    >>>     "slow_query_ms": ...,
+    >>>     "sqlite": ...,
+    >>>     "ensure_indexes": ...,
+    >>>     "replicas": [
+    >>>         {
+    >>>             "host": ...,
+    >>>             ...
+    >>>         },
+    >>>         ...
+    >>>     ],
     >>>     "path": ...,
     >>>     "tables": [
     >>>         {
@@ -94,6 +164,25 @@ class _ConnectionParams(TypedDict):
     - `'name'`: Nombre de la base de datos.
     - `'user'`: Usuario de la base de datos.
     - `'password'`: Contraseña del usuario.
+    - `'pool_size'` (opcional): Cantidad de conexiones persistentes del pool.
+    - `'max_overflow'` (opcional): Conexiones adicionales permitidas sobre `pool_size`.
+    - `'pool_pre_ping'` (opcional): Validación de la conexión antes de usarse.
+    - `'pool_recycle'` (opcional): Segundos tras los cuales se recicla una conexión.
+    - `'pool_timeout'` (opcional): Segundos de espera máxima por una conexión del pool.
+    - `'statement_timeout'` (opcional): Milisegundos de ejecución máxima por sentencia.
+    - `'cache_size'` (opcional): Cantidad máxima de resultados en el caché de lecturas. Sin
+    este parámetro el caché no se activa.
+    - `'cache_ttl'` (opcional): Segundos de vigencia de cada resultado del caché.
+    - `'slow_query_ms'` (opcional): Milisegundos a partir de los cuales una consulta se
+    registra como lenta.
+    - `'sqlite'` (opcional): Ruta del archivo de SQLite o `':memory:'`. Si se declara, se usa
+    una base de datos embebida de SQLite en lugar de PostgreSQL, se omiten los parámetros
+    de conexión a PostgreSQL y las tablas de los modelos se crean al inicializar la
+    instancia.
+    - `'ensure_indexes'` (opcional): Verificación y creación de los índices declarados en los
+    modelos al inicializar `DMLManager`.
+    - `'replicas'` (opcional): Réplicas de lectura. Cada réplica declara los parámetros de
+    conexión que difieren de los de la base de datos principal, como `host` o `pool_size`.
     - `'path'`: Ruta de importación en python
     - `'tables'`: Diccionario de tablas
     """
@@ -102,5 +191,17 @@ class _ConnectionParams(TypedDict):
     name: str
     user: str
     password: str
+    pool_size: NotRequired[int]
+    max_overflow: NotRequired[int]
+    pool_pre_ping: NotRequired[bool]
+    pool_recycle: NotRequired[int]
+    pool_timeout: NotRequired[int]
+    statement_timeout: NotRequired[int]
+    cache_size: NotRequired[int]
+    cache_ttl: NotRequired[float]
+    slow_query_ms: NotRequired[int]
+    sqlite: NotRequired[str]
+    ensure_indexes: NotRequired[bool]
+    replicas: NotRequired[list[dict]]
     path: str
     tables: list[_TablesMap]
\ No newline at end of file
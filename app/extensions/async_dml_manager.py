@@ -0,0 +1,905 @@
+import asyncio
+import pandas as pd
+from contextlib import asynccontextmanager
+from time import perf_counter
+from enum import Enum
+from typing import AsyncIterator, Awaitable, Callable, Hashable, Iterable
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    create_async_engine,
+)
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.dml import Insert, Update, Delete
+from .dml_manager import DMLManager
+from ._indexes import IndexManager, IndexReport
+from ._batching import BatchLoader
+from ._types import (
+    CriteriaStructure,
+    _CommonType,
+    _OutputFormat,
+    _ConnectionParams,
+    _Page,
+    _BulkLoadStats,
+)
+
+class AsyncDMLManager(DMLManager):
+    """
+    # Manejador asíncrono de transacciones con una base de datos
+    Versión asíncrona de `DMLManager` construida sobre el `AsyncEngine` de
+    SQLAlchemy y el driver `asyncpg`. Expone los mismos métodos que
+    `DMLManager` pero como corrutinas, por lo que las consultas no bloquean el
+    event loop de la aplicación mientras esperan la respuesta de la base de
+    datos.
+
+    La construcción de los queries, los criterios de búsqueda y los formatos
+    de salida son los mismos que en `DMLManager`. Para más información
+    consultar la documentación de dicha clase.
+
+    Uso:
+    >>> db = AsyncDMLManager("db_config", "real")
+    >>>
+    >>> await db.search_read('users', [('user', '=', 'onnymm')])
+    >>> #    id    user          name         create_date          write_date
+    >>> # 0   2  onnymm  Onnymm Azzur 2024-11-04 11:16:59 2024-11-04 11:16:59
+    >>>
+    >>> await db.update('users', [2], {'name': 'Cambiado'})
+    >>> # True
+
+    Las lecturas de un registro por ID o por otro campo llave hechas con `load` en
+    tareas concurrentes se agrupan en una sola consulta `IN` por ciclo del event
+    loop, para que las peticiones simultáneas de la aplicación no ejecuten una
+    consulta y ocupen una conexión cada una:
+    >>> await asyncio.gather(db.load('enemies', 12), db.load('enemies', 14))
+    >>> # Una sola consulta: ... WHERE enemies.id IN (12, 14)
+    """
+
+    # Driver asíncrono de conexión a PostgreSQL
+    _driver = "postgresql+asyncpg"
+    # Driver asíncrono de conexión a SQLite
+    _sqlite_driver = "sqlite+aiosqlite"
+
+    _engine: AsyncEngine
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Agrupación de las lecturas concurrentes por llave
+        self._loader = BatchLoader(self._load_batch)
+
+    async def ensure_indexes(self, create: bool = True) -> list[IndexReport]:
+        """
+        ## Verificación y creación de índices
+        Versión asíncrona de `DMLManager.ensure_indexes`. Los índices no se
+        verifican al inicializar esta clase aunque se declare `ensure_indexes`
+        en los parámetros de conexión, ya que la inicialización ocurre fuera
+        del ciclo de eventos; de ello se encarga la instancia de `DMLManager`.
+        """
+
+        async with self._engine.begin() as conn:
+            return await conn.run_sync(IndexManager(self._tables).sync, create)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncConnection]:
+        """
+        ## Transacción de múltiples operaciones
+        Versión asíncrona de `DMLManager.transaction`.
+
+        Uso:
+        >>> async with db.transaction():
+        >>>     await db.update('enemies', [12], {'online': True})
+        >>>     await db.update('coords', [40, 41], {'attacked_at': None})
+        """
+
+        # Si ya hay una transacción activa se reutiliza ésta
+        if self._transaction_connection.get() is not None:
+            yield self._transaction_connection.get()
+            return
+
+        # Conexión con la base de datos
+        async with self._connect() as conn:
+            # Registro de la conexión y las tablas modificadas de la transacción activa
+            token = self._transaction_connection.set(conn)
+            tables_token = self._transaction_tables.set(set())
+            changes_token = self._transaction_changes.set([])
+            try:
+                # Inicio de la transacción
+                async with conn.begin():
+                    yield conn
+                # Publicación de los cambios confirmados
+                self._changes.publish(self._transaction_changes.get())
+            finally:
+                # Obtención de las tablas modificadas
+                tables = self._transaction_tables.get()
+                self._transaction_connection.reset(token)
+                self._transaction_tables.reset(tables_token)
+                self._transaction_changes.reset(changes_token)
+                # Invalidación del caché de las tablas modificadas ya confirmadas
+                for table_name in tables:
+                    self._invalidate(table_name)
+
+    async def create(
+        self,
+        table_name: str,
+        data: list[dict] | dict,
+        fields: list[str] | None = None,
+    ) -> list[int] | list[dict[str, _CommonType]]:
+        """
+        ## Creación de registros
+        Versión asíncrona de `DMLManager.create`.
+        """
+
+        # Sin registros no se ejecuta ninguna sentencia
+        if isinstance(data, list) and not data:
+            return []
+
+        # Creación del query de inserción
+        ( stmt, params ) = self._build_create_stmt(table_name, data, fields)
+
+        # Ejecución en la base de datos
+        with self._measure('create', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._execute_returning(stmt, params)
+
+        # Publicación del cambio
+        self._emit(table_name, 'create', [ row.id for row in rows ], params)
+
+        # Retorno de los registros creados o de sus IDs
+        return self._format_created(rows, fields)
+
+    async def bulk_create(
+        self,
+        table_name: str,
+        data: Iterable[dict],
+        chunk_size: int = 10_000,
+    ) -> _BulkLoadStats:
+        """
+        ## Carga masiva de registros
+        Versión asíncrona de `DMLManager.bulk_create`. En PostgreSQL los
+        registros se transmiten con `COPY` a través de `copy_records_to_table`
+        de `asyncpg`.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Inicio de la medición
+        start = perf_counter()
+        rows = 0
+
+        # Conexión con la base de datos
+        with self._measure('bulk_create', table_name, None) as measure:
+            async with self._connect() as conn:
+
+                # Carga de cada bloque de registros
+                columns = []
+                for ( columns, records ) in self._iter_bulk_chunks(table_instance, data, chunk_size):
+                    if conn.dialect.name == 'postgresql':
+                        await self._copy_records(conn, table_instance, columns, records)
+                    else:
+                        await conn.execute(insert(table_instance), records)
+                    rows += len(records)
+
+                # Commit de los cambios
+                await self._commit(conn)
+
+            measure['rows'] = rows
+
+        # Invalidación del caché de la tabla
+        self._invalidate(table_name)
+
+        # Publicación del cambio sin IDs ni valores de los registros cargados
+        self._emit(table_name, 'create', None, [], columns)
+
+        # Retorno de las estadísticas de la carga
+        return self._bulk_load_stats(rows, perf_counter() - start)
+
+    async def upsert(
+        self,
+        table_name: str,
+        records: list[dict] | dict,
+        conflict_fields: list[str],
+        update_fields: list[str] | None = None,
+    ) -> list[int]:
+        """
+        ## Creación o actualización de registros
+        Versión asíncrona de `DMLManager.upsert`.
+        """
+
+        # Sin registros no se ejecuta ninguna sentencia
+        if isinstance(records, list) and not records:
+            return []
+
+        # Creación del query de inserción o actualización
+        ( stmt, params ) = self._build_upsert_stmt(table_name, records, conflict_fields, update_fields)
+
+        # Ejecución en la base de datos
+        with self._measure('upsert', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._execute_returning(stmt, params)
+
+        # Publicación del cambio
+        self._emit(table_name, 'upsert', [ row.id for row in rows ], params)
+
+        # Retorno de las IDs de los registros
+        return [ row.id for row in rows ]
+
+    async def search(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> list[int]:
+        """
+        ## Búsqueda de registros
+        Versión asíncrona de `DMLManager.search`.
+        """
+
+        # Creación del query de búsqueda
+        ( stmt, params ) = self._build_search_stmt(table_name, search_criteria, offset, limit)
+
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('search', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._cached(self._fetch, stmt, params)
+
+        # Se extraen las IDs en caso de existir o una lista vacía
+        return [ row.id for row in rows ]
+
+    async def read(
+        self,
+        table_name: str,
+        ids: list[int],
+        fields: list[str] = [],
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+        output_format: _OutputFormat = "DataFrame",
+    ) -> pd.DataFrame | list[dict[str, _CommonType]]:
+        """
+        ## Lectura de registros
+        Versión asíncrona de `DMLManager.read`.
+        """
+
+        # Creación del query de lectura
+        ( stmt, params ) = self._build_read_stmt(table_name, ids, fields, sortby, ascending)
+
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('read', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._cached(self._fetch, stmt, params)
+
+        # Retorno de los datos en el formato solicitado
+        return self._format_read(rows, output_format, table_name)
+
+    async def load(
+        self,
+        table_name: str,
+        value: Hashable,
+        key: str = 'id',
+        fields: list[str] = [],
+    ) -> dict[str, _CommonType] | None:
+        """
+        ## Lectura agrupada de un registro
+        Este método retorna el registro cuyo campo `key` tiene el valor provisto,
+        con la ID y los campos especificados (o todos los campos), o `None` si no
+        existe. Las llamadas concurrentes para la misma tabla, campo llave y
+        campos hechas en el mismo ciclo del event loop se resuelven con una sola
+        consulta `... WHERE key IN (...)`, sin repetir los valores solicitados
+        más de una vez. El campo llave debe identificar a un solo registro; si
+        hay varios se retorna el de menor ID.
+
+        Dentro de una transacción la lectura no se agrupa y se realiza con la
+        conexión de ésta.
+
+        Uso:
+        >>> await db.load('users', 'onnymm', key= 'user', fields= ['name', 'active'])
+        >>> # {'id': 2, 'name': 'Onnymm Azzur', 'active': True, 'user': 'onnymm'}
+        """
+
+        # Llave del lote, que separa también las lecturas forzadas a la base de datos principal
+        batch_key = ( table_name, key, tuple(fields), self._read_primary.get() )
+
+        # Dentro de una transacción se lee directamente
+        if self._transaction_connection.get() is not None:
+            return ( await self._load_batch(batch_key, [value]) ).get(value)
+
+        return await self._loader.load(batch_key, value)
+
+    async def load_many(
+        self,
+        table_name: str,
+        values: list[Hashable],
+        key: str = 'id',
+        fields: list[str] = [],
+    ) -> list[dict[str, _CommonType] | None]:
+        """
+        ## Lectura agrupada de muchos registros
+        Este método retorna los registros de los valores provistos, en el mismo
+        orden, usando `load`, por lo que se agrupan con las demás lecturas
+        concurrentes de la misma tabla.
+
+        Uso:
+        >>> await db.load_many('enemies', [12, 14, 99], fields= ['name'])
+        >>> # [{'id': 12, 'name': 'onnymm'}, {'id': 14, 'name': 'lumii'}, None]
+        """
+
+        return list( await asyncio.gather(*[ self.load(table_name, value, key, fields) for value in values ]) )
+
+    async def search_read(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        fields: list[str] = [],
+        offset: int | None = None,
+        limit: int | None = None,
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+        output_format: _OutputFormat = "DataFrame"
+    ) -> pd.DataFrame | list[dict[str, _CommonType]]:
+        """
+        ## Búsqueda y lectura de registros
+        Versión asíncrona de `DMLManager.search_read`.
+        """
+
+        # Creación del query de búsqueda y lectura
+        ( stmt, params ) = self._build_search_read_stmt(
+            table_name,
+            search_criteria,
+            fields,
+            offset,
+            limit,
+            sortby,
+            ascending
+        )
+
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('search_read', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._cached(self._fetch, stmt, params)
+
+        # Retorno de los datos en el formato solicitado
+        return self._format_search_read(rows, table_name, output_format)
+
+    async def iter_search_read(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        fields: list[str] = [],
+        offset: int | None = None,
+        limit: int | None = None,
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+        chunk_size: int = 1000,
+        output_format: _OutputFormat = "DataFrame"
+    ) -> AsyncIterator[pd.DataFrame | list[dict[str, _CommonType]]]:
+        """
+        ## Búsqueda y lectura de registros por bloques
+        Versión asíncrona de `DMLManager.iter_search_read`.
+
+        Uso:
+        >>> async for chunk in db.iter_search_read('coords', chunk_size= 5000):
+        >>>     ...
+        """
+
+        # Creación del query de búsqueda y lectura
+        ( stmt, params ) = self._build_search_read_stmt(
+            table_name,
+            search_criteria,
+            fields,
+            offset,
+            limit,
+            sortby,
+            ascending
+        )
+
+        # Conexión con la base de datos
+        async with self._connect_read() as conn:
+            # Ejecución con cursor del lado del servidor
+            response = await conn.stream(stmt.execution_options(yield_per= chunk_size), params)
+
+            # Retorno de cada bloque de filas en el formato solicitado
+            async for rows in response.partitions():
+                yield self._format_search_read(rows, table_name, output_format)
+
+    async def search_read_page(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        fields: list[str] = [],
+        page: int = 0,
+        items_per_page: int = 40,
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+        cursor: list[_CommonType] | None = None,
+        output_format: _OutputFormat = "DataFrame"
+    ) -> _Page:
+        """
+        ## Búsqueda y lectura de registros por páginas
+        Versión asíncrona de `DMLManager.search_read_page`.
+        """
+
+        # Creación del query de la página
+        ( stmt, params, sort_fields, limit ) = self._build_page_stmt(
+            table_name,
+            search_criteria,
+            fields,
+            page,
+            items_per_page,
+            sortby,
+            ascending,
+            cursor,
+        )
+
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('search_read_page', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._cached(self._fetch, stmt, params)
+
+        # Retorno de la página con el conteo total de registros
+        return {
+            'data': self._format_search_read(rows, table_name, output_format),
+            'count': await self.search_count(table_name, search_criteria),
+            'cursor': self._next_cursor(rows, sort_fields, limit),
+        }
+
+    async def search_count(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+    ) -> int:
+        """
+        ## Búsqueda y conteo de resultados
+        Versión asíncrona de `DMLManager.search_count`.
+        """
+
+        # Creación del query de conteo
+        ( stmt, params ) = self._build_search_count_stmt(table_name, search_criteria)
+
+        # Obtención del conteo de registros
+        with self._measure('search_count', table_name, stmt):
+            count = await self._cached(self._fetch_scalar, stmt, params)
+
+        return count
+
+    async def read_group(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        groupby: str | list[str] = [],
+        aggregates: list[str] = ['__count'],
+        mappings: dict[str, dict[_CommonType, _CommonType]] = {},
+        output_format: _OutputFormat = "DataFrame",
+    ) -> pd.DataFrame | list[dict[str, _CommonType]]:
+        """
+        ## Agrupación y agregación de registros
+        Versión asíncrona de `DMLManager.read_group`.
+        """
+
+        # Creación del query de agrupación
+        ( stmt, params ) = self._build_read_group_stmt(
+            table_name,
+            search_criteria,
+            groupby,
+            aggregates,
+            mappings,
+        )
+
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('read_group', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._cached(self._fetch, stmt, params)
+
+        # Sólo los campos de agrupación sin mapeo conservan el tipo de dato de la tabla
+        typed_fields = {
+            field for field in ( [groupby,] if isinstance(groupby, str) else groupby )
+            if field not in mappings
+        }
+
+        # Retorno de los datos en el formato solicitado
+        return self._format_search_read(rows, table_name, output_format, typed_fields)
+
+    async def update(
+        self,
+        table_name: str,
+        record_ids: int | list[int],
+        data: dict[str, _CommonType],
+    ) -> bool:
+        """
+        ## Actualización de registros
+        Versión asíncrona de `DMLManager.update`.
+        """
+
+        # Creación del query de actualización
+        stmt = self._build_update_stmt(table_name, record_ids, data)
+
+        # Ejecución en la base de datos
+        with self._measure('update', table_name, stmt) as measure:
+            measure['rows'] = await self._execute(stmt)
+
+        # Publicación del cambio
+        record_ids = [record_ids,] if isinstance(record_ids, int) else list(record_ids)
+        self._emit(table_name, 'update', record_ids, [ data ] * len(record_ids))
+
+        return True
+
+    async def update_many(
+        self,
+        table_name: str,
+        records: list[dict[str, _CommonType]],
+    ) -> bool:
+        """
+        ## Actualización de registros con valores por registro
+        Versión asíncrona de `DMLManager.update_many`.
+        """
+
+        # Creación de los queries de actualización
+        statements = self._build_update_many_stmts(table_name, records)
+
+        # Ejecución en la base de datos
+        with self._measure('update_many', table_name, statements[0][0] if statements else None) as measure:
+            measure['rows'] = await self._execute_many(statements)
+
+        # Publicación del cambio
+        self._emit(
+            table_name,
+            'update',
+            [ record['id'] for record in records ],
+            [ self._discard_unmutable_fields(record) for record in records ],
+        )
+
+        return True
+
+    async def update_where(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure,
+        data: dict[str, _CommonType],
+        returning: list[str] | None = None,
+    ) -> int | list[dict[str, _CommonType]]:
+        """
+        ## Actualización condicional de registros
+        Versión asíncrona de `DMLManager.update_where`.
+        """
+
+        # Creación del query de actualización condicional
+        ( stmt, params ) = self._build_update_where_stmt(table_name, search_criteria, data, returning)
+
+        # Ejecución en la base de datos
+        with self._measure('update_where', table_name, stmt) as measure:
+            rows = measure['rows'] = await self._execute_returning(stmt, params)
+
+        # Publicación del cambio
+        self._emit(table_name, 'update', [ row.id for row in rows ], [ data ] * len(rows))
+
+        # Retorno de la cantidad de registros actualizados o de los registros
+        return self._format_updated(rows, returning)
+
+    async def delete(self, table_name: str, record_ids: int | list[int]) -> bool:
+        """
+        ## Eliminación de registros
+        Versión asíncrona de `DMLManager.delete`.
+        """
+
+        # Creación del query de eliminación
+        stmt = self._build_delete_stmt(table_name, record_ids)
+
+        # Ejecución en la base de datos
+        with self._measure('delete', table_name, stmt) as measure:
+            measure['rows'] = await self._execute(stmt)
+
+        # Publicación del cambio
+        self._emit(table_name, 'delete', [record_ids,] if isinstance(record_ids, int) else list(record_ids), [])
+
+        return True
+
+    async def _load_batch(
+        self,
+        batch_key: tuple[str, str, tuple[str, ...], bool],
+        values: list[Hashable],
+    ) -> dict[Hashable, dict[str, _CommonType]]:
+        """
+        ## Lectura de un lote de llaves
+        Este método interno lee en una sola consulta los registros de los
+        valores provistos y los retorna indexados por el valor de su campo
+        llave.
+        """
+
+        # Destructuración de la llave del lote
+        ( table_name, key, fields, _ ) = batch_key
+
+        # El campo llave se lee para indexar los registros
+        query_fields = list(fields) + [key] if len(fields) > 0 and key not in fields and key != 'id' else list(fields)
+
+        # Lectura de los registros
+        records = await self.search_read(table_name, [(key, 'in', values)], query_fields, output_format= 'records')
+
+        # Indexación de los registros por su campo llave, conservando el de menor ID
+        indexed = {}
+        for record in records:
+            indexed.setdefault(record[key], record)
+
+        return indexed
+
+    async def _fetch(self, stmt: Select, params: dict[str, _CommonType] = {}) -> list[Row]:
+        """
+        ## Obtención de filas
+        Versión asíncrona de `DMLManager._fetch`.
+        """
+
+        # Conexión con la base de datos
+        async with self._connect_read() as conn:
+            # Obtención de los datos desde PostgreSQL
+            response = await conn.execute(stmt, params)
+            return response.fetchall()
+
+    async def _fetch_scalar(self, stmt: Select, params: dict[str, _CommonType] = {}) -> _CommonType:
+        """
+        ## Obtención de un valor escalar
+        Versión asíncrona de `DMLManager._fetch_scalar`.
+        """
+
+        # Conexión con la base de datos
+        async with self._connect_read() as conn:
+            # Obtención del valor desde PostgreSQL
+            response = await conn.execute(stmt, params)
+            return response.scalar()
+
+    async def _execute(self, stmt: Insert | Update | Delete) -> int:
+        """
+        ## Ejecución de sentencias de escritura
+        Versión asíncrona de `DMLManager._execute`.
+        """
+
+        # Conexión con la base de datos
+        async with self._connect() as conn:
+            # Ejecución en la base de datos
+            response = await conn.execute(stmt)
+            # Commit de los cambios
+            await self._commit(conn)
+
+        # Invalidación del caché de la tabla
+        self._invalidate(stmt.table.name)
+
+        return response.rowcount
+
+    async def _execute_many(self, statements: list[tuple[Update, list[dict[str, _CommonType]]]]) -> int:
+        """
+        ## Ejecución por lotes de sentencias de escritura
+        Versión asíncrona de `DMLManager._execute_many`.
+        """
+
+        # Inicialización del conteo de registros afectados
+        rowcount = 0
+
+        # Conexión con la base de datos
+        async with self._connect() as conn:
+            # Ejecución de cada sentencia por lotes
+            for ( stmt, params ) in statements:
+                response = await conn.execute(stmt, params)
+                rowcount += response.rowcount
+            # Commit de los cambios
+            await self._commit(conn)
+
+        # Invalidación del caché de las tablas
+        for ( stmt, _ ) in statements:
+            self._invalidate(stmt.table.name)
+
+        return rowcount
+
+    async def _execute_returning(
+        self,
+        stmt: Insert | Update | Delete,
+        params: list[dict] | dict[str, _CommonType] | None = None,
+    ) -> list[Row]:
+        """
+        ## Ejecución de sentencias de escritura con retorno
+        Versión asíncrona de `DMLManager._execute_returning`.
+        """
+
+        # Conexión con la base de datos
+        async with self._connect() as conn:
+            # Ejecución en la base de datos
+            response = await conn.execute(stmt, params)
+            rows = response.fetchall()
+            # Commit de los cambios
+            await self._commit(conn)
+
+        # Invalidación del caché de la tabla
+        self._invalidate(stmt.table.name)
+
+        return rows
+
+    async def _copy_records(
+        self,
+        conn: AsyncConnection,
+        table_instance: DeclarativeBase,
+        columns: list[str],
+        records: list[dict],
+    ) -> None:
+        """
+        ## Carga de registros con COPY
+        Versión asíncrona de `DMLManager._copy_records`. `asyncpg` transmite
+        los registros en formato binario, por lo que sólo los enums se
+        convierten a su nombre.
+        """
+
+        # Obtención de la conexión del driver
+        raw_connection = await conn.get_raw_connection()
+
+        # Transmisión de los registros
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_instance.__table__.name,
+            records= [
+                tuple( record[key].name if isinstance(record[key], Enum) else record[key] for key in columns )
+                for record in records
+            ],
+            columns= columns,
+            schema_name= table_instance.__table__.schema,
+        )
+
+    async def _cached(
+        self,
+        fetch: Callable[[Select, dict[str, _CommonType]], Awaitable[_CommonType]],
+        stmt: Select,
+        params: dict[str, _CommonType],
+    ) -> _CommonType:
+        """
+        ## Lectura a través del caché
+        Versión asíncrona de `DMLManager._cached`.
+        """
+
+        # Obtención de la llave de la consulta
+        key = self._cache_key(stmt, params)
+
+        # Si no hay caché aplicable se lee directamente de la base de datos
+        if key is None:
+            return await fetch(stmt, params)
+
+        # Búsqueda del resultado en el caché
+        ( found, value ) = self._cache.get(key)
+        if found:
+            return value
+
+        # Obtención de las tablas de la consulta y su generación previa a la lectura
+        tables = self._stmt_tables(stmt)
+        generation = self._cache.generation(tables)
+
+        # Lectura desde la base de datos y almacenamiento en el caché
+        value = await fetch(stmt, params)
+        self._cache.set(tables, key, value, generation)
+
+        return value
+
+    async def _commit(self, conn: AsyncConnection) -> None:
+        """
+        ## Commit de los cambios
+        Versión asíncrona de `DMLManager._commit`.
+        """
+
+        if self._transaction_connection.get() is None:
+            await conn.commit()
+
+    @asynccontextmanager
+    async def _connect_read(self) -> AsyncIterator[AsyncConnection]:
+        """
+        ## Obtención de una conexión de lectura
+        Versión asíncrona de `DMLManager._connect_read`.
+        """
+
+        # Lectura desde la base de datos principal
+        if not self._reads_from_replica():
+            async with self._connect() as conn:
+                yield conn
+            return
+
+        # Conexión con la siguiente réplica
+        async with next(self._replica_cycle).connect() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[AsyncConnection]:
+        """
+        ## Obtención de una conexión del pool
+        Versión asíncrona de `DMLManager._connect`.
+        """
+
+        # Si hay una transacción activa se usa su conexión
+        if self._transaction_connection.get() is not None:
+            yield self._transaction_connection.get()
+            return
+
+        # Inicio de la medición del tiempo de espera
+        start = perf_counter()
+
+        # Inicialización de la conexión
+        conn = self._engine.connect()
+
+        try:
+            await conn.start()
+        # Registro de tiempo de espera agotado
+        except PoolTimeoutError:
+            self._pool_stats.record_timeout()
+            raise
+
+        # Registro del tiempo de espera por la conexión
+        self._pool_stats.record_wait(perf_counter() - start)
+
+        try:
+            yield conn
+        # Devolución de la conexión al pool
+        finally:
+            await conn.close()
+
+    def _get_sync_engine(self) -> Engine:
+        """
+        ## Obtención del motor síncrono
+        Retorno del motor síncrono que envuelve el `AsyncEngine`, sobre el cual
+        se registran los eventos del pool de conexiones.
+        """
+
+        return self._engine.sync_engine
+
+    def _build_connect_args(self, connection_params: _ConnectionParams) -> dict:
+        """
+        ## Obtención de los argumentos de conexión
+        Versión de `DMLManager._build_connect_args` para el driver `asyncpg`,
+        que recibe los parámetros de PostgreSQL en `server_settings`.
+        """
+
+        # El driver de SQLite no requiere argumentos
+        if self._is_sqlite(connection_params):
+            return {}
+
+        # Si no se declaró tiempo máximo de ejecución no se requieren argumentos
+        if 'statement_timeout' not in connection_params:
+            return {}
+
+        return {'server_settings': {'statement_timeout': str(connection_params['statement_timeout'])}}
+
+    def _create_engine(self, connection_params: _ConnectionParams) -> AsyncEngine:
+        """
+        ## Creación del motor asíncrono de conexión a PostgreSQL
+        Este método interno crea el motor asíncrono de conexión a la base de
+        datos con los mismos parámetros de conexión usados por `DMLManager`.
+        """
+
+        # Creación de la URL de la conexión a la base de datos
+        url = self._build_url(connection_params)
+
+        # Creación del motor asíncrono de conexión con la base de datos
+        engine = create_async_engine(
+            url,
+            connect_args= self._build_connect_args(connection_params),
+            **self._build_pool_options(connection_params)
+        )
+
+        # Configuración de las conexiones de SQLite
+        if self._is_sqlite(connection_params):
+            self._configure_sqlite(engine, connection_params)
+
+        # Retorno del motor de conexión
+        return engine
+
+    def _create_sqlite_schema(
+        self,
+        engine: AsyncEngine,
+        tables: dict[str, DeclarativeBase],
+        connection_params: _ConnectionParams,
+    ) -> None:
+        """
+        ## Creación de las tablas en SQLite
+        Versión de `DMLManager._create_sqlite_schema` para el motor asíncrono.
+        Las tablas se crean con una conexión síncrona al mismo archivo, ya que
+        la instancia se inicializa fuera del ciclo de eventos. Por la misma
+        razón no se admiten bases de datos en memoria, que sólo existen dentro
+        de su propia conexión.
+        """
+
+        # Validación de base de datos en archivo
+        if connection_params['sqlite'] == ':memory:':
+            raise ValueError("AsyncDMLManager no admite bases de datos de SQLite en memoria. Se debe declarar la ruta de un archivo en 'sqlite'.")
+
+        # Creación de las tablas con un motor síncrono temporal
+        sync_engine = create_engine(f"{DMLManager._sqlite_driver}:///{connection_params['sqlite']}")
+        try:
+            super()._create_sqlite_schema(sync_engine, tables, connection_params)
+        finally:
+            sync_engine.dispose()
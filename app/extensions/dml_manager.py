@@ -1,8 +1,20 @@
 import pandas as pd
+import numpy as np
 import os
+import re
+import io
 import json
 import importlib
-from typing import Literal
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import OrderedDict
+from threading import RLock
+from datetime import datetime
+from time import perf_counter
+from enum import Enum
+from decimal import Decimal
+from itertools import cycle, islice
+from typing import Callable, Iterable, Iterator, Literal
 from sqlalchemy import (
     create_engine,
     insert,
@@ -11,14 +23,36 @@ from sqlalchemy import (
     delete,
     or_,
     and_,
+    not_,
     asc,
     desc,
     func,
+    bindparam,
+    event,
+    tuple_,
+    Integer,
+    Float,
+    Numeric,
+    Boolean,
+    String,
+    DateTime,
+    Enum as SQLEnum,
+    inspect,
+    case,
+    cast,
 )
 from sqlalchemy.orm import (
-    DeclarativeBase
+    DeclarativeBase,
+    RelationshipProperty,
+    aliased,
 )
-from sqlalchemy.sql.elements import BinaryExpression
+from sqlalchemy.orm.interfaces import MANYTOONE
+from sqlalchemy.sql.util import find_tables
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.elements import BinaryExpression, UnaryExpression
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from ._types import (
     CriteriaStructure,
@@ -26,9 +60,21 @@ from ._types import (
     _LogicOperator,
     _CommonType,
     _OutputFormat,
-    _ConnectionParams
+    _ConnectionParams,
+    _CriteriaShape,
+    _Page,
+    _BulkLoadStats,
+    _Subquery,
 )
 from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.dml import Insert, Update, Delete
+from sqlalchemy.engine import Row, Connection, Engine
+from ._pool import PoolStats, PoolStatsSnapshot
+from ._cache import QueryCache, QueryCacheStats
+from ._metrics import QueryMetrics, QueryStats, SlowQuery
+from ._indexes import IndexManager, IndexReport
+from ._changes import ChangeEvent, ChangeFeed, ChangeSubscriber
+from ._memo import memoized
 
 # Tipos de dato
 _DatabaseConnection = Literal["real", "test"]
@@ -65,6 +111,15 @@ class DMLManager():
                 "name": ...,
                 "user": ...,
                 "password": ...,
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_pre_ping": true,
+                "pool_recycle": 1800,
+                "pool_timeout": 30,
+                "statement_timeout": 15000,
+                "cache_size": 256,
+                "cache_ttl": 30,
+                "slow_query_ms": 200,
                 "path": "app.database.models...",
                 "tables": [
                     {
@@ -79,6 +134,65 @@ class DMLManager():
     }
     ```
 
+    Los parámetros `pool_size`, `max_overflow`, `pool_pre_ping`, `pool_recycle`,
+    `pool_timeout` y `statement_timeout` (en milisegundos) son opcionales. En caso de
+    no ser declarados se usan los valores por defecto de SQLAlchemy y PostgreSQL.
+
+    Los índices declarados en los modelos se verifican y crean con
+    `ensure_indexes()`, o al inicializar la instancia si se declara
+    `"ensure_indexes": true`.
+
+    Para usar una base de datos embebida de SQLite en lugar de PostgreSQL, por ejemplo
+    para pruebas o mediciones sin un servidor de base de datos, se declara la ruta del
+    archivo (o `":memory:"`) en `sqlite` en lugar de los parámetros de conexión. Las
+    tablas de los modelos se crean al inicializar la instancia:
+    ```
+    "bench": {
+        "sqlite": "bench.db",
+        "path": "app.database.models...",
+        "tables": [...]
+    }
+    ```
+
+    Las lecturas de `search`, `read`, `search_read`, `search_read_page`, `search_count`,
+    `read_group` e `iter_search_read` se pueden repartir entre réplicas de lectura
+    declaradas en `replicas`, donde cada réplica declara sólo los parámetros que
+    difieren de los de la base de datos principal. Las réplicas se usan por turnos. Las
+    escrituras y las lecturas dentro de `transaction()` siempre se realizan en la base
+    de datos principal, y para leer cambios recién escritos sin esperar a que lleguen a
+    las réplicas se usa el contexto `use_primary()`:
+    ```
+    "real": {
+        "host": "primary.example.com",
+        ...
+        "replicas": [
+            {"host": "replica-1.example.com"},
+            {"host": "replica-2.example.com", "pool_size": 10}
+        ]
+    }
+    ```
+
+    El caché de lecturas es opcional y se activa al declarar `cache_size` (cantidad
+    máxima de resultados almacenados) y opcionalmente `cache_ttl` (segundos de
+    vigencia de cada resultado). Las lecturas de `search`, `read`, `search_read` y
+    `search_count` se resuelven desde el caché mientras su tabla no sea modificada
+    por `create`, `upsert`, `update`, `update_many` o `delete`. Las instancias que usan
+    el mismo archivo de configuración y tipo de base de datos comparten el caché, por
+    lo que las escrituras de `AsyncDMLManager` también invalidan las lecturas de
+    `DMLManager`. Las lecturas de las réplicas no se guardan en el caché, por lo que
+    con `replicas` declaradas el caché no se usa.
+
+    Las escrituras se pueden observar suscribiendo una función asíncrona con
+    `subscribe()`, que recibe por cada escritura la tabla, la operación, las IDs de
+    los registros y los campos y valores escritos.
+
+    Cada llamada a `search`, `read`, `search_read`, `search_read_page`, `search_count`, `read_group`, `create`, `bulk_create`,
+    `upsert`, `update`, `update_many`, `update_where` y `delete` registra su tiempo de ejecución, los registros
+    retornados o afectados, la tabla y la huella de la sentencia SQL normalizada. Las
+    estadísticas se consultan con `query_stats()`. Si se declara `slow_query_ms`, las
+    llamadas que excedan dicho umbral se registran en `slow_queries()` y en el logger
+    `dml_manager.slow_queries`.
+
     Finalmente se inicializa la instancia, proporcionando el nombre del archivo de configuración (Sin nombre
     de extensión) y el tipo de base de datos con el que se usará. El valor por defecto es `"real"`:
     >>> db = DMLManager("db_config", "real")
@@ -99,8 +213,7 @@ class DMLManager():
     >>> }
     >>> 
     >>> db.create('users', record)
-    >>> #    id    user          name         create_date          write_date
-    >>> # 0   2  onnymm  Onnymm Azzur 2024-11-04 11:16:59 2024-11-04 11:16:59
+    >>> # [2]
     >>> 
     >>> # Para muchos registros
     >>> records = [
@@ -115,9 +228,45 @@ class DMLManager():
     >>> ]
     >>> 
     >>> db.create('users', records)
-    >>> #    id    user          name         create_date          write_date
-    >>> # 0   2  onnymm  Onnymm Azzur 2024-11-04 11:16:59 2024-11-04 11:16:59
-    >>> # 1   3   lumii    Lumii Mynx 2024-11-04 11:16:59 2024-11-04 11:16:59
+    >>> # [2, 3]
+
+    ----
+    ## Carga masiva de registros
+    `DMLManager.bulk_create()`
+
+    Este método crea grandes cantidades de registros por bloques. En PostgreSQL
+    los registros se transmiten con `COPY ... FROM STDIN` y en SQLite se
+    insertan con `executemany`. Acepta cualquier iterable de diccionarios y
+    retorna la cantidad de registros cargados y los registros por segundo.
+
+    Uso:
+    >>> db.bulk_create('coords', records, chunk_size= 10_000)
+    >>> # {'rows': 120000, 'seconds': 1.84, 'rows_per_second': 65217.4}
+
+    ----
+    ## Creación o actualización de registros
+    `DMLManager.upsert()`
+
+    Este método crea los registros provistos o, en caso de que ya exista un
+    registro con los mismos valores en los campos de conflicto, actualiza los
+    campos indicados de éste. Se ejecuta en una sola sentencia y retorna las IDs
+    de los registros creados o actualizados.
+
+    Uso:
+    >>> db.upsert('enemies', {'name': 'onnymm', 'level': 80}, ['name'], ['level'])
+    >>> # [12]
+
+    ----
+    ## Transacciones
+    `DMLManager.transaction()`
+
+    Todas las llamadas hechas dentro de este contexto comparten una misma
+    conexión y se confirman con un solo commit al terminar el bloque.
+
+    Uso:
+    >>> with db.transaction():
+    >>>     db.update('enemies', [12], {'online': True})
+    >>>     db.update('coords', [40, 41], {'attacked_at': None})
 
     ----
     ## Búsqueda de registros
@@ -177,6 +326,55 @@ class DMLManager():
     >>> # 0   2 Onnymm Azzur 2024-11-04 11:16:59
     >>> # 1   3   Lumii Mynx 2024-11-04 11:16:59
 
+    ### Campos relacionales
+    Los campos pueden referirse a columnas de una tabla relacionada con notación de
+    punto, a partir del campo de llave foránea (o del nombre de la relación)
+    declarado en el modelo. La base de datos realiza la unión en la misma consulta y
+    la columna se retorna con el nombre completo del campo:
+    >>> db.search_read('coords', [], ['x', 'y', 'enemy_id.name', 'attacked_by.user'])
+    >>> #    id   x   y  enemy_id.name  attacked_by.user
+    >>> # 0  40  12  87         lumii            onnymm
+
+        ### Formatos de salida
+    Los métodos `read` y `search_read` aceptan el parámetro `output_format`:
+    - `'DataFrame'`: DataFrame de pandas (valor por defecto).
+    - `'dict'`: Lista de diccionarios construida a partir del DataFrame.
+    - `'records'`: Lista de diccionarios construida directamente desde las filas
+    de la base de datos, sin pasar por pandas.
+    - `'tuples'`: Lista de tuplas en el orden de los campos, sin pasar por pandas.
+
+    Los formatos `'records'` y `'tuples'` retornan los valores tal como los entrega
+    el driver (`None`, `datetime`, enums, etc.), por lo que son los más ligeros para
+    consultas que sólo se envían como respuesta JSON:
+    >>> db.search_read('users', [('user', '=', 'onnymm')], ['user', 'name'], output_format= 'records')
+    >>> # [{'id': 2, 'user': 'onnymm', 'name': 'Onnymm Azzur'}]
+    >>> db.search_read('users', [('user', '=', 'onnymm')], ['user', 'name'], output_format= 'tuples')
+    >>> # [(2, 'onnymm', 'Onnymm Azzur')]
+
+    El formato `'numpy'` de `search_read` retorna un diccionario con un arreglo de
+    NumPy con tipo de dato por columna, construido directamente desde las filas y
+    pensado para cálculos vectorizados. Los enteros se retornan como `int64`
+    (arreglos enmascarados si la columna tiene nulos), los decimales como `float64`
+    con `NaN`, las fechas como `datetime64` con `NaT`, los textos con `StringDType`
+    y los enums como códigos `int8` según el orden de declaración del enum, con `-1`
+    para los nulos:
+    >>> db.search_read('coords', [], ['starbase_level', 'color'], output_format= 'numpy')
+    >>> # {'id': array([1, 2, ...]), 'starbase_level': array([9, 7, ...]), 'color': array([1, 0, ...], dtype=int8)}
+
+    ----
+    ## Búsqueda y lectura de registros por páginas
+    `DMLManager.search_read_page()`
+
+    Este método retorna una página de registros, el total de registros que cumplen
+    con el criterio de búsqueda y un cursor para solicitar la siguiente página por
+    búsqueda de llave (_keyset pagination_), cuyo costo no depende de la posición de
+    la página. Sin cursor la página se obtiene por desfase de registros.
+
+    Uso:
+    >>> page = db.search_read_page('coords', sortby= 'starbase_level', ascending= False, items_per_page= 40)
+    >>> # {'data': ..., 'count': 1250, 'cursor': [8, 1042]}
+    >>> db.search_read_page('coords', sortby= 'starbase_level', ascending= False, cursor= page['cursor'])
+
     ----
     ## Búsqueda y conteo de resultados
     `DMLManager.search_count()`
@@ -199,6 +397,23 @@ class DMLManager():
     - `search_criteria`: Criterio de búsqueda para retornar únicamente los resultados que
     cumplan con las condiciones provistas (Consultar estructura más abajo).
 
+    ----
+    ## Agrupación y agregación de registros
+    `DMLManager.read_group()`
+
+    Este método agrupa los registros en la base de datos por uno o más campos y
+    retorna las agregaciones `sum`, `count`, `min`, `max` o `avg` de cada grupo. Los
+    valores de un campo se pueden traducir antes de agregarse con un diccionario de
+    mapeo, que se convierte en una expresión `CASE`.
+
+    Uso:
+    >>> db.read_group('coords', [('war', '=', True)], 'enemy_id', ['__count', 'starbase_level:max'])
+    >>> #    enemy_id  __count  starbase_level:max
+    >>> # 0        12       12                   7
+    >>> db.read_group('coords', [('planet', '=', 0)], [], ['starbase_level:sum'], {'starbase_level': {1: 100, 2: 200}})
+    >>> #    starbase_level:sum
+    >>> # 0                2300
+
     ----
     ## Actualización de registros
     `DMLManager.update()`
@@ -230,6 +445,30 @@ class DMLManager():
     >>> # 3   6  user002  Cambiado
     >>> # 4   7  user003  Cambiado
 
+    ----
+    ## Actualización de registros con valores por registro
+    `DMLManager.update_many()`
+
+    Este método actualiza muchos registros asignando a cada uno sus propios
+    valores, en una sola conexión y un solo commit.
+
+    Uso:
+    >>> db.update_many('coords', [{'id': 3, 'starbase_level': 7}, {'id': 4, 'starbase_level': 9}])
+    >>> # True
+
+    ----
+    ## Actualización condicional de registros
+    `DMLManager.update_where()`
+
+    Este método actualiza en una sola sentencia atómica los registros que cumplan
+    con un criterio de búsqueda en el momento de la escritura y retorna la cantidad
+    de registros actualizados, o los registros actualizados si se especifican
+    campos en `returning`.
+
+    Uso:
+    >>> db.update_where('coords', ['&', ('id', '=', 40), ('attacked_by', '=', None)], {'attacked_by': 2})
+    >>> # 1
+
     ----
     ## Eliminación de registros
     `DMLManager.delete()`
@@ -281,6 +520,7 @@ class DMLManager():
     - `'not in'`: No está en
     - `'ilike'`: Contiene
     - `'not ilike'`: No contiene
+    - `'~*'`: Coincide con la expresión regular (sin distinguir mayúsculas)
 
     Estas tuplas deben contenerse en una lista. En caso de haber más de una condición, se deben
     Unir por operadores lógicos `'AND'` u `'OR'`. Siendo el operador lógico el que toma la
@@ -321,12 +561,52 @@ class DMLManager():
         'write_date',
     }
 
+    # Driver de conexión a PostgreSQL
+    _driver = "postgresql+psycopg2"
+    # Driver de conexión a SQLite
+    _sqlite_driver = "sqlite+pysqlite"
+
+    # Parámetros opcionales del pool de conexiones
+    _pool_options = (
+        'pool_size',
+        'max_overflow',
+        'pool_pre_ping',
+        'pool_recycle',
+        'pool_timeout',
+    )
+
+    # Cachés de lecturas compartidos por archivo de configuración y tipo de base de datos
+    _query_caches: dict[tuple[str, str], QueryCache] = {}
+    # Publicadores de cambios compartidos por archivo de configuración y tipo de base de datos
+    _change_feeds: dict[tuple[str, str], ChangeFeed] = {}
+
+    # Constructores de sentencias INSERT ... ON CONFLICT por dialecto
+    _dialect_inserts = {
+        'postgresql': postgresql_insert,
+        'sqlite': sqlite_insert,
+    }
+
     # Mapas de funciones:
     _sorting_direction = {
         True: asc,
         False: desc,
     }
 
+    # Funciones de agregación de 'read_group'
+    _aggregate_functions = {
+        'sum': func.sum,
+        'count': func.count,
+        'min': func.min,
+        'max': func.max,
+        'avg': lambda column: cast(func.avg(column), Float),
+    }
+
+    # Formatos de salida construidos directamente desde las filas
+    _row_formats = {
+        'records': lambda rows: [ row._asdict() for row in rows ],
+        'tuples': lambda rows: [ tuple(row) for row in rows ],
+    }
+
     def __init__(
         self,
         config_file_name: str,
@@ -334,24 +614,313 @@ class DMLManager():
         _dir_sublevels: int = 3
     ):
 
-        # Creación del diccionario de tablas y el engine de SQLAlchemy
-        ( self._tables, self._engine ) = self._get_config(
+        # Cachés por instancia de los métodos decorados con `memoized` (sentencias, alias y huellas)
+        self._memo_caches: dict[str, OrderedDict] = {}
+        self._memo_lock = RLock()
+
+        # Creación del diccionario de tablas, los engines de SQLAlchemy y el caché de lecturas
+        ( self._tables, self._engine, self._replicas, self._cache, self._metrics ) = self._get_config(
             config_file_name,
             _dir_sublevels,
             database_connection
         )
 
+        # Rotación de las réplicas de lectura
+        self._replica_cycle = cycle(self._replicas) if self._replicas else None
+
+        # Publicador de cambios compartido con las demás instancias de la misma base de datos
+        self._changes = self._change_feeds.setdefault(( config_file_name, database_connection ), ChangeFeed())
+
+        # Instrumentación del pool de conexiones
+        self._pool_stats = PoolStats(self._get_sync_engine())
+
+        # Captura de la sentencia SQL ejecutada para las métricas de consultas
+        for engine in ( self._engine, *self._replicas ):
+            event.listen(getattr(engine, 'sync_engine', engine), 'before_cursor_execute', self._on_cursor_execute)
+
+        # Precálculo de los tipos de dato de cada tabla
+        self._dtype_plans = {
+            table_instance: self._build_dtype_plan(table_instance)
+            for table_instance in self._tables.values()
+        }
+        # Precálculo de los tipos de arreglo de NumPy de cada tabla
+        self._array_plans = {
+            table_instance: self._build_array_plan(table_instance)
+            for table_instance in self._tables.values()
+        }
+
+        # Conexión de la transacción activa en el contexto de ejecución actual
+        self._transaction_connection: ContextVar[Connection | None] = ContextVar(
+            f"transaction_connection_{id(self)}",
+            default= None
+        )
+        # Tablas modificadas en la transacción activa, a invalidar en el caché al terminar ésta
+        self._transaction_tables: ContextVar[set[str] | None] = ContextVar(
+            f"transaction_tables_{id(self)}",
+            default= None
+        )
+        # Eventos de cambio de la transacción activa, a publicar después del commit
+        self._transaction_changes: ContextVar[list[ChangeEvent] | None] = ContextVar(
+            f"transaction_changes_{id(self)}",
+            default= None
+        )
+        # Lecturas forzadas a la base de datos principal en el contexto de ejecución actual
+        self._read_primary: ContextVar[bool] = ContextVar(
+            f"read_primary_{id(self)}",
+            default= False
+        )
+        # Medición en curso en el contexto de ejecución actual
+        self._current_measure: ContextVar[dict | None] = ContextVar(
+            f"current_measure_{id(self)}",
+            default= None
+        )
+
+    def pool_stats(self) -> PoolStatsSnapshot:
+        """
+        ## Estadísticas del pool de conexiones
+        Este método retorna las estadísticas del pool de conexiones, útiles para
+        dimensionar el pool según la cantidad de workers de la aplicación y para
+        detectar falta de conexiones disponibles bajo carga.
+
+        Uso:
+        >>> db.pool_stats()
+        >>> # {
+        >>> #     'pool_size': 5,
+        >>> #     'checked_out': 2,
+        >>> #     'checked_in': 3,
+        >>> #     'overflow': 0,
+        >>> #     'overflow_hits': 4,
+        >>> #     'checkouts': 1520,
+        >>> #     'timeouts': 0,
+        >>> #     'total_wait_time': 0.84,
+        >>> #     'max_wait_time': 0.12,
+        >>> #     'avg_wait_time': 0.00055,
+        >>> # }
+        """
+
+        return self._pool_stats.snapshot()
+
+    def cache_stats(self) -> QueryCacheStats | None:
+        """
+        ## Estadísticas del caché de lecturas
+        Este método retorna las estadísticas del caché de lecturas para
+        confirmar su efectividad, o `None` si el caché no está activado.
+
+        Uso:
+        >>> db.cache_stats()
+        >>> # {
+        >>> #     'size': 42,
+        >>> #     'max_size': 256,
+        >>> #     'ttl': 30,
+        >>> #     'hits': 1830,
+        >>> #     'misses': 210,
+        >>> #     'evictions': 0,
+        >>> #     'expirations': 96,
+        >>> #     'invalidations': 114,
+        >>> #     'hit_ratio': 0.897,
+        >>> # }
+        """
+
+        if self._cache is None:
+            return None
+
+        return self._cache.snapshot()
+
+    def query_stats(self) -> list[QueryStats]:
+        """
+        ## Estadísticas de consultas
+        Este método retorna, por operación, tabla y sentencia SQL normalizada,
+        la cantidad de ejecuciones, los registros retornados o afectados y el
+        histograma de tiempos de ejecución, ordenadas de mayor a menor tiempo
+        total.
+
+        Uso:
+        >>> db.query_stats()
+        >>> # [
+        >>> #     {
+        >>> #         'operation': 'search_read',
+        >>> #         'table': 'coords',
+        >>> #         'fingerprint': '3f9a1c0b7e2d',
+        >>> #         'sql': 'SELECT coords.id, ... WHERE coords.alliance_id = :crit_0 ...',
+        >>> #         'count': 530,
+        >>> #         'rows': 6360,
+        >>> #         'total_time': 4.1,
+        >>> #         'max_time': 0.09,
+        >>> #         'avg_time': 0.0077,
+        >>> #         'histogram': {'0.001': 0, '0.005': 120, '0.01': 380, ...},
+        >>> #     },
+        >>> #     ...
+        >>> # ]
+        """
+
+        return self._metrics.snapshot()
+
+    def slow_queries(self) -> list[SlowQuery]:
+        """
+        ## Consultas lentas
+        Este método retorna las consultas más recientes que excedieron el umbral
+        `slow_query_ms` de los parámetros de conexión.
+        """
+
+        return self._metrics.slow_queries()
+
+    def ensure_indexes(self, create: bool = True) -> list[IndexReport]:
+        """
+        ## Verificación y creación de índices
+        Este método compara los índices y restricciones de unicidad declarados
+        en los modelos con los existentes en la base de datos y retorna el
+        estado de cada uno. Si `create` es verdadero se crean los faltantes; en
+        otro caso sólo se reportan. Los índices faltantes o que no se pudieron
+        crear también se reportan en el logger `dml_manager.indexes`.
+
+        Uso:
+        >>> db.ensure_indexes(create= False)
+        >>> # [
+        >>> #     {'table': 'coords', 'index': 'ix_coords_alliance_id_starbase_level', 'status': 'missing', ...},
+        >>> #     {'table': 'enemies', 'index': 'ix_enemies_name_trgm', 'status': 'present', ...},
+        >>> #     ...
+        >>> # ]
+        """
+
+        with self._engine.begin() as conn:
+            return IndexManager(self._tables).sync(conn, create)
+
+    def subscribe(self, callback: ChangeSubscriber) -> Callable[[], None]:
+        """
+        ## Suscripción a los cambios
+        Este método registra una función asíncrona que recibe un evento por cada
+        escritura hecha con `create`, `bulk_create`, `upsert`, `update`,
+        `update_many`, `update_where` o `delete`, con la tabla, la operación, las IDs de los
+        registros y los campos y valores escritos. Los eventos de las escrituras
+        dentro de `transaction()` se publican sólo si ésta se confirma.
+
+        La función se ejecuta en el ciclo de eventos en el que se suscribió y
+        recibe los cambios de todas las instancias con el mismo archivo de
+        configuración y tipo de base de datos, incluyendo las de
+        `AsyncDMLManager`. Retorna una función que cancela la suscripción.
+
+        Uso:
+        >>> async def on_change(event):
+        >>>     print(event)
+        >>> unsubscribe = db.subscribe(on_change)
+        >>> db.update('coords', [40], {'starbase_level': 9})
+        >>> # {'table': 'coords', 'operation': 'update', 'ids': [40], 'fields': ['starbase_level'], 'values': [{'starbase_level': 9}]}
+        """
+
+        return self._changes.subscribe(callback)
+
+    def subquery(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        field: str = 'id',
+    ) -> _Subquery:
+        """
+        ## Subconsulta para criterios de búsqueda
+        Este método crea una subconsulta que se usa como valor de los operadores
+        `'in'` y `'not in'` de un criterio de búsqueda. La subconsulta retorna
+        el campo provisto de los registros de la tabla que cumplan con su
+        criterio de búsqueda y se ejecuta dentro de la misma sentencia SQL, por
+        lo que las IDs no tienen que leerse primero desde la base de datos.
+
+        Uso:
+        >>> db.search_read(
+        >>>     'coords',
+        >>>     [('enemy_id', 'in', db.subquery('enemies', [('online', '=', False)]))],
+        >>> )
+        >>> # ... WHERE coords.enemy_id IN (SELECT enemies.id FROM enemies WHERE enemies.online = ...)
+        """
+
+        return _Subquery(self._get_table_instance(table_name), field, search_criteria)
+
+    @contextmanager
+    def use_primary(self) -> Iterator[None]:
+        """
+        ## Lecturas desde la base de datos principal
+        Todas las lecturas hechas dentro de este contexto se realizan en la base
+        de datos principal en lugar de las réplicas y sin pasar por el caché,
+        para leer los cambios recién escritos sin esperar a que las réplicas
+        los reciban. Se puede usar tanto con `DMLManager` como con
+        `AsyncDMLManager`.
+
+        Uso:
+        >>> db.update('coords', [40], {'attacked_at': now})
+        >>> with db.use_primary():
+        >>>     db.read('coords', [40], ['attacked_at'])
+        """
+
+        # Registro de la preferencia en el contexto de ejecución actual
+        token = self._read_primary.set(True)
+        try:
+            yield
+        finally:
+            self._read_primary.reset(token)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """
+        ## Transacción de múltiples operaciones
+        Este método crea un contexto en el que todas las llamadas a los métodos
+        de la instancia comparten una misma conexión y una misma transacción. Los
+        cambios se confirman con un solo commit al salir del contexto y se
+        revierten todos en caso de ocurrir una excepción dentro de éste.
+
+        Uso:
+        >>> with db.transaction():
+        >>>     ids = db.search('coords', [('enemy_id', '=', 12)])
+        >>>     db.update('enemies', [12], {'online': True})
+        >>>     db.update('coords', ids, {'attacked_at': None})
+        >>> # Un solo commit al terminar el bloque
+
+        Las transacciones anidadas se unen a la transacción exterior. La
+        transacción sólo aplica al hilo o a la tarea asíncrona que la inició.
+        """
+
+        # Si ya hay una transacción activa se reutiliza ésta
+        if self._transaction_connection.get() is not None:
+            yield self._transaction_connection.get()
+            return
+
+        # Conexión con la base de datos
+        with self._connect() as conn:
+            # Registro de la conexión y las tablas modificadas de la transacción activa
+            token = self._transaction_connection.set(conn)
+            tables_token = self._transaction_tables.set(set())
+            changes_token = self._transaction_changes.set([])
+            try:
+                # Inicio de la transacción
+                with conn.begin():
+                    yield conn
+                # Publicación de los cambios confirmados
+                self._changes.publish(self._transaction_changes.get())
+            finally:
+                # Obtención de las tablas modificadas
+                tables = self._transaction_tables.get()
+                self._transaction_connection.reset(token)
+                self._transaction_tables.reset(tables_token)
+                self._transaction_changes.reset(changes_token)
+                # Invalidación del caché de las tablas modificadas ya confirmadas
+                for table_name in tables:
+                    self._invalidate(table_name)
+
     def create(
         self,
         table_name: str,
-        data: list[dict] | dict
-    ) -> bool:
+        data: list[dict] | dict,
+        fields: list[str] | None = None,
+    ) -> list[int] | list[dict[str, _CommonType]]:
         """
         ## Creación de registros
         Este método realiza la creación de uno o muchos registros a partir del
         nombre de la tabla proporcionado y un diccionario (un único registro) o
         una lista de diccionarios (muchos registros).
 
+        Retorna las IDs de los registros creados, en el orden en el que fueron
+        provistos. Si se especifican campos en `fields` se retornan en su lugar
+        los registros creados con la ID y dichos campos, o todos los campos si se
+        provee una lista vacía. Ambos se obtienen en la misma sentencia por medio
+        de `RETURNING`.
+
         Uso:
         >>> # Para un solo registro
         >>> record = {
@@ -360,8 +929,7 @@ class DMLManager():
         >>> }
         >>> 
         >>> db.create('users', record)
-        >>> #    id    user          name         create_date          write_date
-        >>> # 0   2  onnymm  Onnymm Azzur 2024-11-04 11:16:59 2024-11-04 11:16:59
+        >>> # [2]
         >>> 
         >>> # Para muchos registros
         >>> records = [
@@ -376,43 +944,162 @@ class DMLManager():
         >>> ]
         >>> 
         >>> db.create('users', records)
-        >>> #    id    user          name         create_date          write_date
-        >>> # 0   2  onnymm  Onnymm Azzur 2024-11-04 11:16:59 2024-11-04 11:16:59
-        >>> # 1   3   lumii    Lumii Mynx 2024-11-04 11:16:59 2024-11-04 11:16:59
+        >>> # [2, 3]
+        >>> 
+        >>> # Retorno de los registros creados
+        >>> db.create('users', records, ['user', 'create_date'])
+        >>> # [
+        >>> #     {'id': 2, 'user': 'onnymm', 'create_date': datetime(2024, 11, 4, 11, 16, 59)},
+        >>> #     {'id': 3, 'user': 'lumii', 'create_date': datetime(2024, 11, 4, 11, 16, 59)},
+        >>> # ]
 
         ----
         ### Nota
         Los campos como `id`, `create_date` y `write_date` son descartados, pues
-        éstos son manejados por la base de datos y no son manipulables.
+        éstos son manejados por la base de datos y no son manipulables. Una lista
+        vacía de registros retorna una lista vacía sin consultar la base de datos.
+        """
+
+        # Sin registros no se ejecuta ninguna sentencia
+        if isinstance(data, list) and not data:
+            return []
+
+        # Creación del query de inserción
+        ( stmt, params ) = self._build_create_stmt(table_name, data, fields)
+
+        # Ejecución en la base de datos
+        with self._measure('create', table_name, stmt) as measure:
+            rows = measure['rows'] = self._execute_returning(stmt, params)
+
+        # Publicación del cambio
+        self._emit(table_name, 'create', [ row.id for row in rows ], params)
+
+        # Retorno de los registros creados o de sus IDs
+        return self._format_created(rows, fields)
+
+    def bulk_create(
+        self,
+        table_name: str,
+        data: Iterable[dict],
+        chunk_size: int = 10_000,
+    ) -> _BulkLoadStats:
+        """
+        ## Carga masiva de registros
+        Este método crea una gran cantidad de registros enviándolos por bloques
+        de `chunk_size` registros. En PostgreSQL los registros se transmiten con
+        `COPY ... FROM STDIN`, sin construir ni compilar sentencias `INSERT`; en
+        SQLite se insertan con `executemany` por bloque. Los datos pueden ser
+        cualquier iterable de diccionarios, incluyendo generadores, por lo que
+        no es necesario tener todos los registros en memoria.
+
+        Las columnas se toman del primer registro; los campos faltantes en los
+        demás registros se guardan como nulos. Los campos con valor por defecto
+        en el modelo (como `create_date` y `write_date`) se calculan una vez por
+        bloque. A diferencia de `create`, no se retornan las IDs de los
+        registros creados sino la cantidad de registros, la duración de la carga
+        y los registros por segundo.
+
+        Uso:
+        >>> db.bulk_create('coords', records)
+        >>> # {'rows': 120000, 'seconds': 1.84, 'rows_per_second': 65217.4}
         """
 
         # Obtención de la instancia de la tabla
         table_instance = self._get_table_instance(table_name)
 
-        # Conversión de datos entrantes si es necesaria
-        if isinstance(data, dict):
-            data = [data,]
+        # Inicio de la medición
+        start = perf_counter()
+        rows = 0
 
-        # Filtro de datos
-        filtered_data = []
+        # Conexión con la base de datos
+        with self._measure('bulk_create', table_name, None) as measure:
+            with self._connect() as conn:
+
+                # Carga de cada bloque de registros
+                columns = []
+                for ( columns, records ) in self._iter_bulk_chunks(table_instance, data, chunk_size):
+                    if conn.dialect.name == 'postgresql':
+                        self._copy_records(conn, table_instance, columns, records)
+                    else:
+                        conn.execute(insert(table_instance), records)
+                    rows += len(records)
 
-        for record in data:
-            record = self._discard_unmutable_fields(record)
-            filtered_data.append(record)
+                # Commit de los cambios
+                self._commit(conn)
 
-        stmt = (
-            insert(table_instance)
-            .values(filtered_data)
-        )
+            measure['rows'] = rows
 
-        # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Ejecución en la base de datos
-            conn.execute(stmt)
-            # Commit de los cambios
-            conn.commit()
+        # Invalidación del caché de la tabla
+        self._invalidate(table_name)
 
-        return True
+        # Publicación del cambio sin IDs ni valores de los registros cargados
+        self._emit(table_name, 'create', None, [], columns)
+
+        # Retorno de las estadísticas de la carga
+        return self._bulk_load_stats(rows, perf_counter() - start)
+
+    def upsert(
+        self,
+        table_name: str,
+        records: list[dict] | dict,
+        conflict_fields: list[str],
+        update_fields: list[str] | None = None,
+    ) -> list[int]:
+        """
+        ## Creación o actualización de registros
+        Este método crea uno o muchos registros en una sola sentencia
+        `INSERT ... ON CONFLICT DO UPDATE`. Si ya existe un registro con los
+        mismos valores en los campos de conflicto, en lugar de crearse se
+        actualizan sus campos de actualización. Retorna las IDs de los registros
+        creados o actualizados en el mismo orden de los registros provistos.
+
+        ### Los parámetros de entrada son:
+        - `table_name`: Nombre de la tabla donde se crearán o actualizarán los registros.
+        - `records`: Diccionario (un único registro) o lista de diccionarios (muchos
+        registros). Todos los registros deben contener los mismos campos.
+        - `conflict_fields`: Campos que identifican a un registro existente. Deben
+        corresponder a una restricción única o a un índice único de la tabla.
+        - `update_fields`: Campos a actualizar en caso de conflicto. En caso de no ser
+        especificados se actualizan todos los campos provistos excepto los campos de
+        conflicto.
+
+        Uso:
+        >>> # Para un solo registro
+        >>> db.upsert('enemies', {'name': 'onnymm', 'level': 80}, ['name'], ['level'])
+        >>> # [12]
+        >>> 
+        >>> # Para muchos registros
+        >>> records = [
+        >>>     {'enemy_id': 12, 'planet': 0, 'starbase_level': 9},
+        >>>     {'enemy_id': 12, 'planet': 1, 'starbase_level': 7},
+        >>> ]
+        >>> db.upsert('coords', records, ['enemy_id', 'planet'])
+        >>> # [40, 41]
+
+        ----
+        ### Nota
+        Un mismo lote no puede contener dos registros con los mismos valores en los
+        campos de conflicto, pues la base de datos no permite actualizar dos veces el
+        mismo registro en una sola sentencia. Una lista vacía de registros retorna una
+        lista vacía sin consultar la base de datos.
+        """
+
+        # Sin registros no se ejecuta ninguna sentencia
+        if isinstance(records, list) and not records:
+            return []
+
+        # Creación del query de inserción o actualización
+        ( stmt, params ) = self._build_upsert_stmt(table_name, records, conflict_fields, update_fields)
+
+        # Ejecución en la base de datos
+        with self._measure('upsert', table_name, stmt) as measure:
+            rows = measure['rows'] = self._execute_returning(stmt, params)
+
+        # Publicación del cambio
+        self._emit(table_name, 'upsert', [ row.id for row in rows ], params)
+
+        # Retorno de las IDs de los registros
+        return [ row.id for row in rows ]
 
     def search(
         self,
@@ -528,43 +1215,15 @@ class DMLManager():
         >>> # [3, 4, 5]
         """
 
-        # Obtención de la instancia de la tabla
-        table_instance = self._get_table_instance(table_name)
-
-        # Creación del query base
-        stmt = select(table_instance.id)
-
-        # Si hay criterios de búsqueda se genera el 'where'
-        if len(search_criteria) > 0:
-
-            # Creación del query where
-            where_query = self._where._build_where(table_instance, search_criteria)
-
-            # Conversión del query SQL
-            stmt = stmt.where(where_query)
-
-        # Ordenamiento de los datos
-        stmt = stmt.order_by(asc(table_instance.id))
-
-        # Segmentación de inicio y fin en caso de haberlos
-        if offset != None:
-            stmt = stmt.offset(offset)
-        if limit != None:
-            stmt = stmt.limit(limit)
-
-        # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Obtención de los datos desde PostgreSQL
-            response = conn.execute(stmt)
+        # Creación del query de búsqueda
+        ( stmt, params ) = self._build_search_stmt(table_name, search_criteria, offset, limit)
 
-        # Inicialización del DataFrame de retorno
-        data = pd.DataFrame(response.fetchall())
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('search', table_name, stmt) as measure:
+            rows = measure['rows'] = self._cached(self._fetch, stmt, params)
 
         # Se extraen las IDs en caso de existir o una lista vacía
-        try:
-            return data['id'].to_list()
-        except KeyError:
-            return []
+        return [ row.id for row in rows ]
 
     def read(
         self,
@@ -610,41 +1269,15 @@ class DMLManager():
         >>> # 1   3   Lumii Mynx 2024-11-04 11:16:59
         """
 
-        # Obtención de la instancia de la tabla
-        table_instance = self._get_table_instance(table_name)
-
-        # Obtención de los campos de la tabla
-        table_fields = self._get_table_fields(table_instance, fields)
-
-        # Creación del query base
-        stmt = select(*table_fields)
-
-        # Creación del query where
-        where_query = self._where._build_where(table_instance, [('id', 'in', ids)])
-
-        # Conversión del query SQL
-        stmt = stmt.where(where_query)
-
-        # Creación de parámetros de ordenamiento
-        stmt = self._build_sort(
-            stmt,
-            table_instance,
-            sortby,
-            ascending
-        )
-
-        # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Obtención de los datos desde PostgreSQL
-            response = conn.execute(stmt)
-
-        # Inicialización del DataFrame de retorno
-        data = pd.DataFrame(response.fetchall())
+        # Creación del query de lectura
+        ( stmt, params ) = self._build_read_stmt(table_name, ids, fields, sortby, ascending)
 
-        if output_format == "dict":
-            return self._convert_to_dicts(data)
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('read', table_name, stmt) as measure:
+            rows = measure['rows'] = self._cached(self._fetch, stmt, params)
 
-        return data
+        # Retorno de los datos en el formato solicitado
+        return self._format_read(rows, output_format, table_name)
 
     def search_read(
         self,
@@ -791,81 +1424,226 @@ class DMLManager():
         >>> # 2   5  user001  Persona Sin Nombre 1
         """
 
-        # Obtención de la instancia de la tabla
-        table_instance = self._get_table_instance(table_name)
-
-        # Obtención de los campos de la tabla
-        table_fields = self._get_table_fields(table_instance, fields)
-
-        # Creación del query base
-        stmt = select(*table_fields)
-
-        # Si hay criterios de búsqueda se genera el 'where'
-        if len(search_criteria) > 0:
+        # Creación del query de búsqueda y lectura
+        ( stmt, params ) = self._build_search_read_stmt(
+            table_name,
+            search_criteria,
+            fields,
+            offset,
+            limit,
+            sortby,
+            ascending
+        )
 
-            # Creación del query where
-            where_query = self._where._build_where(table_instance, search_criteria)
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('search_read', table_name, stmt) as measure:
+            rows = measure['rows'] = self._cached(self._fetch, stmt, params)
 
-            # Conversión del query SQL
-            stmt = stmt.where(where_query)
+        # Retorno de los datos en el formato solicitado
+        return self._format_search_read(rows, table_name, output_format)
 
-        # Creación de parámetros de ordenamiento
-        stmt = self._build_sort(
-            stmt,
-            table_instance,
+    def iter_search_read(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        fields: list[str] = [],
+        offset: int | None = None,
+        limit: int | None = None,
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+        chunk_size: int = 1000,
+        output_format: _OutputFormat = "DataFrame"
+    ) -> Iterator[pd.DataFrame | list[dict[str, _CommonType]]]:
+        """
+        ## Búsqueda y lectura de registros por bloques
+        Este método funciona igual que `DMLManager.search_read` pero en lugar de
+        retornar todos los registros de una sola vez, retorna un iterador que
+        entrega los registros en bloques de `chunk_size` registros. Los
+        registros se leen de la base de datos con un cursor del lado del
+        servidor, por lo que la memoria usada depende del tamaño del bloque y no
+        del total de registros.
+
+        Cada bloque se entrega en el formato de salida solicitado.
+
+        ### Los parámetros de entrada son:
+        - `table_name`: Nombre de la tabla de donde se tomarán los registros.
+        - `search_criteria`: Criterio de búsqueda para retornar únicamente los resultados que
+        cumplan con las condiciones provistas.
+        - `fields`: Campos a mostrar. En caso de no ser especificado, se toman todos los
+        campos de la tabla de la base de datos.
+        - `offset`: Desfase de inicio de primer registro a mostrar.
+        - `limit`: Límite de registros retornados por la base de datos.
+        - `chunk_size`: Cantidad máxima de registros por bloque.
+
+        Uso:
+        >>> for chunk in db.iter_search_read('coords', [('war', '=', False)], chunk_size= 5000):
+        >>>     # Procesamiento de cada DataFrame de hasta 5000 registros
+        >>>     ...
+        >>> 
+        >>> for batch in db.iter_search_read('enemies', output_format= 'records'):
+        >>>     # [{'id': 1, 'name': 'onnymm', ...}, ...]
+        >>>     ...
+
+        La conexión con la base de datos se mantiene abierta mientras se recorre
+        el iterador y se devuelve al pool al terminar de recorrerlo o al cerrarlo.
+        """
+
+        # Creación del query de búsqueda y lectura
+        ( stmt, params ) = self._build_search_read_stmt(
+            table_name,
+            search_criteria,
+            fields,
+            offset,
+            limit,
             sortby,
             ascending
         )
 
-        # Segmentación de inicio y fin en caso de haberlos
-        if offset != None:
-            stmt = stmt.offset(offset)
-        if limit != None:
-            stmt = stmt.limit(limit)
-
         # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Obtención de los datos desde PostgreSQL
-            response = conn.execute(stmt)
+        with self._connect_read() as conn:
+            # Ejecución con cursor del lado del servidor
+            response = conn.execute(stmt.execution_options(yield_per= chunk_size), params)
 
-        data = self._load_data(response.fetchall(), table_instance)
+            # Retorno de cada bloque de filas en el formato solicitado
+            for rows in response.partitions():
+                yield self._format_search_read(rows, table_name, output_format)
 
-        if output_format == "dict":
-            return self._convert_to_dicts(data)
+    def search_read_page(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        fields: list[str] = [],
+        page: int = 0,
+        items_per_page: int = 40,
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+        cursor: list[_CommonType] | None = None,
+        output_format: _OutputFormat = "DataFrame"
+    ) -> _Page:
+        """
+        ## Búsqueda y lectura de registros por páginas
+        Este método retorna una página de registros junto con el total de
+        registros que cumplen con el criterio de búsqueda y el cursor para
+        solicitar la siguiente página.
+
+        Si se provee un `cursor` la página se obtiene por búsqueda de llave
+        (_keyset pagination_): en lugar de desfasar `page * items_per_page`
+        registros, la base de datos continúa directamente después del último
+        registro de la página anterior usando el índice de los campos de
+        ordenamiento, por lo que el costo de cada página no depende de su
+        posición. Sin `cursor` la página se obtiene por desfase de registros.
+
+        El ID se agrega siempre como último campo de ordenamiento para que el
+        orden sea estable, y los campos de ordenamiento se agregan a los campos
+        solicitados en caso de no estar incluidos.
 
-        return data
+        ### Los parámetros de entrada son:
+        - `table_name`: Nombre de la tabla de donde se tomarán los registros.
+        - `search_criteria`: Criterio de búsqueda para retornar únicamente los resultados que
+        cumplan con las condiciones provistas.
+        - `fields`: Campos a mostrar. En caso de no ser especificado, se toman todos los
+        campos de la tabla de la base de datos.
+        - `page`: Número de página, iniciando en 0. Se ignora si se provee un `cursor`.
+        - `items_per_page`: Cantidad de registros por página. Con 0 se retornan todos los
+        registros.
+        - `cursor`: Cursor retornado en la página anterior.
+
+        Uso:
+        >>> first_page = db.search_read_page('coords', [('war', '=', True)], sortby= 'starbase_level', ascending= False)
+        >>> # {'data': ..., 'count': 1250, 'cursor': [8, 1042]}
+        >>> 
+        >>> # Siguiente página por búsqueda de llave
+        >>> db.search_read_page('coords', [('war', '=', True)], sortby= 'starbase_level', ascending= False, cursor= first_page['cursor'])
+        >>> 
+        >>> # Página arbitraria por desfase de registros
+        >>> db.search_read_page('coords', [('war', '=', True)], page= 3)
+
+        Los valores nulos de los campos de ordenamiento se ordenan al final en
+        ambas direcciones y el cursor puede contenerlos. El cursor es `None`
+        sólo cuando ya no hay más registros. Los campos relacionales (como
+        `'enemy_id.name'`) no se pueden usar como campos de ordenamiento.
+        """
+
+        # Creación del query de la página
+        ( stmt, params, sort_fields, limit ) = self._build_page_stmt(
+            table_name,
+            search_criteria,
+            fields,
+            page,
+            items_per_page,
+            sortby,
+            ascending,
+            cursor,
+        )
 
-    def _load_data(self, data: list[dict], table_instance: DeclarativeBase) -> pd.DataFrame:
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('search_read_page', table_name, stmt) as measure:
+            rows = measure['rows'] = self._cached(self._fetch, stmt, params)
+
+        # Retorno de la página con el conteo total de registros
+        return {
+            'data': self._format_search_read(rows, table_name, output_format),
+            'count': self.search_count(table_name, search_criteria),
+            'cursor': self._next_cursor(rows, sort_fields, limit),
+        }
+
+    def _load_data(
+        self,
+        data: list[Row],
+        table_instance: DeclarativeBase,
+        typed_fields: set[str] | None = None,
+    ) -> pd.DataFrame:
         """
-        Preparación de los datos para su uso.
+        ## Preparación de los datos para su uso
+        Este método interno construye el DataFrame columna por columna a partir
+        de las filas obtenidas, usando el plan de tipos de dato precalculado de
+        la tabla. Las columnas con valores nulos se conservan como objetos de
+        Python con `None` para poder ser enviadas por JSON.
         """
 
-        # Inicialización del DataFrame
-        df = pd.DataFrame(data, dtype= None)
+        # Si no hay registros se retorna un DataFrame vacío
+        if len(data) == 0:
+            return pd.DataFrame()
+
+        # Obtención del plan de tipos de dato de la tabla
+        dtype_plan = self._dtype_plans[table_instance]
 
-        # Inicialización de diccionario para corrección de tipos de dato
-        proper_dtypes = {}
+        # Inicialización del diccionario de columnas
+        columns = {}
 
-        # Iteración por cada una de las columnas del DataFrame
-        for col in df.columns:
+        # Iteración por cada columna de las filas obtenidas
+        for ( col, values ) in zip(data[0]._fields, zip(*data)):
 
             # Obtención del tipo de dato de la columna
-            db_type = str(table_instance.__table__.columns[col].type)
+            if typed_fields is not None and col not in typed_fields:
+                dtype = None
+            else:
+                dtype = (
+                    self._get_relational_dtype(table_instance, col) if '.' in col
+                    else dtype_plan.get(col)
+                )
 
-            # Si el tipo de dato es entero...
-            if db_type == 'INTEGER':
-                proper_dtypes[col] = 'Int64'
+            # Los miembros de los enums se convierten a sus valores de texto
+            if isinstance(dtype, pd.CategoricalDtype):
+                values = [ value if value is None else str(value) for value in values ]
 
-            # Si el tipo de dato es texto...
-            if 'VARCHAR' in str(table_instance.__table__.columns[col].type):
-                proper_dtypes[col] = 'string'
+            # Si la columna contiene nulos se conservan los valores de Python
+            if None in values:
+                # Los valores de texto se convierten a cadena como lo haría pandas
+                if dtype == 'string':
+                    values = [ value if value is None else str(value) for value in values ]
+                columns[col] = pd.Series(values, dtype= object)
+
+            # Si la columna no tiene tipo de dato declarado se infiere por pandas
+            elif dtype is None:
+                columns[col] = values
 
-        # Si el diccionario contiene tipos por corregir se realiza la corrección
-        if len(proper_dtypes):
-            df = df.astype(proper_dtypes).replace({pd.NA: None})
+            # Creación de la columna con el tipo de dato del plan
+            else:
+                columns[col] = pd.array(values, dtype= dtype)
 
         # Retorno del DataFrame
-        return df
+        return pd.DataFrame(columns)
 
     def search_count(
         self,
@@ -953,30 +1731,84 @@ class DMLManager():
         >>> search_criteria: CriteriaStructure = ...
         """
 
-        # Obtención de la instancia de la tabla
-        table_instance = self._get_table_instance(table_name)
+        # Creación del query de conteo
+        ( stmt, params ) = self._build_search_count_stmt(table_name, search_criteria)
 
-        stmt = (
-            select( func.count() )
-            .select_from(table_instance)
-        )
+        # Obtención del conteo de registros
+        with self._measure('search_count', table_name, stmt):
+            count = self._cached(self._fetch_scalar, stmt, params)
 
-        # Si hay criterios de búsqueda se genera el 'where'
-        if len(search_criteria) > 0:
+        return count
+
+    def read_group(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        groupby: str | list[str] = [],
+        aggregates: list[str] = ['__count'],
+        mappings: dict[str, dict[_CommonType, _CommonType]] = {},
+        output_format: _OutputFormat = "DataFrame",
+    ) -> pd.DataFrame | list[dict[str, _CommonType]]:
+        """
+        ## Agrupación y agregación de registros
+        Este método retorna un registro por cada combinación de valores de los
+        campos de agrupación con el resultado de las funciones de agregación
+        provistas. La agrupación y las agregaciones se realizan en la base de
+        datos, por lo que sólo se transfieren los registros agrupados.
+
+        ### Los parámetros de entrada son:
+        - `table_name`: Nombre de la tabla de donde se tomarán los registros.
+        - `search_criteria`: Criterio de búsqueda para agrupar únicamente los registros que
+        cumplan con las condiciones provistas.
+        - `groupby`: Campo o campos por los cuales agrupar. Sin campos de agrupación se
+        retorna un solo registro con la agregación de todos los registros.
+        - `aggregates`: Agregaciones en formato `'campo:función'`, donde la función puede
+        ser `'sum'`, `'count'`, `'min'`, `'max'` o `'avg'`. El valor `'__count'` cuenta
+        los registros de cada grupo. Cada agregación se retorna en una columna con el
+        mismo nombre.
+        - `mappings`: Diccionario de campos con un diccionario de mapeo de valores que se
+        aplica con una expresión `CASE` antes de agrupar y agregar. Los valores no
+        incluidos en el mapeo se conservan.
+
+        Uso:
+        >>> # Ejemplo 1
+        >>> db.read_group('coords', [('war', '=', True)], 'enemy_id', ['__count', 'starbase_level:max'])
+        >>> #    enemy_id  __count  starbase_level:max
+        >>> # 0        12       12                   7
+        >>> # 1        13       12                   5
+        >>> 
+        >>> # Ejemplo 2
+        >>> db.read_group(
+        >>>     'coords',
+        >>>     [('planet', '=', 0)],
+        >>>     aggregates= ['starbase_level:sum'],
+        >>>     mappings= {'starbase_level': WARPOINTS_FROM_STARBASE_LEVEL},
+        >>>     output_format= 'records',
+        >>> )
+        >>> # [{'starbase_level:sum': 27300}]
+        """
 
-            # Creación del query where
-            where_query = self._where._build_where(table_instance, search_criteria)
+        # Creación del query de agrupación
+        ( stmt, params ) = self._build_read_group_stmt(
+            table_name,
+            search_criteria,
+            groupby,
+            aggregates,
+            mappings,
+        )
 
-            # Conversión del query SQL
-            stmt = stmt.where(where_query)
+        # Obtención de los datos desde PostgreSQL
+        with self._measure('read_group', table_name, stmt) as measure:
+            rows = measure['rows'] = self._cached(self._fetch, stmt, params)
 
-        # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Obtención de los datos desde PostgreSQL
-            response = conn.execute(stmt)
+        # Sólo los campos de agrupación sin mapeo conservan el tipo de dato de la tabla
+        typed_fields = {
+            field for field in ( [groupby,] if isinstance(groupby, str) else groupby )
+            if field not in mappings
+        }
 
-        # Retorno del conteo de registros
-        return response.scalar()
+        # Retorno de los datos en el formato solicitado
+        return self._format_search_read(rows, table_name, output_format, typed_fields)
 
     def update(
         self,
@@ -1014,72 +1846,1758 @@ class DMLManager():
         >>> # 4   7  user003  Cambiado
         """
 
+        # Creación del query de actualización
+        stmt = self._build_update_stmt(table_name, record_ids, data)
+
+        # Ejecución en la base de datos
+        with self._measure('update', table_name, stmt) as measure:
+            measure['rows'] = self._execute(stmt)
+
+        # Publicación del cambio
+        record_ids = [record_ids,] if isinstance(record_ids, int) else list(record_ids)
+        self._emit(table_name, 'update', record_ids, [ data ] * len(record_ids))
+
+        return True
+
+    def update_many(
+        self,
+        table_name: str,
+        records: list[dict[str, _CommonType]],
+    ) -> bool:
+        """
+        ## Actualización de registros con valores por registro
+        Este método realiza la actualización de muchos registros de una tabla
+        asignando a cada registro sus propios valores. Cada registro debe incluir
+        su ID en la llave `'id'`. Todas las actualizaciones se ejecutan en una
+        sola conexión y un solo commit, agrupando los registros que modifican los
+        mismos campos en una sola sentencia `UPDATE` ejecutada por lotes.
+
+        ### Los parámetros de entrada son:
+        - `table_name`: Nombre de la tabla en donde se harán los cambios
+        - `records`: Lista de diccionarios con la ID del registro y los valores a modificar
+
+        Uso:
+        >>> db.update_many(
+        >>>     'coords',
+        >>>     [
+        >>>         {'id': 3, 'starbase_level': 7},
+        >>>         {'id': 4, 'starbase_level': 9},
+        >>>         {'id': 5, 'starbase_level': 8, 'x': 120, 'y': 85},
+        >>>     ]
+        >>> )
+        >>> # True
+        """
+
+        # Creación de los queries de actualización
+        statements = self._build_update_many_stmts(table_name, records)
+
+        # Ejecución en la base de datos
+        with self._measure('update_many', table_name, statements[0][0] if statements else None) as measure:
+            measure['rows'] = self._execute_many(statements)
+
+        # Publicación del cambio
+        self._emit(
+            table_name,
+            'update',
+            [ record['id'] for record in records ],
+            [ self._discard_unmutable_fields(record) for record in records ],
+        )
+
+        return True
+
+    def update_where(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure,
+        data: dict[str, _CommonType],
+        returning: list[str] | None = None,
+    ) -> int | list[dict[str, _CommonType]]:
+        """
+        ## Actualización condicional de registros
+        Este método actualiza, en una sola sentencia `UPDATE ... WHERE ...
+        RETURNING`, todos los registros que cumplan con el criterio de búsqueda
+        en el momento de la escritura. La base de datos evalúa la condición y
+        escribe los valores de forma atómica, por lo que sirve para escrituras
+        condicionadas que no deben ejecutarse si otro proceso modificó el
+        registro antes, como reclamar un planeta.
+
+        Retorna la cantidad de registros que cumplieron la condición y fueron
+        actualizados. Si se especifican campos en `returning` se retornan en su
+        lugar los registros actualizados con la ID y dichos campos, ya con los
+        nuevos valores, o todos los campos si se provee una lista vacía.
+
+        ### Los parámetros de entrada son:
+        - `table_name`: Nombre de la tabla en donde se harán los cambios
+        - `search_criteria`: Criterio de búsqueda que deben cumplir los registros a actualizar
+        - `data`: Diccionario de valores a modificar
+        - `returning`: Campos de la tabla a retornar de los registros actualizados
+
+        Uso:
+        >>> # Sólo se reclama el planeta si nadie más lo reclamó
+        >>> db.update_where(
+        >>>     'coords',
+        >>>     ['&', ('id', '=', 40), ('attacked_by', '=', None)],
+        >>>     {'attacked_by': 2},
+        >>> )
+        >>> # 1
+        >>> 
+        >>> db.update_where('coords', [('enemy_id', '=', 12)], {'attacked_at': None}, returning= ['planet'])
+        >>> # [{'id': 40, 'planet': 0}, {'id': 41, 'planet': 1}, ...]
+        """
+
+        # Creación del query de actualización condicional
+        ( stmt, params ) = self._build_update_where_stmt(table_name, search_criteria, data, returning)
+
+        # Ejecución en la base de datos
+        with self._measure('update_where', table_name, stmt) as measure:
+            rows = measure['rows'] = self._execute_returning(stmt, params)
+
+        # Publicación del cambio
+        self._emit(table_name, 'update', [ row.id for row in rows ], [ data ] * len(rows))
+
+        # Retorno de la cantidad de registros actualizados o de los registros
+        return self._format_updated(rows, returning)
+
+    def delete(self, table_name: str, record_ids: int | list[int]) -> bool:
+        """
+        ## Eliminación de registros
+        Este método realiza la eliminación de uno o más registros de la base datos a partir de
+        su respectiva ID provista.
+
+        Uso:
+        >>> #    id     user                  name
+        >>> # 0   3   onnymm          Onnymm Azzur
+        >>> # 1   4    lumii            Lumii Mynx
+        >>> # 2   5  user001  Persona Sin Nombre 1
+        >>> # 3   6  user002  Persona Sin Nombre 2
+        >>> # 4   7  user003  Persona Sin Nombre 3
+        >>> 
+        >>> # Eliminación
+        >>> db.delete("users", 3)
+        >>> #    id     user                  name
+        >>> # 1   4    lumii            Lumii Mynx
+        >>> # 2   5  user001  Persona Sin Nombre 1
+        >>> # 3   6  user002  Persona Sin Nombre 2
+        >>> # 4   7  user003  Persona Sin Nombre 3
+        """
+
+        # Creación del query de eliminación
+        stmt = self._build_delete_stmt(table_name, record_ids)
+
+        # Ejecución en la base de datos
+        with self._measure('delete', table_name, stmt) as measure:
+            measure['rows'] = self._execute(stmt)
+
+        # Publicación del cambio
+        self._emit(table_name, 'delete', [record_ids,] if isinstance(record_ids, int) else list(record_ids), [])
+
+        return True
+
+    def _build_create_stmt(
+        self,
+        table_name: str,
+        data: list[dict] | dict,
+        fields: list[str] | None = None,
+    ) -> tuple[Insert, list[dict]]:
+        """
+        ## Construcción del query de creación
+        Este método interno construye la sentencia `INSERT ... RETURNING` usada
+        por `DMLManager.create` junto con los registros a insertar, descartando
+        los campos no manipulables de cada registro. Si no se especifican campos
+        sólo se retorna la ID.
+
+        Los registros se envían como parámetros de la sentencia para que
+        SQLAlchemy los inserte en lotes de múltiples filas y retorne las filas en
+        el orden de los registros provistos.
+        """
+
         # Obtención de la instancia de la tabla
         table_instance = self._get_table_instance(table_name)
 
         # Conversión de datos entrantes si es necesaria
-        if isinstance(record_ids, int):
-            record_ids = [record_ids,]
+        if isinstance(data, dict):
+            data = [data,]
 
-        stmt =  (
-            update(table_instance)
-            .where(table_instance.id.in_(record_ids))
-            .values(data)
+        # Filtro de datos
+        filtered_data = []
+
+        for record in data:
+            record = self._discard_unmutable_fields(record)
+            filtered_data.append(record)
+
+        # Obtención de los campos a retornar
+        returning_fields = (
+            [ table_instance.id ] if fields is None
+            else self._get_table_fields(table_instance, list(fields))
         )
 
-        # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Ejecución en la base de datos
-            conn.execute(stmt)
-            # Commit de los cambios
-            conn.commit()
+        stmt = (
+            insert(table_instance)
+            .returning(*returning_fields, sort_by_parameter_order= True)
+        )
+
+        return ( stmt, filtered_data )
+
+    def _format_created(
+        self,
+        rows: list[Row],
+        fields: list[str] | None = None,
+    ) -> list[int] | list[dict[str, _CommonType]]:
+        """
+        ## Formato de salida de creación
+        Este método interno convierte las filas retornadas por
+        `DMLManager.create` en la lista de IDs o en la lista de registros
+        creados.
+        """
+
+        # Si no se especificaron campos se retornan las IDs
+        if fields is None:
+            return [ row.id for row in rows ]
+
+        return self._row_formats['records'](rows)
+
+    def _iter_bulk_chunks(
+        self,
+        table_instance: DeclarativeBase,
+        data: Iterable[dict],
+        chunk_size: int,
+    ) -> Iterator[tuple[list[str], list[dict]]]:
+        """
+        ## Bloques de carga masiva
+        Este método interno recorre los registros a cargar por bloques y retorna
+        por cada uno las columnas y los registros normalizados: sin campos no
+        modificables, con todas las columnas del primer registro y con los
+        valores por defecto del modelo.
+        """
+
+        # Iterador de los registros
+        iterator = iter(data)
+        columns = None
+
+        while True:
+            # Obtención del siguiente bloque
+            chunk = list(islice(iterator, chunk_size))
+            if len(chunk) == 0:
+                return
+
+            # Las columnas se obtienen del primer registro
+            if columns is None:
+                data_columns = list( self._discard_unmutable_fields(chunk[0]).keys() )
+                default_columns = [
+                    column.key for column in table_instance.__table__.columns
+                    if column.default is not None and column.key not in data_columns and column.key != 'id'
+                ]
+                columns = data_columns + default_columns
+
+            # Cálculo de los valores por defecto del bloque
+            defaults = {
+                key: self._evaluate_default(table_instance.__table__.columns[key])
+                for key in default_columns
+            }
+
+            yield (
+                columns,
+                [
+                    { **{ key: record.get(key) for key in data_columns }, **defaults }
+                    for record in chunk
+                ],
+            )
+
+    def _evaluate_default(self, column) -> _CommonType:
+        """
+        Obtención del valor por defecto de una columna del modelo.
+        """
+
+        default = column.default
+        return default.arg(None) if default.is_callable else default.arg
+
+    def _copy_records(
+        self,
+        conn: Connection,
+        table_instance: DeclarativeBase,
+        columns: list[str],
+        records: list[dict],
+    ) -> None:
+        """
+        ## Carga de registros con COPY
+        Este método interno transmite un bloque de registros a PostgreSQL con
+        `COPY ... FROM STDIN` en formato CSV. Los valores nulos se escriben como
+        `\\N` sin comillas y los textos entre comillas, para que PostgreSQL
+        distinga un nulo de un texto vacío o de un texto `'\\N'`.
+        """
+
+        # Escritura de los registros en CSV
+        buffer = io.StringIO()
+        buffer.writelines(
+            ','.join( self._copy_value(record[key]) for key in columns ) + '\n'
+            for record in records
+        )
+        buffer.seek(0)
+
+        # Sentencia de carga con nombres de tabla y columnas escapados
+        preparer = conn.dialect.identifier_preparer
+        copy_sql = (
+            f"COPY {preparer.format_table(table_instance.__table__)} "
+            f"({', '.join( preparer.quote(key) for key in columns )}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+
+        # Transmisión de los registros por la conexión del driver
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(copy_sql, buffer)
+        finally:
+            cursor.close()
+
+    def _copy_value(self, value: _CommonType) -> str:
+        """
+        Conversión de un valor a su campo CSV para su carga con COPY. Los nulos
+        se escriben como `\\N` sin comillas, los números sin comillas y el resto
+        de valores entre comillas. Los enums se guardan por su nombre, igual que
+        en las sentencias de SQLAlchemy.
+        """
+
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return str(value).lower()
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        if isinstance(value, Enum):
+            value = value.name
+
+        # Texto entre comillas con las comillas internas duplicadas
+        return '"' + str(value).replace('"', '""') + '"'
+
+    def _bulk_load_stats(self, rows: int, seconds: float) -> _BulkLoadStats:
+        """
+        Estadísticas de una carga masiva.
+        """
+
+        return {
+            'rows': rows,
+            'seconds': seconds,
+            'rows_per_second': rows / seconds if seconds > 0 else 0.0,
+        }
+
+    def _build_upsert_stmt(
+        self,
+        table_name: str,
+        records: list[dict] | dict,
+        conflict_fields: list[str],
+        update_fields: list[str] | None = None,
+    ) -> tuple[Insert, list[dict]]:
+        """
+        ## Construcción del query de creación o actualización
+        Este método interno construye la sentencia `INSERT ... ON CONFLICT DO
+        UPDATE ... RETURNING id` usada por `DMLManager.upsert` con el dialecto
+        de la base de datos del motor de conexión, junto con los registros a
+        insertar.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Conversión de datos entrantes si es necesaria
+        if isinstance(records, dict):
+            records = [records,]
+
+        # Filtro de datos
+        filtered_data = [ self._discard_unmutable_fields(record) for record in records ]
+
+        # Si no se especificaron los campos a actualizar se toman todos excepto los de conflicto
+        if update_fields is None:
+            update_fields = [ field for field in filtered_data[0] if field not in conflict_fields ]
+
+        # Creación de la sentencia de inserción del dialecto de la base de datos
+        stmt = self._dialect_inserts[self._get_sync_engine().dialect.name](table_instance)
+
+        # Valores a asignar en caso de conflicto, incluyendo la fecha de modificación
+        set_values = { field: stmt.excluded[field] for field in update_fields }
+        set_values['write_date'] = stmt.excluded.write_date
+
+        stmt = (
+            stmt
+            .on_conflict_do_update(
+                index_elements= conflict_fields,
+                set_= set_values,
+            )
+            .returning(table_instance.id, sort_by_parameter_order= True)
+        )
+
+        return ( stmt, filtered_data )
+
+    def _build_search_stmt(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[Select, dict[str, _CommonType]]:
+        """
+        ## Construcción del query de búsqueda
+        Este método interno construye la sentencia `SELECT` de IDs usada por
+        `DMLManager.search` junto con los valores de sus parámetros. La
+        sentencia se obtiene del caché de sentencias según la forma del
+        criterio de búsqueda.
+        """
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(self._get_table_instance(table_name), search_criteria)
+
+        # Obtención de la sentencia
+        stmt = self._compile_search_stmt(table_name, shape, offset != None, limit != None)
+
+        # Retorno de la sentencia y sus parámetros
+        return ( stmt, {**params, **self._pagination_params(offset, limit)} )
+
+    def _build_read_stmt(
+        self,
+        table_name: str,
+        ids: list[int],
+        fields: list[str] = [],
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+    ) -> tuple[Select, dict[str, _CommonType]]:
+        """
+        ## Construcción del query de lectura
+        Este método interno construye la sentencia `SELECT` por IDs usada por
+        `DMLManager.read` junto con los valores de sus parámetros.
+        """
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(self._get_table_instance(table_name), [('id', 'in', ids)])
+
+        # Obtención de la sentencia
+        stmt = self._compile_select_stmt(
+            table_name,
+            tuple(fields),
+            shape,
+            self._hashable(sortby),
+            self._hashable(ascending),
+            False,
+            False,
+        )
+
+        # Retorno de la sentencia y sus parámetros
+        return ( stmt, params )
+
+    def _build_search_read_stmt(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+        fields: list[str] = [],
+        offset: int | None = None,
+        limit: int | None = None,
+        sortby: str | list[str] = None,
+        ascending: bool | list[bool] = True,
+    ) -> tuple[Select, dict[str, _CommonType]]:
+        """
+        ## Construcción del query de búsqueda y lectura
+        Este método interno construye la sentencia `SELECT` usada por
+        `DMLManager.search_read` junto con los valores de sus parámetros.
+        """
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(self._get_table_instance(table_name), search_criteria)
+
+        # Obtención de la sentencia
+        stmt = self._compile_select_stmt(
+            table_name,
+            tuple(fields),
+            shape,
+            self._hashable(sortby),
+            self._hashable(ascending),
+            offset != None,
+            limit != None,
+        )
+
+        # Retorno de la sentencia y sus parámetros
+        return ( stmt, {**params, **self._pagination_params(offset, limit)} )
+
+    def _build_page_stmt(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure,
+        fields: list[str],
+        page: int,
+        items_per_page: int,
+        sortby: str | list[str] | None,
+        ascending: bool | list[bool],
+        cursor: list[_CommonType] | None,
+    ) -> tuple[Select, dict[str, _CommonType], tuple[str, ...], int | None]:
+        """
+        ## Construcción del query de una página
+        Este método interno construye la sentencia `SELECT` usada por
+        `DMLManager.search_read_page` junto con los valores de sus parámetros,
+        los campos de ordenamiento usados para el cursor y el límite de
+        registros de la página.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Obtención de los campos de ordenamiento con el ID como desempate
+        ( sortby, ascending ) = self._keyset_sort(sortby, ascending)
+
+        # Los campos de ordenamiento se agregan a los campos solicitados para construir el cursor
+        if len(fields) > 0:
+            fields = [ *fields, *[ field for field in sortby if field not in fields ] ]
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(table_instance, search_criteria)
+
+        # Límite de registros de la página
+        limit = items_per_page if items_per_page > 0 else None
+
+        # Paginación por búsqueda de llave
+        if cursor is not None:
+            offset = None
+            params.update(self._keyset_params(table_instance, sortby, cursor))
+
+        # Paginación por desfase de registros
+        else:
+            offset = page * items_per_page if limit is not None and page > 0 else None
+
+        # Obtención de la sentencia
+        stmt = self._compile_select_stmt(
+            table_name,
+            tuple(fields),
+            shape,
+            sortby,
+            ascending,
+            offset != None,
+            limit != None,
+            cursor is not None,
+            nulls_last= True,
+        )
+
+        # Retorno de la sentencia, sus parámetros, los campos de ordenamiento y el límite
+        return ( stmt, {**params, **self._pagination_params(offset, limit)}, sortby, limit )
+
+    def _build_search_count_stmt(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure = [],
+    ) -> tuple[Select, dict[str, _CommonType]]:
+        """
+        ## Construcción del query de conteo
+        Este método interno construye la sentencia `SELECT COUNT(*)` usada por
+        `DMLManager.search_count` junto con los valores de sus parámetros.
+        """
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(self._get_table_instance(table_name), search_criteria)
+
+        # Retorno de la sentencia y sus parámetros
+        return ( self._compile_count_stmt(table_name, shape), params )
+
+    def _build_read_group_stmt(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure,
+        groupby: str | list[str],
+        aggregates: list[str],
+        mappings: dict[str, dict[_CommonType, _CommonType]],
+    ) -> tuple[Select, dict[str, _CommonType]]:
+        """
+        ## Construcción del query de agrupación
+        Este método interno construye la sentencia `SELECT ... GROUP BY` usada
+        por `DMLManager.read_group` junto con los valores de sus parámetros.
+        """
+
+        # Conversión de campo de agrupación individual a lista
+        if isinstance(groupby, str):
+            groupby = [groupby,]
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(self._get_table_instance(table_name), search_criteria)
+
+        # Obtención de la sentencia
+        stmt = self._compile_group_stmt(
+            table_name,
+            tuple(groupby),
+            tuple(aggregates),
+            tuple( ( field, tuple(mapping.items()) ) for ( field, mapping ) in mappings.items() ),
+            shape,
+        )
+
+        # Retorno de la sentencia y sus parámetros
+        return ( stmt, params )
+
+    @memoized(maxsize= 512)
+    def _compile_search_stmt(
+        self,
+        table_name: str,
+        shape: _CriteriaShape,
+        has_offset: bool,
+        has_limit: bool,
+    ) -> Select:
+        """
+        ## Compilación de la sentencia de búsqueda
+        Este método interno crea la sentencia `SELECT` de IDs a partir de la
+        forma del criterio de búsqueda. Las sentencias se guardan en caché por
+        forma para reutilizar la misma sentencia SQL compilada.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Creación del query base
+        stmt = select(table_instance.id)
+
+        # Si hay criterios de búsqueda se genera el 'where'
+        if len(shape) > 0:
+            stmt = stmt.where(self._where._build_where(table_instance, shape))
+
+        # Ordenamiento de los datos
+        stmt = stmt.order_by(asc(table_instance.id))
+
+        # Segmentación de inicio y fin en caso de haberlos
+        return self._build_pagination(stmt, has_offset, has_limit)
+
+    @memoized(maxsize= 512)
+    def _compile_select_stmt(
+        self,
+        table_name: str,
+        fields: tuple[str],
+        shape: _CriteriaShape,
+        sortby: str | tuple[str] | None,
+        ascending: bool | tuple[bool],
+        has_offset: bool,
+        has_limit: bool,
+        has_cursor: bool = False,
+        nulls_last: bool = False,
+    ) -> Select:
+        """
+        ## Compilación de la sentencia de lectura
+        Este método interno crea la sentencia `SELECT` de campos a partir de la
+        forma del criterio de búsqueda, los campos, el ordenamiento y la
+        segmentación. Las sentencias se guardan en caché por forma para
+        reutilizar la misma sentencia SQL compilada.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Obtención de los campos de la tabla
+        table_fields = self._get_table_fields(table_instance, list(fields))
+
+        # Creación del query base
+        stmt = select(*table_fields)
+
+        # Unión con las tablas de los campos relacionales
+        stmt = self._build_joins(stmt, table_instance, fields)
+
+        # Si hay criterios de búsqueda se genera el 'where'
+        if len(shape) > 0:
+            stmt = stmt.where(self._where._build_where(table_instance, shape))
+
+        # Si se pagina por búsqueda de llave se continúa después del cursor
+        if has_cursor:
+            stmt = stmt.where(self._build_keyset(table_instance, sortby, ascending))
+
+        # Creación de parámetros de ordenamiento
+        stmt = self._build_sort(
+            stmt,
+            table_instance,
+            sortby,
+            ascending,
+            nulls_last,
+        )
+
+        # Segmentación de inicio y fin en caso de haberlos
+        return self._build_pagination(stmt, has_offset, has_limit)
+
+    @memoized(maxsize= 512)
+    def _compile_count_stmt(self, table_name: str, shape: _CriteriaShape) -> Select:
+        """
+        ## Compilación de la sentencia de conteo
+        Este método interno crea la sentencia `SELECT COUNT(*)` a partir de la
+        forma del criterio de búsqueda.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        stmt = (
+            select( func.count() )
+            .select_from(table_instance)
+        )
+
+        # Si hay criterios de búsqueda se genera el 'where'
+        if len(shape) > 0:
+            stmt = stmt.where(self._where._build_where(table_instance, shape))
+
+        return stmt
+
+    @memoized(maxsize= 128)
+    def _compile_group_stmt(
+        self,
+        table_name: str,
+        groupby: tuple[str],
+        aggregates: tuple[str],
+        mappings: tuple[tuple[str, tuple[tuple[_CommonType, _CommonType], ...]], ...],
+        shape: _CriteriaShape,
+    ) -> Select:
+        """
+        ## Compilación de la sentencia de agrupación
+        Este método interno crea la sentencia `SELECT ... GROUP BY` a partir de
+        los campos de agrupación, las agregaciones, los mapeos de valores y la
+        forma del criterio de búsqueda.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Conversión de los mapeos a diccionario
+        mappings = { field: dict(mapping) for ( field, mapping ) in mappings }
+
+        # Obtención de las expresiones de los campos de agrupación
+        group_columns = [
+            self._build_mapped_column(table_instance, field, mappings).label(field)
+            for field in groupby
+        ]
+
+        # Obtención de las expresiones de agregación
+        aggregate_columns = []
+        for aggregate in aggregates:
+
+            # Conteo de registros por grupo
+            if aggregate == '__count':
+                aggregate_columns.append( func.count().label(aggregate) )
+                continue
+
+            # Destructuración del campo y la función de agregación
+            ( field, _, function ) = aggregate.partition(':')
+            if function not in self._aggregate_functions:
+                raise ValueError(f"La agregación '{aggregate}' no es válida. Se espera 'campo:función' con función {list(self._aggregate_functions)}.")
+
+            aggregate_columns.append(
+                self._aggregate_functions[function](
+                    self._build_mapped_column(table_instance, field, mappings)
+                )
+                .label(aggregate)
+            )
+
+        # Creación del query base
+        stmt = (
+            select(*group_columns, *aggregate_columns)
+            .select_from(table_instance)
+        )
+
+        # Si hay criterios de búsqueda se genera el 'where'
+        if len(shape) > 0:
+            stmt = stmt.where(self._where._build_where(table_instance, shape))
+
+        # Agrupación y ordenamiento por los campos de agrupación
+        if len(group_columns) > 0:
+            stmt = (
+                stmt
+                .group_by(*group_columns)
+                .order_by(*group_columns)
+            )
+
+        return stmt
+
+    def _build_mapped_column(
+        self,
+        table_instance: DeclarativeBase,
+        field: str,
+        mappings: dict[str, dict[_CommonType, _CommonType]],
+    ) -> InstrumentedAttribute:
+        """
+        ## Columna con mapeo de valores
+        Este método interno retorna la columna de un campo o, si el campo tiene
+        un mapeo de valores, una expresión `CASE` que traduce cada valor y
+        conserva los valores no incluidos en el mapeo.
+
+        Uso:
+        >>> self._build_mapped_column(Coordinates, 'starbase_level', {'starbase_level': {1: 100, 2: 200}})
+        >>> # CASE coords.starbase_level WHEN 1 THEN 100 WHEN 2 THEN 200 ELSE coords.starbase_level END
+        """
+
+        # Validación del campo
+        if field not in table_instance.__mapper__.columns:
+            raise ValueError(f"El campo '{field}' no existe en la tabla '{table_instance.__tablename__}'.")
+
+        column = getattr(table_instance, field)
+
+        # Si el campo no tiene mapeo se retorna la columna
+        if field not in mappings:
+            return column
+
+        return case(mappings[field], value= column, else_= column)
+
+    def _build_pagination(self, stmt: Select, has_offset: bool, has_limit: bool) -> Select:
+        """
+        ## Construcción de la segmentación
+        Este método interno agrega a la sentencia los parámetros enlazados de
+        desfase y límite de registros en caso de requerirse.
+        """
+
+        if has_offset:
+            stmt = stmt.offset(bindparam('_offset', type_= Integer))
+        if has_limit:
+            stmt = stmt.limit(bindparam('_limit', type_= Integer))
+
+        return stmt
+
+    def _pagination_params(self, offset: int | None, limit: int | None) -> dict[str, int]:
+        """
+        ## Parámetros de segmentación
+        Este método interno retorna los valores de los parámetros de desfase y
+        límite de registros declarados.
+        """
+
+        params = {}
+        if offset != None:
+            params['_offset'] = offset
+        if limit != None:
+            params['_limit'] = limit
+
+        return params
+
+    def _hashable(self, value: _CommonType | list) -> _CommonType | tuple:
+        """
+        Conversión de listas a tuplas para usarse como llave del caché de sentencias.
+        """
+
+        return tuple(value) if isinstance(value, list) else value
+
+    def _keyset_sort(
+        self,
+        sortby: str | list[str] | None,
+        ascending: bool | list[bool],
+    ) -> tuple[tuple[str, ...], tuple[bool, ...]]:
+        """
+        ## Ordenamiento para búsqueda de llave
+        Este método interno normaliza los campos y direcciones de ordenamiento
+        a tuplas y agrega el ID como último campo para que el orden de los
+        registros sea total.
+        """
+
+        # Conversión de los campos de ordenamiento a tupla
+        if sortby is None:
+            sortby = ()
+        elif isinstance(sortby, str):
+            sortby = ( sortby, )
+        else:
+            sortby = tuple(sortby)
+
+        # Conversión de las direcciones de ordenamiento a tupla
+        if isinstance(ascending, bool):
+            ascending = ( ascending, ) * len(sortby)
+        else:
+            ascending = tuple(ascending)
+
+        # Se agrega el ID como desempate en la dirección del último campo
+        if 'id' not in sortby:
+            ascending = ( *ascending, ascending[-1] if len(ascending) > 0 else True )
+            sortby = ( *sortby, 'id' )
+
+        return ( sortby, ascending )
+
+    def _build_keyset(
+        self,
+        table_instance: DeclarativeBase,
+        sortby: tuple[str, ...],
+        ascending: tuple[bool, ...],
+    ) -> BinaryExpression:
+        """
+        ## Construcción de la condición de búsqueda de llave
+        Este método interno construye la condición que selecciona los
+        registros posteriores al cursor en el orden provisto. Si todos los
+        campos se ordenan en la misma dirección y ninguno admite nulos se usa
+        una comparación de tuplas, que la base de datos resuelve con un índice
+        compuesto; en otro caso se expande a una disyunción de comparaciones.
+
+        Los nulos de las columnas que los admiten se ordenan al final (ver
+        `_build_sort`). Para estas columnas se agrega el parámetro
+        `_cursor_{i}_null`, que indica si el valor del cursor es nulo, de modo
+        que la misma sentencia sirve para cursores con y sin valores nulos.
+
+        Uso:
+        >>> self._build_keyset(table_instance, ('starbase_level', 'id'), (False, False))
+        >>> # (coords.starbase_level, coords.id) < (:_cursor_0, :_cursor_1)
+        >>> 
+        >>> self._build_keyset(table_instance, ('starbase_level', 'id'), (False, True))
+        >>> # coords.starbase_level < :_cursor_0 OR coords.starbase_level = :_cursor_0 AND coords.id > :_cursor_1
+        >>> 
+        >>> self._build_keyset(table_instance, ('x', 'id'), (True, True))
+        >>> # coords.x > :_cursor_0 OR coords.x IS NULL AND NOT :_cursor_0_null
+        >>> # OR (coords.x = :_cursor_0 OR coords.x IS NULL AND :_cursor_0_null) AND coords.id > :_cursor_1
+        """
+
+        # Obtención de las columnas y sus parámetros enlazados
+        columns = [ self._get_sort_column(table_instance, field) for field in sortby ]
+        values = [
+            bindparam(f'_cursor_{i}', type_= column.type)
+            for ( i, column ) in enumerate(columns)
+        ]
+
+        # Indicadores de cursor nulo de las columnas que admiten nulos
+        nulls = [
+            bindparam(f'_cursor_{i}_null', type_= Boolean()) if self._is_nullable(table_instance, field) else None
+            for ( i, field ) in enumerate(sortby)
+        ]
+
+        # Comparación de tuplas si todas las columnas se ordenan en la misma dirección y no admiten nulos
+        if len(set(ascending)) == 1 and not any( null is not None for null in nulls ):
+            if ascending[0]:
+                return tuple_(*columns) > tuple_(*values)
+            return tuple_(*columns) < tuple_(*values)
+
+        def equal(i: int):
+            # Igualdad con el valor del cursor, incluyendo el caso de ambos nulos
+            if nulls[i] is None:
+                return columns[i] == values[i]
+            return or_(columns[i] == values[i], and_(columns[i].is_(None), nulls[i]))
+
+        def after(i: int):
+            # Valores posteriores al del cursor; los nulos van después de cualquier valor
+            comparison = columns[i] > values[i] if ascending[i] else columns[i] < values[i]
+            if nulls[i] is None:
+                return comparison
+            return or_(comparison, and_(columns[i].is_(None), not_(nulls[i])))
+
+        # Disyunción de comparaciones con igualdad en las columnas previas
+        return or_(
+            *[
+                and_(
+                    *[ equal(j) for j in range(i) ],
+                    after(i),
+                )
+                for i in range(len(columns))
+            ]
+        )
+
+    def _keyset_params(
+        self,
+        table_instance: DeclarativeBase,
+        sortby: tuple[str, ...],
+        cursor: list[_CommonType],
+    ) -> dict[str, _CommonType]:
+        """
+        ## Parámetros de búsqueda de llave
+        Este método interno retorna los valores de los parámetros del cursor y
+        los indicadores de valor nulo de las columnas que admiten nulos. Las
+        fechas recibidas como texto (por ejemplo, desde JSON) se convierten a
+        `datetime`.
+        """
+
+        # Validación del cursor
+        if len(cursor) != len(sortby):
+            raise ValueError(f"El cursor debe contener {len(sortby)} valores, uno por cada campo de ordenamiento {sortby}.")
+
+        params = {}
+        for ( i, ( field, value ) ) in enumerate(zip(sortby, cursor)):
+            column = self._get_sort_column(table_instance, field)
+            nullable = self._is_nullable(table_instance, field)
+
+            # Validación de nulos en columnas que no los admiten
+            if value is None and not nullable:
+                raise ValueError(f"El cursor no puede contener un valor nulo para el campo '{field}'.")
+
+            # Conversión de fechas en texto
+            if isinstance(value, str) and isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            params[f'_cursor_{i}'] = value
+
+            # Indicador de valor nulo
+            if nullable:
+                params[f'_cursor_{i}_null'] = value is None
+
+        return params
+
+    def _next_cursor(self, rows: list[Row], sortby: tuple[str, ...], limit: int | None) -> list[_CommonType] | None:
+        """
+        ## Cursor de la siguiente página
+        Este método interno retorna los valores de los campos de ordenamiento
+        del último registro de una página completa, incluyendo los nulos, o
+        `None` si ya no hay más registros.
+        """
+
+        # Si la página no está completa no hay más registros
+        if limit is None or len(rows) < limit:
+            return None
+
+        # Obtención de los valores del último registro
+        last_row = rows[-1]._mapping
+
+        return [ last_row[field] for field in sortby ]
+
+    def _build_update_stmt(
+        self,
+        table_name: str,
+        record_ids: int | list[int],
+        data: dict[str, _CommonType],
+    ) -> Update:
+        """
+        ## Construcción del query de actualización
+        Este método interno construye la sentencia `UPDATE` usada por
+        `DMLManager.update`.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Conversión de datos entrantes si es necesaria
+        if isinstance(record_ids, int):
+            record_ids = [record_ids,]
+
+        return (
+            update(table_instance)
+            .where(table_instance.id.in_(record_ids))
+            .values(data)
+        )
+
+    def _build_update_where_stmt(
+        self,
+        table_name: str,
+        search_criteria: CriteriaStructure,
+        data: dict[str, _CommonType],
+        returning: list[str] | None = None,
+    ) -> tuple[Update, dict[str, _CommonType]]:
+        """
+        ## Construcción del query de actualización condicional
+        Este método interno construye la sentencia `UPDATE ... WHERE ...
+        RETURNING` usada por `DMLManager.update_where` junto con los valores de
+        los parámetros del criterio de búsqueda. Si no se especifican campos
+        sólo se retorna la ID.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Los campos de otras tablas no pueden retornarse en una actualización
+        if returning is not None and any( '.' in field for field in returning ):
+            raise ValueError(f"Sólo se pueden retornar campos de la tabla '{table_name}' en una actualización: {returning}")
+
+        # Obtención de la forma del criterio de búsqueda y de sus parámetros
+        ( shape, params ) = self._where._parse(table_instance, search_criteria)
+
+        # Obtención de los campos a retornar
+        returning_fields = (
+            [ table_instance.id ] if returning is None
+            else self._get_table_fields(table_instance, list(returning))
+        )
+
+        # Creación de la sentencia
+        stmt = update(table_instance).values(data).returning(*returning_fields)
+
+        # Si hay criterios de búsqueda se genera el 'where'
+        if len(shape) > 0:
+            stmt = stmt.where(self._where._build_where(table_instance, shape))
+
+        return ( stmt, params )
+
+    def _format_updated(
+        self,
+        rows: list[Row],
+        returning: list[str] | None = None,
+    ) -> int | list[dict[str, _CommonType]]:
+        """
+        ## Formato de salida de actualización condicional
+        Este método interno convierte las filas retornadas por
+        `DMLManager.update_where` en la cantidad de registros actualizados o en
+        la lista de registros actualizados.
+        """
+
+        # Si no se especificaron campos se retorna la cantidad de registros
+        if returning is None:
+            return len(rows)
+
+        return self._row_formats['records'](rows)
+
+    def _build_update_many_stmts(
+        self,
+        table_name: str,
+        records: list[dict[str, _CommonType]],
+    ) -> list[tuple[Update, list[dict[str, _CommonType]]]]:
+        """
+        ## Construcción de los queries de actualización por registro
+        Este método interno agrupa los registros provistos a
+        `DMLManager.update_many` por los campos que modifican y construye, por
+        cada grupo, una sentencia `UPDATE ... WHERE id = :_id` junto con la lista
+        de parámetros de cada registro para ser ejecutada por lotes.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Agrupación de los parámetros por campos a modificar
+        groups: dict[frozenset[str], list[dict[str, _CommonType]]] = {}
+
+        for record in records:
+            # Separación de la ID y los valores a modificar
+            values = self._discard_unmutable_fields(record)
+            groups.setdefault(frozenset(values), []).append({'_id': record['id'], **values})
+
+        # Creación de la sentencia de cada grupo. Los campos a modificar se toman de los parámetros
+        stmt = (
+            update(table_instance)
+            .where(table_instance.id == bindparam('_id'))
+        )
+
+        return [ ( stmt, params ) for params in groups.values() ]
+
+    def _build_delete_stmt(self, table_name: str, record_ids: int | list[int]) -> Delete:
+        """
+        ## Construcción del query de eliminación
+        Este método interno construye la sentencia `DELETE` usada por
+        `DMLManager.delete`.
+        """
+
+        # Obtención de la instancia de la tabla
+        table_instance = self._get_table_instance(table_name)
+
+        # Conversión de datos entrantes si es necesaria
+        if isinstance(record_ids, int):
+            record_ids = [record_ids,]
+
+        return (
+            delete(table_instance)
+            .where(table_instance.id.in_(record_ids))
+        )
+
+    def _fetch(self, stmt: Select, params: dict[str, _CommonType] = {}) -> list[Row]:
+        """
+        ## Obtención de filas
+        Este método interno ejecuta una sentencia de lectura con los valores de
+        sus parámetros y retorna todas las filas obtenidas desde la base de
+        datos.
+        """
+
+        # Conexión con la base de datos
+        with self._connect_read() as conn:
+            # Obtención de los datos desde PostgreSQL
+            return conn.execute(stmt, params).fetchall()
+
+    def _fetch_scalar(self, stmt: Select, params: dict[str, _CommonType] = {}) -> _CommonType:
+        """
+        ## Obtención de un valor escalar
+        Este método interno ejecuta una sentencia de lectura con los valores de
+        sus parámetros y retorna el primer valor de la primera fila obtenida.
+        """
+
+        # Conexión con la base de datos
+        with self._connect_read() as conn:
+            # Obtención del valor desde PostgreSQL
+            return conn.execute(stmt, params).scalar()
+
+    def _execute(self, stmt: Insert | Update | Delete) -> int:
+        """
+        ## Ejecución de sentencias de escritura
+        Este método interno ejecuta una sentencia de escritura, realiza el
+        commit de los cambios y retorna la cantidad de registros afectados.
+        """
+
+        # Conexión con la base de datos
+        with self._connect() as conn:
+            # Ejecución en la base de datos
+            rowcount = conn.execute(stmt).rowcount
+            # Commit de los cambios
+            self._commit(conn)
+
+        # Invalidación del caché de la tabla
+        self._invalidate(stmt.table.name)
+
+        return rowcount
+
+    def _execute_many(self, statements: list[tuple[Update, list[dict[str, _CommonType]]]]) -> int:
+        """
+        ## Ejecución por lotes de sentencias de escritura
+        Este método interno ejecuta varias sentencias de escritura, cada una con
+        su lista de parámetros, en una sola conexión y un solo commit, y retorna
+        la cantidad de registros afectados.
+        """
+
+        # Inicialización del conteo de registros afectados
+        rowcount = 0
+
+        # Conexión con la base de datos
+        with self._connect() as conn:
+            # Ejecución de cada sentencia por lotes
+            for ( stmt, params ) in statements:
+                rowcount += conn.execute(stmt, params).rowcount
+            # Commit de los cambios
+            self._commit(conn)
+
+        # Invalidación del caché de las tablas
+        for ( stmt, _ ) in statements:
+            self._invalidate(stmt.table.name)
+
+        return rowcount
+
+    def _execute_returning(
+        self,
+        stmt: Insert | Update | Delete,
+        params: list[dict] | dict[str, _CommonType] | None = None,
+    ) -> list[Row]:
+        """
+        ## Ejecución de sentencias de escritura con retorno
+        Este método interno ejecuta una sentencia de escritura con cláusula
+        `RETURNING` y los valores de sus parámetros, realiza el commit de los
+        cambios y retorna las filas obtenidas.
+        """
+
+        # Conexión con la base de datos
+        with self._connect() as conn:
+            # Ejecución en la base de datos
+            rows = conn.execute(stmt, params).fetchall()
+            # Commit de los cambios
+            self._commit(conn)
+
+        # Invalidación del caché de la tabla
+        self._invalidate(stmt.table.name)
+
+        return rows
+
+    @contextmanager
+    def _measure(self, operation: str, table_name: str, stmt: Select | Insert | Update | Delete | None) -> Iterator[dict]:
+        """
+        ## Medición de una consulta
+        Este método interno mide el tiempo de ejecución del bloque que envuelve
+        y lo registra junto con la operación, la tabla, la huella de la
+        sentencia y la cantidad de registros. El bloque debe asignar en la llave
+        `'rows'` del diccionario provisto los registros obtenidos o la cantidad
+        de registros afectados.
+
+        Uso:
+        >>> with self._measure('search', table_name, stmt) as measure:
+        >>>     rows = measure['rows'] = self._fetch(stmt, params)
+        """
+
+        # Inicialización de la medición
+        measure = {'rows': 1}
+        token = self._current_measure.set(measure)
+        start = perf_counter()
+
+        try:
+            yield measure
+        finally:
+            duration = perf_counter() - start
+            self._current_measure.reset(token)
+
+            # Obtención de la cantidad de registros
+            rows = measure['rows']
+            if not isinstance(rows, int):
+                rows = len(rows)
+
+            # Huella de la sentencia ejecutada o, si se leyó del caché, de la sentencia provista
+            fingerprint = (
+                QueryMetrics.fingerprint(measure['sql']) if 'sql' in measure
+                else self._fingerprint(stmt)
+            )
+
+            # Registro de la ejecución
+            self._metrics.record(
+                operation,
+                table_name,
+                *fingerprint,
+                duration,
+                rows,
+            )
+
+    def _on_cursor_execute(self, conn, cursor, statement: str, parameters, context, executemany: bool) -> None:
+        """
+        Registro en la medición en curso de la primera sentencia SQL enviada a
+        la base de datos, ya compilada por SQLAlchemy, para obtener su huella
+        sin volver a compilarla. Se usa la sentencia compilada antes de expandir
+        los parámetros de listas `IN`, para que las consultas de la misma forma
+        compartan huella sin importar la cantidad de valores.
+        """
+
+        measure = self._current_measure.get()
+        if measure is not None and 'sql' not in measure:
+            compiled = getattr(context, 'compiled', None)
+            measure['sql'] = compiled.string if compiled is not None else statement
+
+    @memoized(maxsize= 512)
+    def _fingerprint(self, stmt: Select | Insert | Update | Delete | None) -> tuple[str, str]:
+        """
+        ## Huella de una sentencia
+        Este método interno compila la sentencia con el dialecto de la base de
+        datos y retorna su huella y la sentencia SQL normalizada. Los valores
+        de los criterios de búsqueda son parámetros enlazados, por lo que las
+        consultas de la misma forma comparten huella.
+
+        Sólo se usa cuando la medición no llegó a ejecutar una sentencia, como
+        en las lecturas servidas desde el caché, cuyas sentencias provienen de
+        los cachés de compilación y conservan su identidad.
+        """
+
+        # Si no hubo sentencia no se genera huella
+        if stmt is None:
+            return ( '', '' )
+
+        return QueryMetrics.fingerprint(str(stmt.compile(dialect= self._get_sync_engine().dialect)))
+
+    def _cached(
+        self,
+        fetch: Callable[[Select, dict[str, _CommonType]], _CommonType],
+        stmt: Select,
+        params: dict[str, _CommonType],
+    ) -> _CommonType:
+        """
+        ## Lectura a través del caché
+        Este método interno retorna el resultado de una sentencia de lectura
+        desde el caché o, en caso de no encontrarse, la ejecuta con la función
+        de lectura provista y almacena su resultado. Dentro de una transacción
+        se lee siempre de la base de datos.
+        """
+
+        # Obtención de la llave de la consulta
+        key = self._cache_key(stmt, params)
+
+        # Si no hay caché aplicable se lee directamente de la base de datos
+        if key is None:
+            return fetch(stmt, params)
+
+        # Búsqueda del resultado en el caché
+        ( found, value ) = self._cache.get(key)
+        if found:
+            return value
+
+        # Obtención de las tablas de la consulta y su generación previa a la lectura
+        tables = self._stmt_tables(stmt)
+        generation = self._cache.generation(tables)
+
+        # Lectura desde la base de datos y almacenamiento en el caché
+        value = fetch(stmt, params)
+        self._cache.set(tables, key, value, generation)
+
+        return value
+
+    def _cache_key(self, stmt: Select, params: dict[str, _CommonType]) -> tuple | None:
+        """
+        ## Llave de caché de una consulta
+        Este método interno retorna la llave de caché de una sentencia y sus
+        parámetros, o `None` si el caché no está activado, hay una transacción
+        activa, las lecturas se forzaron a la base de datos principal, la
+        lectura se realiza en una réplica o los parámetros no pueden usarse
+        como llave.
+
+        Las lecturas de las réplicas no se guardan en el caché porque una
+        réplica retrasada puede retornar los registros previos a una escritura
+        que ya invalidó el caché, y éstos se servirían hasta la siguiente
+        escritura.
+
+        Las sentencias se reutilizan por forma del criterio de búsqueda, campos,
+        ordenamiento y segmentación, por lo que la sentencia junto con sus
+        parámetros identifica a la consulta.
+        """
+
+        # Si no hay caché, hay una transacción activa, se leen los cambios recién escritos o se
+        #       lee de una réplica no se usa el caché
+        if (
+            self._cache is None
+            or self._transaction_connection.get() is not None
+            or self._read_primary.get()
+            or self._reads_from_replica()
+        ):
+            return None
+
+        # Conversión de los parámetros a una estructura inmutable
+        key = (
+            stmt,
+            tuple(
+                sorted(
+                    ( name, tuple(value) if isinstance(value, list) else value )
+                    for ( name, value ) in params.items()
+                )
+            ),
+        )
+
+        # Validación de que la llave pueda usarse en el caché
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def _stmt_tables(self, stmt: Select) -> tuple[str, ...]:
+        """
+        Obtención de los nombres de las tablas leídas por una sentencia.
+        """
+
+        # Se recorre la sentencia completa para incluir las tablas de las subconsultas
+        return tuple(
+            sorted(
+                {
+                    table.name
+                    for table in find_tables(stmt, include_aliases= True, include_joins= True)
+                    if hasattr(table, 'name') and table.name in self._tables
+                }
+            )
+        )
+
+    def _invalidate(self, table_name: str) -> None:
+        """
+        ## Invalidación del caché de una tabla
+        Este método interno descarta los resultados almacenados de una tabla
+        modificada. Dentro de una transacción la tabla se vuelve a invalidar al
+        terminar ésta, para descartar lecturas hechas antes del commit.
+        """
+
+        # Si el caché no está activado no se realiza nada
+        if self._cache is None:
+            return
+
+        # Invalidación de la tabla
+        self._cache.invalidate(table_name)
+
+        # Registro de la tabla modificada en la transacción activa
+        tables = self._transaction_tables.get()
+        if tables is not None:
+            tables.add(table_name)
+
+    def _emit(
+        self,
+        table_name: str,
+        operation: str,
+        record_ids: list[int] | None,
+        values: list[dict[str, _CommonType]],
+        fields: list[str] | None = None,
+    ) -> None:
+        """
+        ## Publicación de un cambio
+        Este método interno crea el evento de cambio de una escritura y lo
+        publica a los suscriptores. Dentro de una transacción el evento se
+        guarda para publicarse al confirmarse ésta. Si no hay suscriptores no se
+        crea el evento.
+        """
+
+        # Si no hay suscriptores no se realiza nada
+        if not self._changes.has_subscribers():
+            return
+
+        # Creación del evento
+        event: ChangeEvent = {
+            'table': table_name,
+            'operation': operation,
+            'ids': record_ids,
+            'fields': fields if fields is not None else sorted({ key for record in values for key in record }),
+            'values': values,
+        }
+
+        # Registro del evento en la transacción activa
+        changes = self._transaction_changes.get()
+        if changes is not None:
+            changes.append(event)
+            return
+
+        # Publicación inmediata del evento
+        self._changes.publish([event])
+
+    def _commit(self, conn: Connection) -> None:
+        """
+        ## Commit de los cambios
+        Este método interno realiza el commit de los cambios de una conexión,
+        excepto dentro de `DMLManager.transaction`, donde el commit se realiza al
+        terminar la transacción.
+        """
+
+        if self._transaction_connection.get() is None:
+            conn.commit()
+
+    @contextmanager
+    def _connect(self) -> Iterator[Connection]:
+        """
+        ## Obtención de una conexión del pool
+        Este método interno obtiene una conexión del pool registrando el tiempo
+        de espera y los tiempos de espera agotados en las estadísticas del pool.
+        Dentro de `DMLManager.transaction` se retorna la conexión de la
+        transacción activa.
+        """
+
+        # Si hay una transacción activa se usa su conexión
+        if self._transaction_connection.get() is not None:
+            yield self._transaction_connection.get()
+            return
+
+        # Inicio de la medición del tiempo de espera
+        start = perf_counter()
+
+        try:
+            conn = self._engine.connect()
+        # Registro de tiempo de espera agotado
+        except PoolTimeoutError:
+            self._pool_stats.record_timeout()
+            raise
+
+        # Registro del tiempo de espera por la conexión
+        self._pool_stats.record_wait(perf_counter() - start)
+
+        with conn:
+            yield conn
+
+    @contextmanager
+    def _connect_read(self) -> Iterator[Connection]:
+        """
+        ## Obtención de una conexión de lectura
+        Este método interno obtiene una conexión de la siguiente réplica de
+        lectura. Si no hay réplicas declaradas, hay una transacción activa o
+        las lecturas se forzaron a la base de datos principal con
+        `DMLManager.use_primary`, se retorna una conexión de la base de datos
+        principal.
+        """
+
+        # Lectura desde la base de datos principal
+        if not self._reads_from_replica():
+            with self._connect() as conn:
+                yield conn
+            return
+
+        # Conexión con la siguiente réplica
+        with next(self._replica_cycle).connect() as conn:
+            yield conn
+
+    def _reads_from_replica(self) -> bool:
+        """
+        Validación de si las lecturas del contexto actual se realizan en una réplica.
+        """
+
+        return (
+            self._replica_cycle is not None
+            and self._transaction_connection.get() is None
+            and not self._read_primary.get()
+        )
+
+    def _get_sync_engine(self):
+        """
+        ## Obtención del motor síncrono
+        Este método interno retorna el motor síncrono de SQLAlchemy sobre el
+        cual se registran los eventos del pool de conexiones.
+        """
+
+        return self._engine
+
+    def _build_dtype_plan(self, table_instance: DeclarativeBase) -> dict[str, str | pd.CategoricalDtype]:
+        """
+        ## Creación del plan de tipos de dato de una tabla
+        Este método interno obtiene el tipo de dato de pandas correspondiente a
+        cada columna de la tabla. Se ejecuta una sola vez por tabla al
+        inicializar la instancia para no evaluar los tipos de las columnas en
+        cada consulta.
+
+        Las columnas pueden declarar su tipo de dato en el modelo con
+        `info= {'dtype': ...}`, por ejemplo `'Int8'` para enteros pequeños. Los
+        enums se cargan como categorías con sus valores en orden de declaración.
+
+        Las operaciones de pandas conservan el tipo de dato reducido y se
+        desbordan sin aviso (un `'Int16'` con valor 90 multiplicado por 1000
+        resulta en 24464), por lo que sólo debe declararse en columnas que no se
+        usen en operaciones aritméticas, como identificadores o etiquetas.
+        """
+
+        # Inicialización del plan de tipos de dato
+        dtype_plan = {}
+
+        # Iteración por cada una de las columnas de la tabla
+        for column in table_instance.__table__.columns:
+
+            # Si el modelo declara el tipo de dato de la columna se usa éste
+            if 'dtype' in column.info:
+                dtype_plan[column.name] = column.info['dtype']
+                continue
+
+            # Si la columna es un enum se usan sus valores como categorías
+            if isinstance(column.type, SQLEnum) and column.type.enum_class is not None:
+                dtype_plan[column.name] = pd.CategoricalDtype(
+                    [ member.value for member in column.type.enum_class ]
+                )
+                continue
+
+            # Obtención del tipo de dato de la columna
+            db_type = str(column.type)
+
+            # Si el tipo de dato es entero...
+            if db_type == 'INTEGER':
+                dtype_plan[column.name] = 'Int64'
+
+            # Si el tipo de dato es texto...
+            if 'VARCHAR' in db_type:
+                dtype_plan[column.name] = 'string'
+
+        # Retorno del plan de tipos de dato
+        return dtype_plan
+
+    def _build_array_plan(self, table_instance: DeclarativeBase) -> dict[str, tuple[str, dict | None]]:
+        """
+        ## Creación del plan de arreglos de una tabla
+        Este método interno obtiene el tipo de arreglo de NumPy de cada columna
+        de la tabla y, para los enums, el código entero de cada uno de sus
+        miembros. Se ejecuta una sola vez por tabla al inicializar la instancia.
+        """
+
+        # Inicialización del plan de arreglos
+        array_plan = {}
+
+        # Iteración por cada una de las columnas de la tabla
+        for column in table_instance.__table__.columns:
+
+            # Los enums se codifican por su orden de declaración
+            if isinstance(column.type, SQLEnum) and column.type.enum_class is not None:
+                array_plan[column.name] = (
+                    'enum',
+                    { member: code for ( code, member ) in enumerate(column.type.enum_class) },
+                )
+            elif isinstance(column.type, Boolean):
+                array_plan[column.name] = ( 'bool', None )
+            elif isinstance(column.type, Integer):
+                array_plan[column.name] = ( 'int', None )
+            elif isinstance(column.type, (Float, Numeric)):
+                array_plan[column.name] = ( 'float', None )
+            elif isinstance(column.type, DateTime):
+                array_plan[column.name] = ( 'datetime', None )
+            elif isinstance(column.type, String):
+                array_plan[column.name] = ( 'string', None )
+
+        # Retorno del plan de arreglos
+        return array_plan
+
+    def _load_arrays(
+        self,
+        data: list[Row],
+        table_instance: DeclarativeBase,
+        typed_fields: set[str] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        ## Conversión de filas a arreglos de NumPy
+        Este método interno construye un arreglo de NumPy por columna a partir de
+        las filas obtenidas, usando el plan de arreglos precalculado de la tabla.
+        Las columnas sin tipo declarado, como los agregados de `read_group`, se
+        infieren por NumPy.
+        """
+
+        # Si no hay registros se retorna un diccionario vacío
+        if len(data) == 0:
+            return {}
+
+        # Inicialización del diccionario de arreglos
+        arrays = {}
+
+        # Iteración por cada columna de las filas obtenidas
+        for ( col, values ) in zip(data[0]._fields, zip(*data)):
+
+            # Obtención del tipo de arreglo de la columna
+            if typed_fields is not None and col not in typed_fields:
+                ( kind, codes ) = ( None, None )
+            else:
+                ( kind, codes ) = (
+                    self._get_relational_plan(self._array_plans, table_instance, col) if '.' in col
+                    else self._array_plans[table_instance].get(col)
+                ) or ( None, None )
+
+            arrays[col] = self._build_array(values, kind, codes)
+
+        # Retorno de los arreglos
+        return arrays
+
+    def _build_array(self, values: tuple, kind: str | None, codes: dict | None) -> np.ndarray:
+        """
+        ## Creación del arreglo de una columna
+        Este método interno convierte los valores de una columna al arreglo de
+        NumPy de su tipo. Los enteros y booleanos con nulos se retornan como
+        arreglos enmascarados para conservar su tipo de dato.
+        """
+
+        # Cantidad de valores
+        count = len(values)
+
+        # Códigos enteros de los enums, con -1 para los nulos
+        if kind == 'enum':
+            dtype = np.int8 if len(codes) < 128 else np.int16
+            return np.fromiter(( -1 if value is None else codes[value] for value in values ), dtype= dtype, count= count)
+
+        # Enteros y booleanos
+        if kind in ('int', 'bool'):
+            dtype = np.int64 if kind == 'int' else np.bool_
+            # Si no hay nulos se crea el arreglo directamente
+            if None not in values:
+                return np.fromiter(values, dtype= dtype, count= count)
+            return np.ma.masked_array(
+                np.fromiter(( 0 if value is None else value for value in values ), dtype= dtype, count= count),
+                mask= np.fromiter(( value is None for value in values ), dtype= np.bool_, count= count),
+            )
+
+        # Decimales con NaN para los nulos
+        if kind == 'float':
+            return np.fromiter(( np.nan if value is None else value for value in values ), dtype= np.float64, count= count)
+
+        # Fechas con NaT para los nulos
+        if kind == 'datetime':
+            return np.array(values, dtype= 'datetime64[us]')
+
+        # Textos sin objetos de Python, con nulos nativos
+        if kind == 'string':
+            return np.array(values, dtype= np.dtypes.StringDType(na_object= None))
+
+        # Inferencia del tipo de dato por NumPy
+        return np.array(values)
+
+    def _format_read(
+        self,
+        rows: list[Row],
+        output_format: _OutputFormat = "DataFrame",
+        table_name: str | None = None,
+    ) -> pd.DataFrame | list[dict[str, _CommonType]]:
+        """
+        ## Formato de salida de lectura
+        Este método interno convierte las filas obtenidas por `DMLManager.read`
+        al formato de salida solicitado.
+        """
+
+        # Conversión directa de las filas sin pasar por pandas
+        if output_format in self._row_formats:
+            return self._row_formats[output_format](rows)
+
+        # Conversión a arreglos de NumPy con los tipos de dato de la tabla
+        if output_format == "numpy":
+            return self._load_arrays(rows, self._get_table_instance(table_name))
+
+        # Preparación de los datos con los tipos de dato de la tabla
+        data = self._load_data(rows, self._get_table_instance(table_name))
+
+        if output_format == "dict":
+            return self._convert_to_dicts(data)
 
-        return True
+        return data
 
-    def delete(self, table_name: str, record_ids: int | list[int]) -> bool:
+    def _format_search_read(
+        self,
+        rows: list[Row],
+        table_name: str,
+        output_format: _OutputFormat = "DataFrame",
+        typed_fields: set[str] | None = None,
+    ) -> pd.DataFrame | list[dict[str, _CommonType]]:
         """
-        ## Eliminación de registros
-        Este método realiza la eliminación de uno o más registros de la base datos a partir de
-        su respectiva ID provista.
-
-        Uso:
-        >>> #    id     user                  name
-        >>> # 0   3   onnymm          Onnymm Azzur
-        >>> # 1   4    lumii            Lumii Mynx
-        >>> # 2   5  user001  Persona Sin Nombre 1
-        >>> # 3   6  user002  Persona Sin Nombre 2
-        >>> # 4   7  user003  Persona Sin Nombre 3
-        >>> 
-        >>> # Eliminación
-        >>> db.delete("users", 3)
-        >>> #    id     user                  name
-        >>> # 1   4    lumii            Lumii Mynx
-        >>> # 2   5  user001  Persona Sin Nombre 1
-        >>> # 3   6  user002  Persona Sin Nombre 2
-        >>> # 4   7  user003  Persona Sin Nombre 3
+        ## Formato de salida de búsqueda y lectura
+        Este método interno convierte las filas obtenidas por
+        `DMLManager.search_read` al formato de salida solicitado. Si se proveen
+        `typed_fields`, sólo esas columnas toman el tipo de dato de la tabla y
+        el resto se infiere, como en las expresiones calculadas de
+        `DMLManager.read_group`.
         """
 
-        # Obtención de la instancia de la tabla
-        table_instance = self._get_table_instance(table_name)
-
-        # Conversión de datos entrantes si es necesaria
-        if isinstance(record_ids, int):
-            record_ids = [record_ids,]
+        # Conversión directa de las filas sin pasar por pandas
+        if output_format in self._row_formats:
+            return self._row_formats[output_format](rows)
 
+        # Conversión a arreglos de NumPy con los tipos de dato de la tabla
+        if output_format == "numpy":
+            return self._load_arrays(rows, self._get_table_instance(table_name), typed_fields)
 
-        stmt =  (
-            delete(table_instance)
-            .where(table_instance.id.in_(record_ids))
-        )
+        # Preparación de los datos con los tipos de dato de la tabla
+        data = self._load_data(rows, self._get_table_instance(table_name), typed_fields)
 
-        # Conexión con la base de datos
-        with self._engine.connect() as conn:
-            # Ejecución en la base de datos
-            conn.execute(stmt)
-            # Commit de los cambios
-            conn.commit()
+        if output_format == "dict":
+            return self._convert_to_dicts(data)
 
-        return True
+        return data
 
     def _build_sort(
         self,
@@ -1087,11 +3605,15 @@ class DMLManager():
         table_instance: DeclarativeBase,
         sortby: str | list[str],
         ascending: str | list[bool] = True,
+        nulls_last: bool = False,
     ) -> BinaryExpression:
         """
         ## Construcción de parámetros de ordenamiento
         Este método interno construye los parámetros de ordenamiento por una o
-        más columnas de una tabla de manera ascendente o descendente.
+        más columnas de una tabla de manera ascendente o descendente. Con
+        `nulls_last` los nulos de las columnas que los admiten se ordenan al
+        final en ambas direcciones, igual en PostgreSQL y en SQLite, como lo
+        requiere la búsqueda de llave de `_build_keyset`.
 
         Uso:
         >>> # Ejemplo 1
@@ -1114,24 +3636,18 @@ class DMLManager():
             if isinstance(sortby, str):
                 # Creación del query
                 stmt = stmt.order_by(
-                    # Obtención de función de ordenamiento
-                    self._sorting_direction[ascending](
-                        # Obtención del campo atributo de la tabla
-                        getattr(table_instance, sortby)
-                    )
+                    # Obtención de la expresión de ordenamiento
+                    self._sort_term(table_instance, sortby, ascending, nulls_last)
                 )
 
             # Ordenamiento por varias columnas
-            elif isinstance(sortby, list):
+            elif isinstance(sortby, (list, tuple)):
                 # Creación del query
                 stmt = stmt.order_by(
                     # Destructuración en [*args] de una compreensión de lista
                     *[
-                        # Obtención de función de ordenamiento
-                        self._sorting_direction[ascending_i](
-                            # Obtención del campo atributo de la tabla
-                            getattr(table_instance, sortby_i)
-                        )
+                        # Obtención de la expresión de ordenamiento
+                        self._sort_term(table_instance, sortby_i, ascending_i, nulls_last)
                         # Destructuración de la columna y dirección de ordenamiento del zip de listas
                         for ( sortby_i, ascending_i ) in zip(
                             sortby, ascending
@@ -1142,6 +3658,44 @@ class DMLManager():
         # Retorno de la expresión binaria
         return stmt
 
+    def _sort_term(
+        self,
+        table_instance: DeclarativeBase,
+        field: str,
+        ascending: bool,
+        nulls_last: bool,
+    ) -> UnaryExpression:
+        """
+        Expresión de ordenamiento de una columna en la dirección provista.
+        """
+
+        # Obtención de la función de ordenamiento aplicada al campo de la tabla
+        term = self._sorting_direction[ascending](self._get_sort_column(table_instance, field))
+
+        # Los nulos se ordenan al final sólo en las columnas que los admiten
+        if nulls_last and self._is_nullable(table_instance, field):
+            term = term.nulls_last()
+
+        return term
+
+    def _get_sort_column(self, table_instance: DeclarativeBase, field: str) -> InstrumentedAttribute:
+        """
+        Obtención de la columna de un campo de ordenamiento. Los campos
+        relacionales no se admiten.
+        """
+
+        if '.' in field:
+            raise ValueError(f"No se puede ordenar por el campo relacional '{field}'.")
+
+        return getattr(table_instance, field)
+
+    def _is_nullable(self, table_instance: DeclarativeBase, field: str) -> bool:
+        """
+        Validación de si la columna de un campo de ordenamiento admite nulos.
+        """
+
+        return table_instance.__table__.columns[field].nullable
+
     def _get_table_fields(
             self, table_instance: DeclarativeBase,
             fields: list[str] = []
@@ -1167,8 +3721,12 @@ class DMLManager():
             instance_fields = list( table_instance.__annotations__.keys() )
             # Obtención de los campos comunes desde la clase heredada (_Base)
             base_fields = list( table_instance.__base__.__annotations__.keys() )
-            # Suma de ambas listas para mantener la prioridad a los campos de la tabla
-            fields = instance_fields + base_fields
+            # Suma de ambas listas para mantener la prioridad a los campos de la tabla, descartando
+            #       las relaciones que no son columnas de la tabla
+            fields = [
+                field for field in instance_fields + base_fields
+                if field in table_instance.__mapper__.columns
+            ]
 
         # Remoción del campo de 'ID' en caso de ser solicitado, para evitar campos duplicados en
         #       el retorno de la información.
@@ -1182,7 +3740,166 @@ class DMLManager():
 
         # Obtención de los atributos de la tabla a partir de los nombres de los campos,
         #       y retorno en una lista para ser usados en el query correspondiente
-        return [ getattr(table_instance, field) for field in table_fields ]
+        return [
+            self._get_relational_field(table_instance, field) if '.' in field
+            else getattr(table_instance, field)
+            for field in table_fields
+        ]
+
+    def _get_relational_field(self, table_instance: DeclarativeBase, field: str) -> InstrumentedAttribute:
+        """
+        ## Obtención de un campo relacional
+        Este método interno obtiene la columna de una tabla relacionada a partir
+        de un campo con notación de punto, donde cada segmento previo al último
+        es el campo de llave foránea (o el nombre de la relación) y el último es
+        el campo de la tabla relacionada. La columna se etiqueta con el nombre
+        completo del campo.
+
+        Uso:
+        >>> self._get_relational_field(Coordinates, 'attacked_by.user')
+        >>> # attacker.user AS "attacked_by.user"
+        """
+
+        # Separación de la ruta de relaciones y el campo de la tabla relacionada
+        ( *path, target_field ) = field.split('.')
+
+        # Obtención del alias de la tabla relacionada
+        ( alias, _ ) = self._get_relation_alias(table_instance, self._get_relation_path(table_instance, tuple(path)))
+
+        # Validación del campo de la tabla relacionada
+        if target_field not in inspect(alias).mapper.columns:
+            raise ValueError(f"El campo '{target_field}' no existe en la tabla relacionada por '{'.'.join(path)}'.")
+
+        return getattr(alias, target_field).label(field)
+
+    @memoized(maxsize= 128)
+    def _get_relation_path(self, table_instance: DeclarativeBase, path: tuple[str, ...]) -> tuple[str, ...]:
+        """
+        ## Ruta de relaciones
+        Este método interno convierte una ruta de campos de llave foránea o
+        nombres de relación a la ruta equivalente de nombres de relación, para
+        que `enemy_id.name` y `enemy.name` usen la misma unión.
+        """
+
+        # Inicialización del modelo actual y de la ruta de relaciones
+        mapper = inspect(table_instance)
+        relation_path = []
+
+        # Recorrido de la ruta por cada relación
+        for name in path:
+            relationship = self._find_relationship(mapper, name)
+            relation_path.append(relationship.key)
+            mapper = relationship.mapper
+
+        return tuple(relation_path)
+
+    @memoized(maxsize= 128)
+    def _get_relation_alias(self, table_instance: DeclarativeBase, path: tuple[str, ...]) -> tuple[DeclarativeBase, BinaryExpression]:
+        """
+        ## Alias de una tabla relacionada
+        Este método interno obtiene, a partir de una ruta de nombres de
+        relación, el alias de la tabla relacionada y la condición de unión con
+        la tabla anterior de la ruta. Cada ruta tiene su
+        propio alias para poder unir la misma tabla más de una vez (por ejemplo,
+        el usuario creador y el usuario atacante de una coordenada). Los alias
+        se guardan en caché para que los campos y las uniones de una misma
+        sentencia usen el mismo alias.
+        """
+
+        # Obtención de la tabla anterior en la ruta
+        parent = (
+            table_instance if len(path) == 1
+            else self._get_relation_alias(table_instance, path[:-1])[0]
+        )
+
+        # Obtención de la relación declarada en el modelo
+        relationship = self._find_relationship(inspect(parent).mapper, path[-1])
+
+        # Creación del alias de la tabla relacionada
+        alias = aliased(relationship.mapper.class_, name= '_'.join(path))
+
+        # Condición de unión a partir de las columnas locales y remotas de la relación
+        on_clause = and_(
+            *[
+                getattr(alias, remote.key) == getattr(parent, local.key)
+                for ( local, remote ) in relationship.local_remote_pairs
+            ]
+        )
+
+        return ( alias, on_clause )
+
+    def _get_relational_dtype(self, table_instance: DeclarativeBase, field: str) -> str | None:
+        """
+        Obtención del tipo de dato de un campo relacional desde el plan de tipos
+        de dato de la tabla relacionada.
+        """
+
+        return self._get_relational_plan(self._dtype_plans, table_instance, field)
+
+    def _get_relational_plan(self, plans: dict[DeclarativeBase, dict], table_instance: DeclarativeBase, field: str):
+        """
+        Obtención del plan de un campo relacional desde los planes provistos de
+        la tabla relacionada.
+        """
+
+        # Separación de la ruta de relaciones y el campo de la tabla relacionada
+        ( *path, target_field ) = field.split('.')
+
+        # Obtención del modelo de la tabla relacionada
+        ( alias, _ ) = self._get_relation_alias(table_instance, self._get_relation_path(table_instance, tuple(path)))
+        related_instance = inspect(alias).mapper.class_
+
+        return plans.get(related_instance, {}).get(target_field)
+
+    def _find_relationship(self, mapper, name: str) -> RelationshipProperty:
+        """
+        ## Búsqueda de una relación
+        Este método interno busca la relación de muchos a uno de un modelo a
+        partir de su nombre o del nombre de su campo de llave foránea.
+        """
+
+        for relationship in mapper.relationships:
+            # Sólo se consideran las relaciones de muchos a uno para no multiplicar los registros
+            if relationship.direction is not MANYTOONE:
+                continue
+            if relationship.key == name or any( column.key == name for column in relationship.local_columns ):
+                return relationship
+
+        raise ValueError(f"No existe una relación de muchos a uno por el campo '{name}' en la tabla '{mapper.local_table.name}'.")
+
+    def _build_joins(self, stmt: Select, table_instance: DeclarativeBase, fields: tuple[str]) -> Select:
+        """
+        ## Construcción de las uniones de campos relacionales
+        Este método interno agrega a la sentencia un `LEFT OUTER JOIN` por cada
+        tabla relacionada usada en los campos con notación de punto, en el
+        orden de la ruta de relaciones.
+
+        Uso:
+        >>> stmt = select(...)
+        >>> stmt = self._build_joins(stmt, Coordinates, ('x', 'enemy_id.name', 'attacked_by.user'))
+        >>> # SELECT ... FROM coords
+        >>> #   LEFT OUTER JOIN enemies AS enemy ON enemy.id = coords.enemy_id
+        >>> #   LEFT OUTER JOIN users AS attacker ON attacker.id = coords.attacked_by
+        """
+
+        # Obtención de las rutas de relaciones sin repetir, incluyendo las intermedias
+        paths = {}
+        for field in fields:
+            path = self._get_relation_path(table_instance, tuple(field.split('.')[:-1]))
+            for i in range(1, len(path) + 1):
+                paths[path[:i]] = None
+
+        # Si no hay campos relacionales la sentencia no se modifica
+        if len(paths) == 0:
+            return stmt
+
+        # Unión con cada tabla relacionada
+        stmt = stmt.select_from(table_instance)
+        for path in paths:
+            ( alias, on_clause ) = self._get_relation_alias(table_instance, path)
+            stmt = stmt.outerjoin(alias, on_clause)
+
+        return stmt
 
     def _get_table_instance(self, table_name: str) -> DeclarativeBase:
         """
@@ -1257,7 +3974,68 @@ class DMLManager():
         tables = self._get_table_instances(connection_params)
         engine = self._create_engine(connection_params)
 
-        return ( tables, engine )
+        # Creación de las tablas en la base de datos embebida de SQLite
+        if self._is_sqlite(connection_params):
+            self._create_sqlite_schema(engine, tables, connection_params)
+
+        # Verificación y creación de índices al iniciar
+        if connection_params.get('ensure_indexes') and isinstance(engine, Engine):
+            with engine.begin() as conn:
+                IndexManager(tables).sync(conn)
+
+        # Creación de los motores de conexión de las réplicas de lectura
+        replicas = [
+            self._create_engine({ **connection_params, **replica_params })
+            for replica_params in connection_params.get('replicas', [])
+        ]
+
+        cache = self._get_query_cache(file_name, database_connection, connection_params)
+        metrics = QueryMetrics(self._get_slow_query_threshold(connection_params))
+
+        return ( tables, engine, replicas, cache, metrics )
+
+    def _get_slow_query_threshold(self, connection_params: _ConnectionParams) -> float | None:
+        """
+        ## Obtención del umbral de consulta lenta
+        Este método interno convierte a segundos el umbral de consulta lenta
+        declarado en milisegundos en `slow_query_ms`, o retorna `None` si no fue
+        declarado.
+        """
+
+        if 'slow_query_ms' not in connection_params:
+            return None
+
+        return connection_params['slow_query_ms'] / 1000
+
+    def _get_query_cache(
+        self,
+        file_name: str,
+        database_connection: str,
+        connection_params: _ConnectionParams,
+    ) -> QueryCache | None:
+        """
+        ## Obtención del caché de lecturas
+        Este método interno obtiene el caché de lecturas compartido por las
+        instancias con el mismo archivo de configuración y tipo de base de
+        datos, creándolo en caso de no existir. Si no se declaró `cache_size` en
+        los parámetros de conexión el caché no se activa.
+        """
+
+        # Si no se declaró el tamaño del caché éste no se activa
+        if 'cache_size' not in connection_params:
+            return None
+
+        # Llave del caché compartido
+        key = ( file_name, database_connection )
+
+        # Creación del caché en caso de no existir
+        if key not in self._query_caches:
+            self._query_caches[key] = QueryCache(
+                connection_params['cache_size'],
+                connection_params.get('cache_ttl'),
+            )
+
+        return self._query_caches[key]
 
     def _get_root_path(self, sublevels: int):
         """
@@ -1329,6 +4107,124 @@ class DMLManager():
         Para más información consultar la documentación del módulo.
         """
 
+        # Creación de la URL de la conexión a la base de datos
+        url = self._build_url(connection_params)
+
+        # Creación del motor de conexión con la base de datos
+        engine = create_engine(
+            url,
+            connect_args= self._build_connect_args(connection_params),
+            **self._build_pool_options(connection_params)
+        )
+
+        # Configuración de las conexiones de SQLite
+        if self._is_sqlite(connection_params):
+            self._configure_sqlite(engine, connection_params)
+
+        # Retorno del motor de conexión
+        return engine
+
+    def _is_sqlite(self, connection_params: _ConnectionParams) -> bool:
+        """
+        Validación de si los parámetros de conexión declaran una base de datos de SQLite.
+        """
+
+        return 'sqlite' in connection_params
+
+    def _configure_sqlite(self, engine: Engine, connection_params: _ConnectionParams) -> None:
+        """
+        ## Configuración de las conexiones de SQLite
+        Este método interno activa en cada nueva conexión de SQLite la
+        validación de llaves foráneas, que SQLite no aplica por defecto, y el
+        modo WAL en bases de datos de archivo para permitir lecturas
+        concurrentes con una escritura, de forma similar a PostgreSQL. También
+        registra la función `REGEXP` sin distinción de mayúsculas, ya que SQLite
+        ignora las banderas del operador `'~*'`.
+        """
+
+        # Validación de si la base de datos es un archivo
+        is_file = connection_params['sqlite'] != ':memory:'
+
+        def regexp(pattern: str, value: str | None) -> bool | None:
+            return None if value is None else re.search(pattern, value, re.IGNORECASE) is not None
+
+        def on_connect(dbapi_connection, connection_record) -> None:
+            dbapi_connection.create_function("regexp", 2, regexp, deterministic= True)
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys = ON")
+            if is_file:
+                cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.close()
+
+        # Registro del evento en el motor síncrono
+        event.listen(getattr(engine, 'sync_engine', engine), 'connect', on_connect)
+
+    def _create_sqlite_schema(
+        self,
+        engine: Engine,
+        tables: dict[str, DeclarativeBase],
+        connection_params: _ConnectionParams,
+    ) -> None:
+        """
+        ## Creación de las tablas en SQLite
+        Este método interno crea en la base de datos de SQLite las tablas de
+        los modelos declarados que aún no existan, para usar una base de datos
+        nueva (por ejemplo, en memoria) sin migraciones previas.
+        """
+
+        # Creación de las tablas de los metadatos de los modelos
+        for metadata in { table_instance.metadata for table_instance in tables.values() }:
+            metadata.create_all(engine)
+
+    def _build_pool_options(self, connection_params: _ConnectionParams) -> dict[str, int | bool]:
+        """
+        ## Obtención de los parámetros del pool de conexiones
+        Este método interno obtiene los parámetros del pool de conexiones
+        declarados en el archivo de configuración. Los parámetros no declarados
+        se omiten para usar los valores por defecto de SQLAlchemy.
+        """
+
+        # La base de datos en memoria de SQLite existe sólo dentro de su conexión, por lo
+        #       que todas las llamadas deben compartir una misma conexión
+        if connection_params.get('sqlite') == ':memory:':
+            return {'poolclass': StaticPool}
+
+        return {
+            option: connection_params[option]
+            for option in self._pool_options
+            if option in connection_params
+        }
+
+    def _build_connect_args(self, connection_params: _ConnectionParams) -> dict:
+        """
+        ## Obtención de los argumentos de conexión
+        Este método interno crea los argumentos de conexión del driver de
+        PostgreSQL, como el tiempo máximo de ejecución por sentencia declarado
+        en `statement_timeout` (en milisegundos).
+        """
+
+        # Las conexiones de SQLite se pueden usar desde los hilos de las rutas síncronas
+        if self._is_sqlite(connection_params):
+            return {'check_same_thread': False}
+
+        # Si no se declaró tiempo máximo de ejecución no se requieren argumentos
+        if 'statement_timeout' not in connection_params:
+            return {}
+
+        return {'options': f"-c statement_timeout={connection_params['statement_timeout']}"}
+
+    def _build_url(self, connection_params: _ConnectionParams) -> str:
+        """
+        ## Creación de la URL de conexión
+        Este método interno crea la URL de conexión a la base de datos usando
+        el driver declarado en el atributo `_driver` de la clase, o el driver
+        declarado en `_sqlite_driver` si se declaró una base de datos de SQLite.
+        """
+
+        # Retorno de la URL del archivo de SQLite o de la base de datos en memoria
+        if self._is_sqlite(connection_params):
+            return f"{self._sqlite_driver}:///{connection_params['sqlite']}"
+
         # Obtención de los parámetros a utilizar
         host = connection_params['host']
         port = connection_params['port']
@@ -1336,14 +4232,8 @@ class DMLManager():
         user = connection_params['user']
         password = connection_params['password']
 
-        # Creación de la URL de la conexión a la base de datos
-        url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{name}"
-
-        # Creación del motor de conexión con la base de datos
-        engine = create_engine(url)
-
-        # Retorno del motor de conexión
-        return engine
+        # Retorno de la URL de la conexión a la base de datos
+        return f"{self._driver}://{user}:{password}@{host}:{port}/{name}"
 
     def _convert_to_dicts(self, data: pd.DataFrame) -> list[dict[str, _CommonType]]:
         """
@@ -1371,16 +4261,32 @@ class DMLManager():
         de filtros de búsqueda `WHERE` para consultas SQL, principalmente para
         lectura.
 
+        La construcción se realiza en dos pasos:
+        1. `_parse` valida el criterio de búsqueda en una sola pasada y lo separa en
+        su forma (campos, operadores y tipo de valor) y en los valores de sus
+        parámetros.
+        2. `_build_where` construye la expresión SQL a partir de la forma, usando
+        parámetros enlazados en lugar de valores literales.
+
+        De esta manera dos criterios de búsqueda que sólo difieren en sus valores
+        producen la misma forma y, por lo tanto, pueden reutilizar la misma
+        sentencia SQL compilada.
+
         Uso:
         >>> # Ejemplo 1
         >>> search_criteria = [('invoice_line_id', '=', 5)]
-        >>> cls._where.build_read_query('commisions', search_criteria)
-        >>> # ... WHERE commisions.invoice_line_id = 5
+        >>> ( shape, params ) = cls._where._parse(commisions, search_criteria)
+        >>> # shape: (('invoice_line_id', '=', 'value'),)
+        >>> # params: {'crit_0': 5}
+        >>> cls._where._build_where(commisions, shape)
+        >>> # ... WHERE commisions.invoice_line_id = :crit_0
         >>> 
         >>> # Ejemplo 2
         >>> search_criteria = ['|', ('state', '=', 'posted'), ('state', '=', 'sent')]
-        >>> cls._where.build_read_query('commisions', search_criteria)
-        >>> # ...WHERE <nombre de la tabla>.state = 'posted' AND <nombre de la tabla>.state = 'sent'
+        >>> ( shape, params ) = cls._where._parse(commisions, search_criteria)
+        >>> # params: {'crit_1': 'posted', 'crit_2': 'sent'}
+        >>> cls._where._build_where(commisions, shape)
+        >>> # ...WHERE commisions.state = :crit_1 OR commisions.state = :crit_2
 
         Los operadores de comparación disponibles a ejecutar son:
         - `'='`: Igual a
@@ -1394,6 +4300,7 @@ class DMLManager():
         - `'not in'`: No está en
         - `'ilike'`: Contiene
         - `'not ilike'`: No contiene
+        - `'~*'`: Coincide con la expresión regular (sin distinguir mayúsculas)
 
         Los operadores lógicos disponibles son:
         - `'&'`: AND
@@ -1402,32 +4309,32 @@ class DMLManager():
 
         # Operaciones de comparación
         _comparison_operation = {
-            '=': lambda table, field, value: getattr(table, field) == value,
-            '!=': lambda table, field, value: getattr(table, field) != value,
-            '>': lambda table, field, value: getattr(table, field) > value,
-            '>=': lambda table, field, value: getattr(table, field) >= value,
-            '<': lambda table, field, value: getattr(table, field) < value,
-            '<=': lambda table, field, value: getattr(table, field) <= value,
-            '><': lambda table, field, value: getattr(table, field).between(value[0], value[1]),
-            'in': lambda table, field, value: getattr(table, field).in_(value),
-            'not in': lambda table, field, value: getattr(table, field).not_in(value),
-            'ilike': lambda table, field, value: getattr(table, field).ilike(value),
-            'not ilike': lambda table, field, value: getattr(table, field).notilike(value),
+            '=': lambda column, value: column == value,
+            '!=': lambda column, value: column != value,
+            '>': lambda column, value: column > value,
+            '>=': lambda column, value: column >= value,
+            '<': lambda column, value: column < value,
+            '<=': lambda column, value: column <= value,
+            '><': lambda column, value: column.between(value[0], value[1]),
+            'in': lambda column, value: column.in_(value),
+            'not in': lambda column, value: column.not_in(value),
+            'ilike': lambda column, value: column.ilike(value),
+            'not ilike': lambda column, value: column.notilike(value),
+            '~*': lambda column, value: column.regexp_match(value, flags= 'i'),
         }
         """
         ## Operación de comparación
         Este mapa de funciones retorna un query SQL que consiste
         en la comparación de una columna de una tabla de la base de datos
-        con un valor o una colección de valores.
+        con un parámetro enlazado o una colección de parámetros enlazados.
 
         ### Los parámetros de entrada son:
-        - `table`: Instancia de la tabla de la cual se tomará el nombre de la columna.
-        - `field`: Nombre de la columna de la tabla, a evaluar.
-        - `value`: Valor o colección de valores con los cuales se va a evaluar la columna. 
+        - `column`: Atributo de la tabla (columna) a evaluar.
+        - `value`: Parámetro o colección de parámetros con los cuales se va a evaluar la columna. 
 
         Uso:
-        >>> cls._where._comparison_operation['='](commisions, invoice_line_id, 5)
-        >>> # ... WHERE commisions.invoice_line_id = 5
+        >>> cls._where._comparison_operation['='](commisions.invoice_line_id, bindparam('crit_0'))
+        >>> # ... WHERE commisions.invoice_line_id = :crit_0
 
         Los operadores de comparación disponibles a ejecutar son:
         - `'='`: Igual a
@@ -1441,6 +4348,18 @@ class DMLManager():
         - `'not in'`: No está en
         - `'ilike'`: Contiene
         - `'not ilike'`: No contiene
+        - `'~*'`: Coincide con la expresión regular (sin distinguir mayúsculas)
+        """
+
+        # Operaciones de comparación con nulos
+        _null_comparison_operation = {
+            '=': lambda column: column.is_(None),
+            '!=': lambda column: column.is_not(None),
+        }
+        """
+        ## Operación de comparación con nulos
+        Este mapa de funciones retorna un query SQL `IS NULL` o `IS NOT NULL`
+        para las tripletas cuyo valor de comparación es `None`.
         """
 
         # Operaciones lógicas
@@ -1454,15 +4373,15 @@ class DMLManager():
         unión de dos queries SQL unidas por un operador `and` u `or`.
 
         ### Los parámetros de entrada son:
-        - `condition_1`: Query SQL generada por la función `_create_individual_condition`.
-        - `condition_2`: Query SQL generada por la función `_create_individual_condition`.
+        - `condition_1`: Query SQL generada por la función `_create_individual_query`.
+        - `condition_2`: Query SQL generada por la función `_create_individual_query`.
 
         Uso:
         >>> self._where._logic_operation['|'](
-        >>>     _create_individual_condition(('state', '=', 'posted')),
-        >>>     _create_individual_condition(('state', '=', 'sent')),
+        >>>     _create_individual_query(...),
+        >>>     _create_individual_query(...),
         >>> )
-        >>> # ...WHERE <nombre de la tabla>.state = 'posted' AND <nombre de la tabla>.state = 'sent'
+        >>> # ...WHERE <nombre de la tabla>.state = :crit_1 OR <nombre de la tabla>.state = :crit_2
 
         Los operadores lógicos disponibles son:
         - `'&'`: AND
@@ -1470,102 +4389,190 @@ class DMLManager():
         """
 
         @classmethod
-        def _build_where(cls, table: DeclarativeBase, search_criteria: CriteriaStructure) -> BinaryExpression:
+        def _parse(
+            cls,
+            table: DeclarativeBase,
+            search_criteria: CriteriaStructure,
+            prefix: str = 'crit',
+        ) -> tuple[_CriteriaShape, dict[str, _CommonType]]:
+            """
+            ## Validación y separación del criterio de búsqueda
+            Esta función recorre el criterio de búsqueda una sola vez, validando
+            su estructura, y retorna su forma junto con el diccionario de valores
+            de los parámetros enlazados.
+
+            La forma del criterio de búsqueda es una tupla con los operadores
+            lógicos y, por cada tripleta, el nombre del campo, el operador de
+            comparación y el tipo de valor (`'value'`, `'many'`, `'range'` o
+            `'null'`, o la forma de la subconsulta). Los parámetros se nombran con
+            el prefijo provisto y la posición de su tripleta en el criterio de
+            búsqueda.
+
+            Uso:
+            >>> cls._where._parse(coords, ['&', ('planet', '=', 0), ('x', '!=', None)])
+            >>> # (('&', ('planet', '=', 'value'), ('x', '!=', 'null')), {'crit_1': 0})
+
+            Se genera un `ValueError` si el criterio de búsqueda contiene
+            elementos inválidos, campos inexistentes, operadores desconocidos o si
+            la cantidad de tripletas no corresponde con los operadores lógicos.
+            """
+
+            # Inicialización de la forma y los parámetros
+            shape = []
+            params = {}
+
+            # Cantidad de condiciones pendientes por completar
+            pending = 1
+
+            # Iteración por cada elemento del criterio de búsqueda
+            for token in search_criteria:
+
+                # Si ya no hay condiciones pendientes el criterio tiene elementos sobrantes
+                if pending == 0:
+                    raise ValueError(
+                        f"El criterio de búsqueda contiene condiciones que no están unidas por un operador lógico: {search_criteria}"
+                    )
+
+                # Si el elemento es un operador lógico se requiere una condición más
+                if isinstance(token, str) and token in cls._logic_operation:
+                    shape.append(token)
+                    pending += 1
+
+                # Si el elemento es una tripleta se completa una condición
+                elif cls._is_triplet(token):
+                    shape.append(cls._parse_triplet(table, token, f"{prefix}_{len(shape)}", params))
+                    pending -= 1
+
+                # Cualquier otro elemento es inválido
+                else:
+                    raise ValueError(f"Elemento inválido en el criterio de búsqueda: {token!r}")
+
+            # Si hay criterio de búsqueda deben haberse completado todas las condiciones
+            if len(search_criteria) > 0 and pending > 0:
+                raise ValueError(
+                    f"El criterio de búsqueda tiene operadores lógicos sin condiciones suficientes: {search_criteria}"
+                )
+
+            # Retorno de la forma y los parámetros
+            return ( tuple(shape), params )
+
+        @classmethod
+        def _parse_triplet(cls, table: DeclarativeBase, fragment: _TripletStructure, name: str, params: dict[str, _CommonType]) -> tuple[str, str, str]:
+            """
+            ## Validación y separación de una tripleta
+            Esta función valida una tripleta, agrega su valor al diccionario de
+            parámetros bajo el nombre provisto y retorna su forma.
+            """
+
+            # Destructuración de valores
+            ( field, op, value ) = fragment
+
+            # Validación del campo
+            if field not in table.__mapper__.columns:
+                raise ValueError(f"El campo '{field}' no existe en la tabla '{table.__tablename__}'")
+
+            # Validación del operador de comparación
+            if op not in cls._comparison_operation:
+                raise ValueError(f"Operador de comparación inválido: '{op}'")
+
+            # Comparación con nulos
+            if value is None:
+                if op not in cls._null_comparison_operation:
+                    raise ValueError(f"El operador '{op}' no puede compararse con None")
+                return ( field, op, 'null' )
+
+            # Comparación por rango
+            if op == '><':
+                if not isinstance(value, (list, tuple)) or len(value) != 2:
+                    raise ValueError(f"El operador '><' requiere un par de valores: {fragment}")
+                ( params[f"{name}_min"], params[f"{name}_max"] ) = value
+                return ( field, op, 'range' )
+
+            # Comparación con una subconsulta
+            if op in ('in', 'not in') and isinstance(value, _Subquery):
+                return ( field, op, cls._parse_subquery(value, name, params) )
+
+            # Comparación con colecciones de valores
+            if op in ('in', 'not in'):
+                # Los arreglos de NumPy y las series de pandas se convierten a valores de Python
+                if hasattr(value, 'tolist'):
+                    value = value.tolist()
+                if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+                    raise ValueError(f"El operador '{op}' requiere una colección de valores: {fragment}")
+                params[name] = list(value)
+                return ( field, op, 'many' )
+
+            # Comparación con un valor individual
+            params[name] = value
+            return ( field, op, 'value' )
+
+        @classmethod
+        def _parse_subquery(cls, subquery: _Subquery, name: str, params: dict[str, _CommonType]) -> tuple[str, DeclarativeBase, str, _CriteriaShape]:
+            """
+            ## Validación y separación de una subconsulta
+            Esta función valida el campo de una subconsulta, agrega los valores
+            de su criterio de búsqueda al diccionario de parámetros con el
+            prefijo `{name}_sub` y retorna la forma de la subconsulta.
+            """
+
+            # Validación del campo retornado
+            if subquery.field not in subquery.table.__mapper__.columns:
+                raise ValueError(f"El campo '{subquery.field}' no existe en la tabla '{subquery.table.__tablename__}'")
+
+            # Obtención de la forma del criterio de la subconsulta y de sus parámetros
+            ( shape, sub_params ) = cls._parse(subquery.table, subquery.criteria, f"{name}_sub")
+            params.update(sub_params)
+
+            return ( 'subquery', subquery.table, subquery.field, shape )
+
+        @classmethod
+        def _build_where(cls, table: DeclarativeBase, shape: _CriteriaShape, prefix: str = 'crit') -> BinaryExpression:
             """
             ## Creación de Query SQL de lectura
-            Esta función crea un query SQL para leer los datos de la tabla provista,
-            que coincidan con los criterios de búsqueda.
+            Esta función crea el query SQL `WHERE` a partir de la forma de un
+            criterio de búsqueda obtenida con `_parse`. El criterio en notación
+            polaca se recorre una sola vez usando una pila de operadores lógicos
+            pendientes.
 
             ### Los parámetros de entrada son:
             `table`: Instancia de la tabla de la cual se tomará el nombre de la columna.
-            `search_criteria`: Lista de tuplas y Literales `'&'`, `'|'` que contienen los
-            criterios de evaluación para lectura de la tabla.
+            `shape`: Forma del criterio de búsqueda retornada por `_parse`.
 
             Uso:
-            >>> # Ejemplo 1
-            >>> search_criteria = [('invoice_line_id', '=', 5)]
-            >>> cls._where.build_read_query('commisions', search_criteria)
-            >>> # ... WHERE commisions.invoice_line_id = 5
-            >>> 
-            >>> # Ejemplo 2
-            >>> search_criteria = ['|', ('state', '=', 'posted'), ('state', '=', 'sent')]
-            >>> cls._where.build_read_query('commisions', search_criteria)
-            >>> # ...WHERE <nombre de la tabla>.state = 'posted' AND <nombre de la tabla>.state = 'sent'
-
-            Los operadores de comparación disponibles a ejecutar son:
-            - `'='`: Igual a
-            - `'!='`: Diferente de
-            - `'>'`: Mayor a
-            - `'>='`: Mayor o igual a
-            - `'<`': Menor que
-            - `'<='`: Menor o igual que
-            - `'><'`: Entre
-            - `'in'`: Está en
-            - `'not in'`: No está en
-            - `'ilike'`: Contiene
-            - `'not ilike'`: No contiene
-
-            Los operadores lógicos disponibles son:
-            - `'&'`: AND
-            - `'|'`: OR
+            >>> ( shape, params ) = cls._where._parse(commisions, ['|', ('state', '=', 'posted'), ('state', '=', 'sent')])
+            >>> cls._where._build_where(commisions, shape)
+            >>> # ...WHERE commisions.state = :crit_1 OR commisions.state = :crit_2
             """
 
-            # Si el criterio de búsqueda sólo contiene una tripleta 
-            if len(search_criteria) == 1:
-                # Destructuración de la tripleta
-                [ triplet ] = search_criteria
-                # Creación de query de condición individual
-                return cls._create_individual_query(table, triplet)
-
-            # Iteración
-            for i in range( len(search_criteria) ):
-                # Creación de condiciones individuales para facilitar su lectura
-                istriplet_1 = cls._is_triplet(search_criteria[i])
-                istriplet_2 = cls._is_triplet(search_criteria[i + 1])
-                istriplet_3 = cls._is_triplet(search_criteria[i + 2])
-
-                # Si sólo el primer valor es un operador lógico y los siguientes dos  son tripletas
-                if not istriplet_1 and istriplet_2 and istriplet_3:
-                    # Destructuración de los valores
-                    ( op, condition_1, condition_2) = search_criteria[i: i + 3]
-
-                    # Retorno de la unión de las dos condiciones
-                    return cls._merge_queries(
-                        op,
-                        cls._create_individual_query(table, condition_1),
-                        cls._create_individual_query(table, condition_2)
-                    )
-                
-                # Si uno de los dos siguientes valores no es tripleta se tiene que generar una
-                #   condición compleja, en dos diferentes escenarios:
-                else:
-                    # Obtención del operador lógico
-                    op = search_criteria[i]
-
-                    # Si el primero de los dos siguientes valores es tripleta
-                    if istriplet_2:
-                        # Unión de condiciones
-                        return cls._merge_queries(
-                            op,
-                            # Se convierte el primer siguiente valor en query SQL
-                            cls._create_individual_query(table, search_criteria[i + 1]),
-                            # Se ejecuta esta función recursivamente para la evaluación del resto
-                            #   de los valores del criterio de búsqueda
-                            cls.build_where(table, search_criteria[i + 2:])
-                        )
+            # Pila de operadores lógicos pendientes con sus condiciones
+            stack: list[tuple[_LogicOperator, list[BinaryExpression]]] = []
 
-                    # Si el segundo de los dos siguientes valores es tripleta
-                    else:
-                        # Unión de dos condiciones
-                        return cls._merge_queries(
-                            op,
-                            # Se ejecuta esta función recursivamente para la evaluación del
-                            #   criterio de búsqueda a partir del siguiente primer valor hasta
-                            #   el penúltimo valor del criterio de búsqueda
-                            cls._build_where(table, search_criteria[i + 1: -1]),
-                            # Se convierte el último valor del criterio de búsqueda en query SQL
-                            cls._create_individual_query(table, search_criteria[-1])
-                        )
+            # Iteración por cada elemento de la forma
+            for ( position, token ) in enumerate(shape):
+
+                # Si el elemento es un operador lógico se agrega a la pila
+                if isinstance(token, str):
+                    stack.append( (token, []) )
+                    continue
+
+                # Creación de la condición individual
+                condition = cls._create_individual_query(table, token, f"{prefix}_{position}")
+
+                # Se asigna la condición a los operadores pendientes, uniendo los que se completan
+                while len(stack) > 0:
+                    ( op, conditions ) = stack[-1]
+                    conditions.append(condition)
+
+                    # Si el operador aún requiere otra condición se continúa con el siguiente elemento
+                    if len(conditions) < 2:
+                        break
+
+                    # Unión de las dos condiciones del operador completado
+                    stack.pop()
+                    condition = cls._merge_queries(op, *conditions)
+
+            # Retorno de la condición resultante
+            return condition
 
         @classmethod
         def _merge_queries(cls, op: _LogicOperator, condition_1: BinaryExpression, condition_2: BinaryExpression) -> BinaryExpression:
@@ -1577,16 +4584,16 @@ class DMLManager():
             ### Los parámetros de entrada son:
             - `op`: Operador lógico para unir los queries (Consultar los operadores lógicos
             disponibles más abajo).
-            - `condition_1`: Query SQL generada por la función `_create_individual_condition`.
-            - `condition_2`: Query SQL generada por la función `_create_individual_condition`.
+            - `condition_1`: Query SQL generada por la función `_create_individual_query`.
+            - `condition_2`: Query SQL generada por la función `_create_individual_query`.
 
             Uso:
-            >>> _merge_conditions(
+            >>> _merge_queries(
             >>>     '|',
-            >>>     _create_individual_condition(('state', '=', 'posted')),
-            >>>     _create_individual_condition(('state', '=', 'sent')),
+            >>>     _create_individual_query(...),
+            >>>     _create_individual_query(...),
             >>> )
-            >>> # ...WHERE <nombre de la tabla>.state = 'posted' AND <nombre de la tabla>.state = 'sent'
+            >>> # ...WHERE <nombre de la tabla>.state = :crit_1 OR <nombre de la tabla>.state = :crit_2
 
             Los operadores lógicos disponibles son:
             - `'&'`: AND
@@ -1597,44 +4604,84 @@ class DMLManager():
             return cls._logic_operation[op](condition_1, condition_2)
 
         @classmethod
-        def _create_individual_query(cls, table: DeclarativeBase, fragment: _TripletStructure) -> BinaryExpression:
+        def _create_individual_query(cls, table: DeclarativeBase, fragment: tuple[str, str, str], name: str) -> BinaryExpression:
             """
             ## Función de creación de query SQL individual
             Esta función crea un query SQL que consiste en la comparación de
-            una columna de una tabla de la base de datos con un valor o una
-            colección de valores.
+            una columna de una tabla de la base de datos con un parámetro
+            enlazado o una colección de parámetros enlazados.
 
             ### Los parámetros de entrada son:
             - `table`: Instancia de la tabla de la cual se tomará el nombre de la columna.
-            - `fragment`: Tripleta en formato de tupla, que contiene los siguientes valores:
+            - `fragment`: Forma de la tripleta retornada por `_parse_triplet`, que contiene:
                 1. Nombre de la columna de la tabla, a evaluar.
-                2. Operador de comparación (Consultar los operadores de comparación disponibles
-                más abajo).
-                3. Valor o colección de valores con los cuales se va a evaluar la columna.
+                2. Operador de comparación.
+                3. Tipo de valor (`'value'`, `'many'`, `'range'` o `'null'`).
+            - `name`: Nombre del parámetro enlazado.
 
             Uso:
-            >>> fragment = ('invoice_line_id', '=', 5)
-            >>> cls._where._create_individual_condition(commisions, fragment)
-            >>> # ... WHERE commisions.invoice_line_id = 5
-
-            Los operadores de comparación disponibles a ejecutar son:
-            - `'='`: Igual a
-            - `'!='`: Diferente de
-            - `'>'`: Mayor a
-            - `'>='`: Mayor o igual a
-            - `'<`': Menor que
-            - `'<='`: Menor o igual que
-            - `'><'`: Entre
-            - `'in'`: Está en
-            - `'not in'`: No está en
-            - `'ilike'`: Contiene
-            - `'not ilike'`: No contiene
+            >>> fragment = ('invoice_line_id', '=', 'value')
+            >>> cls._where._create_individual_query(commisions, fragment, 'crit_0')
+            >>> # ... WHERE commisions.invoice_line_id = :crit_0
             """
+
             # Destructuración de valores
-            ( field, op, value ) = fragment
+            ( field, op, kind ) = fragment
+
+            # Obtención de la columna
+            column = getattr(table, field)
+
+            # Comparación con nulos
+            if kind == 'null':
+                return cls._null_comparison_operation[op](column)
+
+            # Comparación con una subconsulta
+            if isinstance(kind, tuple):
+                return cls._comparison_operation[op](column, cls._build_subquery(kind, name))
+
+            # Comparación por rango
+            if kind == 'range':
+                value = (
+                    bindparam(f"{name}_min", type_= column.type),
+                    bindparam(f"{name}_max", type_= column.type),
+                )
+
+            # Comparación con colecciones de valores
+            elif kind == 'many':
+                value = bindparam(name, type_= column.type, expanding= True)
+
+            # Comparación con un valor individual
+            else:
+                value = bindparam(name, type_= column.type)
 
             # Retorno de la evaluación
-            return cls._comparison_operation[op](table, field, value)
+            return cls._comparison_operation[op](column, value)
+
+        @classmethod
+        def _build_subquery(cls, kind: tuple[str, DeclarativeBase, str, _CriteriaShape], name: str) -> Select:
+            """
+            ## Creación de una subconsulta
+            Esta función crea la sentencia `SELECT` de una subconsulta a partir
+            de su forma, con los parámetros nombrados con el prefijo
+            `{name}_sub`.
+
+            Uso:
+            >>> kind = ('subquery', enemies, 'id', (('online', '=', 'value'),))
+            >>> cls._where._create_individual_query(coords, ('enemy_id', 'in', kind), 'crit_1')
+            >>> # ... WHERE coords.enemy_id IN (SELECT enemies.id FROM enemies WHERE enemies.online = :crit_1_sub_0)
+            """
+
+            # Destructuración de valores
+            ( _, sub_table, sub_field, sub_shape ) = kind
+
+            # Creación de la sentencia de la subconsulta
+            stmt = select(getattr(sub_table, sub_field))
+
+            # Si hay criterios de búsqueda se genera el 'where'
+            if len(sub_shape) > 0:
+                stmt = stmt.where(cls._build_where(sub_table, sub_shape, f"{name}_sub"))
+
+            return stmt
 
         @classmethod
         def _is_triplet(cls, value) -> bool:
@@ -1647,4 +4694,4 @@ class DMLManager():
                     isinstance(value, tuple) or isinstance(value, list)
                 and 
                     len(value) == 3
-            )
\ No newline at end of file
+            )
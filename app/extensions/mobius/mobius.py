@@ -1,4 +1,4 @@
-from dml_manager import DMLManager
+from app.extensions.dml_manager import DMLManager
 from typing import Any, Callable
 import asyncio
 import aiohttp
@@ -116,11 +116,8 @@ class Mobius():
     async def current_opponent_alliance(self) -> int | bool:
 
         # Obtención de la ID de la alianza enemiga (Si es que estamos en guerra)
-        alliance_id: int = self._db_connection.get_value(
-                'war',
-                1,
-                'alliance_id'
-            )
+        [ war ] = self._db_connection.read('war', [1], ['alliance_id'], output_format= 'records')
+        alliance_id: int = war['alliance_id']
 
         # Si hay una alianza enemiga
         if alliance_id:
@@ -147,11 +144,8 @@ class Mobius():
         if current_opponent_alliance_from_api != '':
 
             # Obtención de la ID de la alianza activa en la base de datos
-            current_opponent_alliance_from_db: int = self._db_connection.get_value(
-                'war',
-                1,
-                'alliance_id'
-            )
+            [ war ] = self._db_connection.read('war', [1], ['alliance_id'], output_format= 'records')
+            current_opponent_alliance_from_db: int = war['alliance_id']
 
             # Obtención de la ID de la alianza enemiga:
             current_opponent_alliance_id = self._get_alliance_id(current_opponent_alliance_from_api)
@@ -198,80 +192,57 @@ class Mobius():
         Obtención de las coordenadas de una alianza registrada en la base de datos.
         """
 
-        # Obtención de los planetas
-        planets = self._db_connection.search_read(
-            'coords',
-            [('alliance_id', '=', alliance_id)],
-        )
-
-        # Obtención de las IDs de los planetas enemigos
-        enemies_planets_ids: list[int] = planets['enemy_id'].to_list()
-
-        # Obtención de la información de los enemigos
-        enemies = self._db_connection.search_read(
-            'enemies', [('id', 'in', enemies_planets_ids)],
-            fields=['name', 'avatar', 'level']
-        )
-
-        # Obtención de los usuarios
-        users = self._db_connection.search_read('users', fields=['user', 'avatar'])
-
-        # Retorno de la información complementada
+        # Obtención de los planetas junto con la información de los enemigos y de los usuarios
+        #       creador, modificador y atacante en una sola consulta
         return (
-            # Unión de planetas con enemigos
-            pd.merge(
-                left= planets,
-                right= enemies.rename(columns={'id': 'enemy_id'}),
-                left_on= 'enemy_id',
-                right_on= 'enemy_id',
-                how= 'left'
-            )
-            # Unión con usuario creador
-            .pipe(
-                lambda df: (
-                    pd.merge(
-                        left= df,
-                        right= users.rename(columns={'id': 'create_uid', 'user': 'create_user', 'avatar': 'create_avatar'}),
-                        left_on= 'create_uid',
-                        right_on= 'create_uid',
-                        how= 'left',
-                    )
-                )
+            self._db_connection.search_read(
+                'coords',
+                [('alliance_id', '=', alliance_id)],
+                fields= [
+                    'x',
+                    'y',
+                    'war',
+                    'planet',
+                    'color',
+                    'starbase_level',
+                    'under_attack_since',
+                    'attacked_at',
+                    'attacked_by',
+                    'enemy_id',
+                    'create_uid',
+                    'write_uid',
+                    'alliance_id',
+                    'create_date',
+                    'write_date',
+                    'enemy_id.name',
+                    'enemy_id.avatar',
+                    'enemy_id.level',
+                    'create_uid.user',
+                    'create_uid.avatar',
+                    'write_uid.user',
+                    'write_uid.avatar',
+                    'attacked_by.user',
+                    'attacked_by.avatar',
+                ],
             )
-            # Unión con usuario modificador
-            .pipe(
-                lambda df: (
-                    pd.merge(
-                        left= df,
-                        right= users.rename(columns={'id': 'write_uid', 'user': 'write_user', 'avatar': 'write_avatar'}),
-                        left_on= 'write_uid',
-                        right_on= 'write_uid',
-                        how= 'left',
-                    )
-                )
+            # Reasignación de nombres de columnas relacionales
+            .rename(
+                columns= {
+                    'enemy_id.name': 'name',
+                    'enemy_id.avatar': 'avatar',
+                    'enemy_id.level': 'level',
+                    'create_uid.user': 'create_user',
+                    'create_uid.avatar': 'create_avatar',
+                    'write_uid.user': 'write_user',
+                    'write_uid.avatar': 'write_avatar',
+                    'attacked_by.user': 'attack_user',
+                    'attacked_by.avatar': 'attack_avatar',
+                }
             )
-            # Unión con usuario atacante
-            .pipe(
-                lambda df: (
-                    pd.merge(
-                        left= df.astype({'attacked_by': 'Int64'}),
-                        right= users.rename(columns={'id': 'attacked_by', 'user': 'attack_user', 'avatar': 'attack_avatar'}),
-                        left_on= 'attacked_by',
-                        right_on= 'attacked_by',
-                        how= 'left',
-                    )
-                    .astype(
-                        {
-                            'attack_user': 'string',
-                            'attack_avatar': 'string',
-                        }
-                    )
-                    .replace(
-                        {
-                            pd.NA: None
-                        }
-                    )
-                )
+            .replace(
+                {
+                    pd.NA: None
+                }
             )
         )
 
@@ -324,14 +295,25 @@ class Mobius():
                 .to_dict('records')
             )
 
-            # Registro de los enemigos en la base de datos
-            self._db_connection.create('enemies', records)
+            # Registro de los enemigos en la base de datos, o actualización en caso de existir
+            enemy_ids = self._db_connection.upsert(
+                'enemies',
+                records,
+                ['name'],
+                ['avatar', 'level', 'role', 'alliance_id'],
+            )
 
-            # Obtención de los registros de enemigos (Con ID de base de datos)
-            enemies = self._db_connection.search_read('enemies', [('alliance_id', '=', alliance_id)], fields=['name', 'alliance_id'])
+            # Registros de enemigos con ID de base de datos
+            enemies = pd.DataFrame(
+                {
+                    'id': enemy_ids,
+                    'name': [ record['name'] for record in records ],
+                    'alliance_id': alliance_id,
+                }
+            )
 
             # Obtención de los niveles de base estelar de cada enemigo
-            planets = self._get_alliance_total_planets(alliance_name)
+            planets = await self._get_alliance_total_planets(alliance_name)
 
             # Obtención de los nombres de los enemigos para merge
             alliance_info = await self.get_alliance_info(alliance_name)
@@ -377,8 +359,13 @@ class Mobius():
                 .to_dict('records')
             )
 
-            # Registro de los planetas principales
-            self._db_connection.create('coords', coords_records)
+            # Registro de los planetas principales, o actualización en caso de existir
+            self._db_connection.upsert(
+                'coords',
+                coords_records,
+                ['enemy_id', 'planet'],
+                ['starbase_level', 'alliance_id', 'war'],
+            )
 
         # Retorno de la ID de la alianza en la base de datos
         return alliance_id
@@ -435,7 +422,7 @@ class Mobius():
             'alliances',
             [('name', '=', alliance_name)],
             fields= ['name', 'logo', 'level'],
-            output_format= 'dict'
+            output_format= 'records'
         )
 
         if not db_data:
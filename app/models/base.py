@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from dml_manager import CriteriaStructure
+from app.extensions._types import CriteriaStructure
 
 class BaseDataRequest(BaseModel):
     """
@@ -9,6 +9,7 @@ class BaseDataRequest(BaseModel):
     - `sortby` `str | list[str] | None`: Ordenar por.
     - `ascending` `bool | list[bool]`: Orden ascendente.
     - `search_criteria` `CriteriaStructure`: Criterio de búsqueda.
+    - `cursor` `list | None`: Cursor de la página anterior para paginación por búsqueda de llave.
     """
     search_criteria: CriteriaStructure = []
     fields: list[str] = []
@@ -29,3 +30,7 @@ class BaseDataRequest(BaseModel):
         default= True,
         description= 'Ordenamiento ascendente o descendente, en función del campo a usar para ordenar en el parámetro `sortby`.'
     )
+    cursor: list | None = Field(
+        default= None,
+        description= 'Cursor retornado en la página anterior. Si se provee, la siguiente página se obtiene a partir de éste en lugar de usar el número de página (`page`).'
+    )
@@ -23,7 +23,7 @@ async def _get(user: UserInDB = Depends(get_current_user)):
     fields = ['id', 'user', 'name', 'avatar', 'create_date', 'write_date']
 
     # Obtención del usuario
-    [ data ] = db_connection.read("users", [user.id], fields= fields, output_format="dict")
+    [ data ] = db_connection.read("users", [user.id], fields= fields, output_format="records")
 
     # Retorno de la información
     return data
@@ -40,7 +40,7 @@ async def _change_password(
 ) -> bool:
 
     # Obtención de los datos del usuario desde la base de datos
-    [ user_data ] = db_connection.read('users', [user.id], fields=['password'], output_format='dict')
+    [ user_data ] = db_connection.read('users', [user.id], fields=['password'], output_format='records')
 
     # Si la contraseña actual es correcta
     if ( pwd_context.verify(current_password, user_data['password']) ):
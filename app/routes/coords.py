@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, status, Body, Query
 from app.security.auth import is_active_user, get_current_user
 from app import (
     db_connection,
+    async_db_connection,
     mobius,
     Mobius
 )
@@ -15,7 +16,7 @@ from typing import Literal
 from datetime import datetime, timedelta
 from app.constants.constants import WARPOINTS_FROM_STARBASE_LEVEL
 from app.api.websockets import ws_manager
-from dml_manager import CriteriaStructure
+from app.extensions._types import CriteriaStructure
 from app.utils import (
     get_regeneration_time,
     expire_time,
@@ -35,7 +36,7 @@ async def _get_current_coords(active: bool = Depends(is_active_user)):
     """
 
     # Obtención de la alianza enemiga actual
-    alliance_id = mobius.current_opponent_alliance()
+    alliance_id = await mobius.current_opponent_alliance()
 
     # Si hay guerra
     if alliance_id:
@@ -295,38 +296,83 @@ async def _get_available_coords(
 ) -> dict:
 
     # Obtención de la alianza enemiga actual y horas de regeneración
-    ( enemy_alliance_id, regen_hours ) = db_connection.get_values('war', 1, ['alliance_id', 'enemy_alliance_regeneration_hours'])
+    [ ( _, enemy_alliance_id, regen_hours ) ] = db_connection.read('war', [1], ['alliance_id', 'enemy_alliance_regeneration_hours'], output_format= 'tuples')
 
-    # Si no existe alianza enemiga se retorna una lista vacía
+    # Si no existe alianza enemiga se retorna una página vacía
     if enemy_alliance_id is None:
-        return []
+        return {
+            'data': [],
+            'count': 0,
+            'cursor': None,
+        }
+
+    # Subconsulta de los enemigos desconectados de la alianza enemiga, resuelta en la
+    #       misma sentencia de la búsqueda de planetas
+    offline_enemies = db_connection.subquery(
+        'enemies',
+        [
+            '&',
+                ('alliance_id', '=', enemy_alliance_id),
+                ('online', '=', False),
+        ]
+    )
 
-    # Definición del criterio de búsqueda a usar
+    # Definición del criterio de búsqueda a usar. Los filtros de regeneración y
+    # de enemigos desconectados se resuelven en la base de datos para que el
+    # conteo y la paginación consideren únicamente los planetas disponibles
     search_criteria: CriteriaStructure = [
         '&',
             ('alliance_id', '=', enemy_alliance_id),
             '&',
-                ('under_attack_since', '=', None),
-                '|',
-                    ('planet', '=', 0),
+                ('enemy_id', 'in', offline_enemies),
+                '&',
+                    ('under_attack_since', '=', None),
                     '&',
-                        ('x', '!=', None),
-                        ('y', '!=', None),
+                        '|',
+                            ('attacked_at', '=', None),
+                            ('attacked_at', '<=', cdxm_now() - timedelta(hours= regen_hours or 0)),
+                        '|',
+                            ('planet', '=', 0),
+                            '&',
+                                ('x', '!=', None),
+                                ('y', '!=', None),
     ]
 
+    # Se agrega el criterio de búsqueda provisto
+    if len(params.search_criteria) > 0:
+        search_criteria = ['&', *search_criteria, *params.search_criteria]
+
+    # Los campos requeridos para unir la información de los enemigos se agregan a los solicitados
+    fields = params.fields
+    if len(fields) > 0:
+        fields = [ *fields, *[ field for field in ('enemy_id', 'under_attack_since') if field not in fields ] ]
+
+    # Obtención de la página de coordenadas disponibles
+    page = db_connection.search_read_page(
+        'coords',
+        search_criteria,
+        fields,
+        params.page,
+        params.items_per_page,
+        sortby= params.sortby or 'starbase_level',
+        ascending= params.ascending if params.sortby else False,
+        cursor= params.cursor,
+    )
+
+    # Si no hay coordenadas disponibles se retorna la página vacía
+    if len(page['data']) == 0:
+        return {
+            'data': [],
+            'count': page['count'],
+            'cursor': None,
+        }
 
     # Retorno de la información
     data = (
-        # Obtención de las coordenadas disponibles
-        db_connection.search_read(
-            'coords',
-            search_criteria,
-            sortby='starbase_level',
-            ascending= False
-        )
+        page['data']
         .assign(
-            # Creación de columna de horario de regeneración
-            restores_at = lambda df: get_regeneration_time(df['attacked_at']),
+            # Las coordenadas disponibles ya concluyeron su tiempo de regeneración
+            restores_at = None,
             # Nulidad de información si ha pasado el tiempo establecido
             under_attack_since = lambda df: df['under_attack_since'].apply(expire_time(900)).replace({np.nan: None})
         )
@@ -360,14 +406,14 @@ async def _get_available_coords(
             )
         )
         .rename(columns={'enemy_name': 'name', 'enemy_avatar': 'avatar', 'enemy_level': 'level'})
-        .pipe(lambda df: df[ (df['restores_at'].isna()) & (df['enemy_online'] == False) ])
         .replace({np.nan: None})
         .to_dict('records')
     )
 
     return {
         'data': data,
-        'count': len(data)
+        'count': page['count'],
+        'cursor': page['cursor'],
     }
 
 @router.put(
@@ -378,7 +424,7 @@ async def _get_available_coords(
 @ws_manager.notify_update_to_client
 async def _mark_as_checked(checked: bool = Body(), enemy_id: int = Body(), user: UserInDB = Depends(get_current_user)):
 
-    db_connection.update('enemies', enemy_id, {'checked': checked})
+    await async_db_connection.update('enemies', enemy_id, {'checked': checked})
 
     return True
 
@@ -397,7 +443,7 @@ async def _add_new_coords(
 ):
 
     # Escritura en la base de datos
-    return db_connection.update(
+    return await async_db_connection.update(
         'coords',
         [colony_id],
         {
@@ -421,7 +467,7 @@ async def _delete_coords(
 ):
 
     # Escritura en la base de datos
-    return db_connection.update(
+    return await async_db_connection.update(
         'coords',
         [planet_id],
         {
@@ -444,28 +490,29 @@ async def _claim_planet_to_attack(
     user: UserInDB = Depends(get_current_user),
 ):
 
-    # Obtención del registro del planeta
-    [ record ] = db_connection.read('coords', [planet_id], fields=['under_attack_since', 'attacked_by'], output_format='dict')
-
-
-    # Si el planeta no está siendo atacado...
-    if not record['under_attack_since'] or not expire_time()(record['under_attack_since']) or record['attacked_by'] == user.id:
-
-        # Se reclama
-        db_connection.update(
-            'coords',
-            [planet_id],
-            {
-                'under_attack_since': cdxm_now(),
-                'attacked_by': user.id,
-            }
-        )
-
-        # Confirmación de planeta reclamado
-        return True
+    # Se reclama el planeta sólo si no está siendo atacado, si el ataque anterior ya expiró
+    #       o si el atacante es el mismo usuario, en una sola sentencia para que dos
+    #       usuarios no puedan reclamarlo al mismo tiempo
+    now = cdxm_now()
+    claimed = await async_db_connection.update_where(
+        'coords',
+        [
+            '&',
+                ('id', '=', planet_id),
+                '|',
+                    '|',
+                        ('under_attack_since', '=', None),
+                        ('under_attack_since', '<=', now - timedelta(seconds= 900)),
+                    ('attacked_by', '=', user.id),
+        ],
+        {
+            'under_attack_since': now,
+            'attacked_by': user.id,
+        }
+    )
 
-    # Confirmación de que alguien más llegó primero
-    return False
+    # Confirmación de planeta reclamado o de que alguien más llegó primero
+    return claimed == 1
 
 @router.post(
     "/leave_planet",
@@ -478,20 +525,20 @@ async def _leave_planet(
     user: UserInDB = Depends(get_current_user)
 ):
 
-    # Obtención del registro del planeta
-    [ record ] = db_connection.read('coords', [planet_id], fields=['under_attack_since', 'attacked_by'], output_format='dict')
-
-    # Si el planeta no está siendo atacado o el atacante es el mismo usuario
-    if not record['under_attack_since'] or record['attacked_by'] == user.id:
-
-        # Se abandona el planeta
-        db_connection.update(
-            'coords',
-            [planet_id],
-            {
-                'under_attack_since': None,
-            }
-        )
+    # Se abandona el planeta si no está siendo atacado o el atacante es el mismo usuario
+    await async_db_connection.update_where(
+        'coords',
+        [
+            '&',
+                ('id', '=', planet_id),
+                '|',
+                    ('under_attack_since', '=', None),
+                    ('attacked_by', '=', user.id),
+        ],
+        {
+            'under_attack_since': None,
+        }
+    )
 
     # Confirmación de cambios realizados
     return True
@@ -508,33 +555,31 @@ async def _mark_online(
     user: UserInDB = Depends(get_current_user)
 ):
 
-    # Obtención de la ID del planeta principal del jugador
-    planet_ids = (
-        db_connection.search_read(
+    # Lectura y escritura en una sola transacción
+    async with async_db_connection.transaction():
+
+        # Obtención de la ID del planeta principal del jugador
+        planet_ids = await async_db_connection.search(
             'coords',
             [
                 '&',
                     ('enemy_id', '=', enemy_id),
                     ('planet', '=', 0),
-            ],
-            ['id']
+            ]
         )
-        ['id']
-        .to_list()
-    )
 
-    # Se establece estado online a activo
-    db_connection.update('enemies', [enemy_id], {'online': True})
+        # Se establece estado online a activo
+        await async_db_connection.update('enemies', [enemy_id], {'online': True})
 
-    # Se regeneran los planetas
-    db_connection.update(
-        'coords',
-        planet_ids,
-        {
-            'attacked_by': user.id,
-            'attacked_at': None,
-        }
-    )
+        # Se regeneran los planetas
+        await async_db_connection.update(
+            'coords',
+            planet_ids,
+            {
+                'attacked_by': user.id,
+                'attacked_at': None,
+            }
+        )
 
     # Confirmación de cambios realizados
     return True
@@ -552,7 +597,7 @@ async def _mark_offline(
 ):
     
     # Escritura en base de datos
-    db_connection.update('enemies', [enemy_id], {'online': False})
+    await async_db_connection.update('enemies', [enemy_id], {'online': False})
 
     return True
 
@@ -569,7 +614,7 @@ async def _mark_attacked(
 ):
 
     # Se marca planeta como atacado
-    db_connection.update(
+    await async_db_connection.update(
         'coords',
         [planet_id],
         {
@@ -594,7 +639,7 @@ async def _restore_planet(
     user: UserInDB = Depends(get_current_user)
 ):
 
-    db_connection.update(
+    await async_db_connection.update(
         'coords',
         [planet_id],
         {
@@ -618,7 +663,7 @@ async def _update_regeneration_hours(
 ) -> bool:
 
     # Escritura en base de datos
-    db_connection.update('war', [1], {'enemy_alliance_regeneration_hours': time_in_hours})
+    await async_db_connection.update('war', [1], {'enemy_alliance_regeneration_hours': time_in_hours})
 
     # Confirmación de cambios realizados
     return True
@@ -644,7 +689,7 @@ async def _get_enemy_alliance_stats(
         return False
 
     # Obtención del registro de la alianza guardada
-    [ alliance_record ] = db_connection.read('alliances', [current_enemy_alliance_id], ['name'], output_format='dict')
+    [ alliance_record ] = db_connection.read('alliances', [current_enemy_alliance_id], ['name'], output_format='records')
 
     # Obtención nuevamente de la API para mostrar los datos en el frontend
     alliance_data_from_api = await mobius._get("/alliances/get", {"name": alliance_record['name']}, mobius._base_url)
@@ -653,19 +698,16 @@ async def _get_enemy_alliance_stats(
     enemy_alliance_members = ( await mobius.get_alliance_info(alliance_data_from_api['Name']) ).to_dict('records')
 
     # Obtención de cantidad de estrellas recolectables en PPs
-    farmeable_stars = int(
-        db_connection.search_read(
-            'coords',
-            ['&',
-                ('planet', '=', 0),
-                ('alliance_id', '=', current_enemy_alliance_id)], ['starbase_level']
-        )
-        .replace(
-            {'starbase_level': WARPOINTS_FROM_STARBASE_LEVEL}
-        )
-        ['starbase_level']
-        .sum()
+    [ ( farmeable_stars, ) ] = db_connection.read_group(
+        'coords',
+        ['&',
+            ('planet', '=', 0),
+            ('alliance_id', '=', current_enemy_alliance_id)],
+        aggregates= ['starbase_level:sum'],
+        mappings= {'starbase_level': WARPOINTS_FROM_STARBASE_LEVEL},
+        output_format= 'tuples',
     )
+    farmeable_stars = int(farmeable_stars or 0)
 
     # Retorno de los datos
     return {
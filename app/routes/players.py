@@ -1,3 +1,4 @@
+import re
 from typing import Literal
 from fastapi import (
     APIRouter,
@@ -51,38 +52,28 @@ async def _add_coords(
     user: UserInDB = Depends(get_current_user)
 ):
 
-    # Búsqueda del jugador
-    player_record = db_connection.search_read('enemies', [('name', '~*', name)], output_format= 'dict')
+    # Búsqueda del jugador por nombre exacto sin distinguir mayúsculas
+    player_ids = db_connection.search('enemies', [('name', '~*', f"^{re.escape(name)}$")])
 
-    if player_record:
-        # Obtención del registro del jugador
-        [ player_data ] = player_record
-
-        # Búsqueda del planeta
-        planet_record = db_connection.search_read('coords', ['&', ('enemy_id', '=', player_data['id']), ('planet', '=', planet)], output_format= 'dict')
-
-        # Si existe un registro de planeta
-        if planet_record:
-
-            # Obtención del registro del planeta
-            [ planet_data ] = planet_record
-
-            # Se actualiza el registro
-            db_connection.update('coords', planet_data['id'], {'x': x, 'y': y, 'color': sscolor})
-
-            # Se termina la ejecución
-            return True
-
-        else:
-
-            # Si no existe planeta registrado, se toma la ID del jugador encontrada en la base de datos
-            player_id = player_data['id']
+    if player_ids:
+        # Se toma la ID del jugador encontrado sin modificar sus datos
+        [ player_id, *_ ] = player_ids
 
     else:
-        # Si no existe el jugador en la base de datos, se crea éste
-        [ player_id ] = db_connection.create('enemies', {'name': name, 'avatar': avatar, 'level': level, 'role': mobius._alliance_roles[role]})
-
-    # Se realiza la creación del planeta del jugador
-    db_connection.create('coords', {'enemy_id': player_id, 'x': x, 'y': y, 'color': sscolor, 'planet': planet, 'starbase_level': starbase_level, 'war': False, 'create_uid': user.id, 'write_uid': user.id})
+        # Si no existe el jugador en la base de datos, se crea éste o se toma su ID si se registró al mismo tiempo
+        [ player_id ] = db_connection.upsert(
+            'enemies',
+            {'name': name, 'avatar': avatar, 'level': level, 'role': mobius._alliance_roles[role]},
+            ['name'],
+            [],
+        )
+
+    # Creación del planeta del jugador o actualización de sus coordenadas en caso de existir
+    db_connection.upsert(
+        'coords',
+        {'enemy_id': player_id, 'x': x, 'y': y, 'color': sscolor, 'planet': planet, 'starbase_level': starbase_level, 'war': False, 'create_uid': user.id, 'write_uid': user.id},
+        ['enemy_id', 'planet'],
+        ['x', 'y', 'color'],
+    )
 
     return True
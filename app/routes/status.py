@@ -1,5 +1,10 @@
-from fastapi import APIRouter, status
-from app import Mobius
+from fastapi import APIRouter, Depends, status
+from app import (
+    Mobius,
+    db_connection,
+    async_db_connection,
+)
+from app.security.auth import is_active_user
 
 router = APIRouter()
 
@@ -15,3 +20,45 @@ async def _refresh_war() -> int | None:
 
     # Retorno de la ID de la alianza enemiga
     return alliance_id
+
+@router.get(
+    "/pool",
+    status_code= status.HTTP_200_OK,
+    name= "Estadísticas de los pools de conexiones a la base de datos"
+)
+async def _pool_stats(active: bool = Depends(is_active_user)) -> dict:
+
+    # Retorno de las estadísticas de ambos pools de conexión
+    return {
+        'sync': db_connection.pool_stats(),
+        'async': async_db_connection.pool_stats(),
+    }
+
+@router.get(
+    "/cache",
+    status_code= status.HTTP_200_OK,
+    name= "Estadísticas del caché de lecturas de la base de datos"
+)
+async def _cache_stats(active: bool = Depends(is_active_user)) -> dict | None:
+
+    # Retorno de las estadísticas del caché compartido por ambas conexiones
+    return db_connection.cache_stats()
+
+@router.get(
+    "/queries",
+    status_code= status.HTTP_200_OK,
+    name= "Estadísticas de consultas a la base de datos y consultas lentas"
+)
+async def _query_stats(active: bool = Depends(is_active_user)) -> dict:
+
+    # Retorno de las estadísticas de consultas de ambas conexiones
+    return {
+        'sync': {
+            'queries': db_connection.query_stats(),
+            'slow_queries': db_connection.slow_queries(),
+        },
+        'async': {
+            'queries': async_db_connection.query_stats(),
+            'slow_queries': async_db_connection.slow_queries(),
+        },
+    }
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from app.api.websockets import ws_manager
+from app.api.websockets import ws_manager, changes_ws_manager
 
 router = APIRouter()
 
@@ -12,3 +12,13 @@ async def update_coords(ws: WebSocket):
             await ws.receive_text()
     except WebSocketDisconnect:
         ws_manager.disconnect(ws)
+
+@router.websocket("/changes")
+async def changes(ws: WebSocket):
+    await changes_ws_manager.connect(ws)
+
+    try:
+        while True:
+            await ws.receive_text()
+    except WebSocketDisconnect:
+        changes_ws_manager.disconnect(ws)
@@ -4,12 +4,12 @@ from jwt.exceptions import InvalidTokenError
 from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
 from pydantic import BaseModel
 from typing import Annotated, Union
 from datetime import datetime, timedelta
-from app.database import db_connection
+from app.database import db_connection, async_db_connection
 from app.models.users import UserData, UserInDB
+from app.security.passwords import pwd_context, hash_password
 
 class Token(BaseModel):
     """
@@ -28,8 +28,6 @@ _expire_days = 15
 _KEY = os.environ.get("CRYPT_KEY")
 # Algoritmo de encriptación
 _algorithm = "HS256"
-# Contexto para hasheo
-pwd_context = CryptContext(schemes= ["bcrypt"], deprecated= "auto")
 
 # Error de credenciales inválidas
 _credentials_exception = HTTPException(
@@ -56,7 +54,7 @@ def _get_user(username) -> UserInDB | bool:
 
     # Intento de obtención de usuario
     try:
-        [ user ] = db_connection.search_read("users", [('user', '=', username)], fields= ['id', 'user', 'name', 'password', 'active'], output_format= "dict")
+        [ user ] = db_connection.search_read("users", [('user', '=', username)], fields= ['id', 'user', 'name', 'password', 'active'], output_format= "records")
 
     # Ausencia de usuario
     except ValueError:
@@ -69,11 +67,24 @@ def _get_user(username) -> UserInDB | bool:
     # Retorno del usuario
     return UserInDB(**user)
 
-def hash_password(password: str):
+async def _load_user(username) -> UserInDB | bool:
     """
-    Obtención de hash de contraseña.
+    ## Obtención agrupada de usuario
+    Versión asíncrona de `_get_user` para las peticiones autenticadas. Las
+    lecturas de usuarios de las peticiones concurrentes se agrupan en una sola
+    consulta. A diferencia de `_get_user`, los usuarios inactivos se retornan
+    para poder reportarlos con su propio error.
     """
-    return pwd_context.hash(password)
+
+    # Obtención del usuario
+    user = await async_db_connection.load("users", username, key= 'user', fields= ['id', 'user', 'name', 'password', 'active'])
+
+    # Ausencia de usuario
+    if user is None:
+        return False
+
+    # Retorno del usuario
+    return UserInDB(**user)
 
 def authenticate_user(username: str, password: str) -> UserData | bool:
     """
@@ -121,12 +132,13 @@ def create_access_token(data: dict):
     # Retorno del diccionario codificado
     return jwt.encode(data, _KEY, algorithm = _algorithm)
 
-def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserData:
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserData:
     """
     ## Obtención del usuario por token
     Esta función recibe un token previamente provisto para autenticar al
     usuario. Si el token es inválido, el usuario no existe o el token ha
-    expirado se genera un error de credenciales inválidas. En caso contrario se
+    expirado se genera un error de credenciales inválidas, y si el usuario está
+    inactivo se genera el error de usuario inactivo. En caso contrario se
     retornan los datos del usuario.
     """
 
@@ -151,26 +163,28 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserData:
         raise _credentials_exception
 
     # Obtención del usuario desde la base de datos por medio del objeto de datos de token
-    user = _get_user(token_data.username)
+    user = await _load_user(token_data.username)
 
     # Si no hay usuario en la base de datos
-    if user is None:
+    if not user:
         # Se genera el error de credenciales inválidas
         raise _credentials_exception
 
+    # Si el usuario no está activo
+    if not user.active:
+        # Se genera el error de usuario inactivo
+        raise _inactive_user_exception
+
     # Retorno del usuario
     return user
 
-def is_active_user(user: UserInDB = Depends(get_current_user)):
-
-    # Obtención del registro del usuario
-    [ record ] = db_connection.search_read('users', [('user', '=', user.user)], fields=["active"], output_format='dict')
-
-    # Si el usuario no está activo
-    if not record['active']:
-
-        # Se lanza error de autenticación
-        raise _inactive_user_exception
+async def is_active_user(user: UserInDB = Depends(get_current_user)):
+    """
+    ## Validación de usuario activo
+    La validación de usuario activo se realiza en `get_current_user` con el
+    mismo registro del usuario, por lo que no se consulta de nuevo la base de
+    datos.
+    """
 
     # Retorno de autorización
     return True
@@ -0,0 +1,10 @@
+from passlib.context import CryptContext
+
+# Contexto para hasheo
+pwd_context = CryptContext(schemes= ["bcrypt"], deprecated= "auto")
+
+def hash_password(password: str):
+    """
+    Obtención de hash de contraseña.
+    """
+    return pwd_context.hash(password)
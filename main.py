@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routes import (
     account,
@@ -9,9 +10,18 @@ from app.routes import (
     websockets,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.websockets import changes_ws_manager
+from app.database import async_db_connection
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Envío de los cambios de la base de datos a los websockets suscritos
+    unsubscribe = async_db_connection.subscribe(changes_ws_manager.broadcast_change)
+    yield
+    unsubscribe()
 
 # Inicialización de la app
-app = FastAPI()
+app = FastAPI(lifespan= lifespan)
 
 # Configuración de orígenes permitidos
 origins = [
@@ -0,0 +1,556 @@
+import asyncio
+import gc
+import json
+import shutil
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import MetaData, UniqueConstraint, create_engine, event
+from app.constants import WARPOINTS_FROM_STARBASE_LEVEL
+from app.database.fixtures import generate_fixtures
+from app.database.migrations import deduplicate_enemies
+from app.database.models import Base
+from app.extensions._batching import BatchLoader
+from app.extensions.async_dml_manager import AsyncDMLManager
+from app.extensions.dml_manager import DMLManager
+
+# Tablas del modelo de la aplicación
+TABLES = [
+    {'table_name': 'users', 'table_instance': 'Users'},
+    {'table_name': 'alliances', 'table_instance': 'Alliances'},
+    {'table_name': 'enemies', 'table_instance': 'Enemies'},
+    {'table_name': 'coords', 'table_instance': 'Coordinates'},
+    {'table_name': 'war', 'table_instance': 'CurrentWar'},
+]
+
+
+def _configure(tmp_path, monkeypatch, **connection_params) -> None:
+    """
+    Creación del archivo de configuración de la conexión `'test'` con los
+    parámetros provistos en el directorio temporal de la prueba.
+    """
+
+    config = {'connections': {'test': {**connection_params, 'path': 'app.database.models', 'tables': TABLES}}}
+    ( tmp_path / 'db_config.json' ).write_text(json.dumps(config))
+    monkeypatch.setattr(DMLManager, '_get_root_path', lambda self, sublevels: str(tmp_path))
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch) -> DMLManager:
+    """
+    Instancia de `DMLManager` sobre una base de datos de SQLite en memoria con
+    datos sintéticos.
+    """
+
+    # Archivo de configuración de la base de datos de prueba
+    _configure(tmp_path, monkeypatch, sqlite= ':memory:')
+
+    # Creación de la instancia y de los datos sintéticos
+    db = DMLManager('db_config', 'test')
+    generate_fixtures(db, 2, 5, 3, seed= 1)
+
+    return db
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch) -> DMLManager:
+    """
+    Instancia de `DMLManager` sobre un archivo de SQLite con datos sintéticos,
+    para las pruebas con varias conexiones.
+    """
+
+    _configure(tmp_path, monkeypatch, sqlite= str(tmp_path / 'test.db'))
+
+    db = DMLManager('db_config', 'test')
+    generate_fixtures(db, 2, 5, 3, seed= 1)
+
+    return db
+
+
+@pytest.fixture
+def config(db: DMLManager) -> str:
+    """
+    Nombre del archivo de configuración de la base de datos de prueba, para
+    crear instancias adicionales.
+    """
+
+    return 'db_config'
+
+
+def test_read_group_mapped_integer_keeps_mapped_values(db: DMLManager):
+
+    # Niveles de base estelar de los planetas principales
+    levels = db.search_read('coords', [('planet', '=', 0)], ['starbase_level'])['starbase_level']
+
+    data = db.read_group(
+        'coords',
+        [('planet', '=', 0)],
+        'starbase_level',
+        ['__count'],
+        mappings= {'starbase_level': WARPOINTS_FROM_STARBASE_LEVEL},
+    )
+
+    assert sorted(data['starbase_level'].tolist()) == sorted({ WARPOINTS_FROM_STARBASE_LEVEL[level] for level in levels })
+    assert data['__count'].sum() == len(levels)
+
+
+def test_read_group_mapped_enum_keeps_unmapped_values(db: DMLManager):
+
+    data = db.read_group('coords', [], 'color', ['__count'], mappings= {'color': {'blue': 'azul'}})
+
+    assert data['color'].notna().all()
+    assert 'azul' in data['color'].tolist()
+    assert 'blue' not in data['color'].tolist()
+
+
+def test_read_group_plain_groupby_keeps_table_dtype(db: DMLManager):
+
+    data = db.read_group('coords', [], 'color', ['__count'])
+
+    assert data['color'].dtype == 'category'
+
+
+def test_starbase_level_arithmetic_does_not_overflow(db: DMLManager):
+
+    data = db.search_read('coords', [], ['starbase_level'])
+
+    assert ( data['starbase_level'] * 100 ).min() >= 100
+
+
+def test_level_arithmetic_does_not_overflow(db: DMLManager):
+
+    data = db.search_read('enemies', [], ['level'])
+
+    assert ( data['level'] * 1000 ).min() >= 1000
+
+
+def test_read_uses_table_dtypes(db: DMLManager):
+
+    data = db.read('coords', [1, 2, 3], ['planet', 'color', 'starbase_level'])
+    expected = db.search_read('coords', [('id', 'in', [1, 2, 3])], ['planet', 'color', 'starbase_level'])
+
+    assert data.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert data['color'].dtype == 'category'
+
+
+def test_iter_search_read_does_not_change_transaction_connection(db: DMLManager):
+
+    with db.transaction() as conn:
+        chunks = list(db.iter_search_read('coords', chunk_size= 7, output_format= 'records'))
+
+        assert 'yield_per' not in conn.get_execution_options()
+
+    assert sum( len(chunk) for chunk in chunks ) == db.search_count('coords')
+
+
+def test_write_metrics_do_not_compile_statements(db: DMLManager):
+
+    fingerprints = dict(db._memo_caches.get('_fingerprint', {}))
+
+    for record_id in range(1, 6):
+        db.update('coords', [record_id], {'x': record_id})
+
+    assert db._memo_caches.get('_fingerprint', {}) == fingerprints
+    assert [ stats['count'] for stats in db.query_stats() if stats['operation'] == 'update' ] == [5]
+
+
+def test_replica_reads_are_not_cached(tmp_path, monkeypatch):
+
+    # Base de datos principal con caché y una réplica que se actualiza por copia del archivo
+    ( primary, replica ) = ( tmp_path / 'primary.db', tmp_path / 'replica.db' )
+    _configure(tmp_path, monkeypatch, sqlite= str(primary), cache_size= 100, replicas= [{'sqlite': str(replica)}])
+    db = DMLManager('db_config', 'test')
+
+    def sync_replica():
+        with db._engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(FULL)")
+        shutil.copy(primary, replica)
+        for engine in db._replicas:
+            engine.dispose()
+
+    db.create('alliances', {'name': 'A', 'logo': '1-1-1', 'level': 1})
+    sync_replica()
+
+    # Lectura de la réplica retrasada después de una escritura
+    db.create('alliances', {'name': 'B', 'logo': '1-1-1', 'level': 1})
+    assert db.search_count('alliances') == 1
+
+    # Al alcanzar la réplica a la base de datos principal se lee el nuevo registro
+    sync_replica()
+    assert db.search_count('alliances') == 2
+
+
+def test_statement_caches_do_not_keep_instances_alive(config: str):
+
+    other = DMLManager(config, 'test')
+    other.search_read('coords', [('planet', '=', 0)], ['enemy_id.name'])
+    reference = weakref.ref(other)
+
+    del other
+    gc.collect()
+
+    assert reference() is None
+
+
+@pytest.mark.parametrize('values', [np.array([1, 2, 3]), pd.Series([1, 2, 3]), pd.Series([1, 2, 3, 3]).unique(), range(1, 4)])
+def test_in_accepts_any_collection(db: DMLManager, values):
+
+    assert db.search('coords', [('id', 'in', values)]) == [1, 2, 3]
+    assert 1 not in db.search('coords', [('id', 'not in', values)])
+
+
+def test_in_rejects_single_values(db: DMLManager):
+
+    with pytest.raises(ValueError):
+        db.search('coords', [('id', 'in', 1)])
+    with pytest.raises(ValueError):
+        db.search('enemies', [('name', 'in', 'enemy_0_0')])
+
+
+def test_deduplicate_enemies_allows_unique_constraints(tmp_path, monkeypatch):
+
+    # Base de datos existente creada antes de las restricciones de unicidad
+    path = tmp_path / 'legacy.db'
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        legacy_table = table.to_metadata(metadata)
+        legacy_table.constraints = { constraint for constraint in legacy_table.constraints if not isinstance(constraint, UniqueConstraint) }
+        legacy_table.indexes.clear()
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    engine.dispose()
+
+    _configure(tmp_path, monkeypatch, sqlite= str(path))
+    db = DMLManager('db_config', 'test')
+
+    # Enemigo registrado dos veces, con un planeta repetido y uno propio del duplicado
+    db.create('users', {'user': 'admin', 'password': 'x', 'active': True, 'has_changed_password': True})
+    ( first, second, other ) = db.create(
+        'enemies',
+        [ {'name': name, 'level': 10, 'role': 'member'} for name in ('Foo', 'Foo', 'Bar') ],
+    )
+    coords = db.create(
+        'coords',
+        [
+            {'enemy_id': enemy_id, 'planet': planet, 'starbase_level': 5, 'war': True, 'create_uid': 1, 'write_uid': 1}
+            for ( enemy_id, planet ) in [(first, 0), (second, 0), (second, 1), (other, 0)]
+        ],
+    )
+
+    assert deduplicate_enemies(db) == {'enemies': 1, 'coords': 1}
+    assert sorted(db.search('enemies')) == [first, other]
+    assert db.search_read('coords', [], ['enemy_id', 'planet'], sortby= 'id', output_format= 'records') == [
+        {'id': coords[0], 'enemy_id': first, 'planet': 0},
+        {'id': coords[2], 'enemy_id': first, 'planet': 1},
+        {'id': coords[3], 'enemy_id': other, 'planet': 0},
+    ]
+
+    # Creación de las restricciones de unicidad sin errores
+    report = db.ensure_indexes()
+    assert { entry['status'] for entry in report if entry['unique'] } == {'created'}
+
+
+def test_upsert_without_records_does_nothing(db: DMLManager):
+
+    count = db.search_count('enemies')
+
+    assert db.upsert('enemies', [], ['name']) == []
+    assert db.search_count('enemies') == count
+
+
+def test_create_without_records_does_nothing(db: DMLManager):
+
+    count = db.search_count('enemies')
+
+    assert db.create('enemies', []) == []
+    assert db.create('enemies', [], ['name']) == []
+    assert db.search_count('enemies') == count
+
+
+def _keyset_ids(db: DMLManager, search_criteria: list = [], **kwargs) -> list[int]:
+    """
+    IDs de todas las páginas obtenidas siguiendo el cursor.
+    """
+
+    ids = []
+    page = db.search_read_page('coords', search_criteria, ['x'], items_per_page= 9, **kwargs)
+    while True:
+        ids += page['data']['id'].tolist()
+        if page['cursor'] is None:
+            return ids
+        # El cursor se envía por JSON a los clientes, con las fechas como texto
+        cursor = json.loads(json.dumps(page['cursor'], default= str))
+        page = db.search_read_page('coords', search_criteria, ['x'], items_per_page= 9, cursor= cursor, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ( 'sortby', 'ascending' ),
+    [('x', True), ('x', False), (['x', 'starbase_level'], [True, False]), ('starbase_level', False)],
+)
+def test_keyset_pages_cover_nullable_sort_fields(db: DMLManager, sortby, ascending):
+
+    # Los datos de prueba contienen coordenadas sin registrar
+    assert db.search_count('coords', [('x', '=', None)]) > 0
+
+    ids = _keyset_ids(db, sortby= sortby, ascending= ascending)
+
+    # Mismo orden que la paginación por desfase
+    offset_ids = db.search_read_page('coords', [], ['x'], items_per_page= 0, sortby= sortby, ascending= ascending)['data']['id'].tolist()
+
+    assert ids == offset_ids
+    assert len(ids) == db.search_count('coords')
+
+
+def test_keyset_sorts_nulls_last(db: DMLManager):
+
+    x = db.search_read_page('coords', [], ['x'], items_per_page= 0, sortby= 'x', ascending= False)['data']['x']
+
+    assert x.isna().sum() > 0
+    assert x.isna().tolist() == sorted(x.isna().tolist())
+
+
+def test_relational_sort_fields_are_rejected(db: DMLManager):
+
+    with pytest.raises(ValueError):
+        db.search_read_page('coords', [], ['x'], sortby= 'enemy_id.name')
+    with pytest.raises(ValueError):
+        db.search_read_page('coords', [], ['x'], sortby= 'enemy_id.name', cursor= ['a', 1])
+    with pytest.raises(ValueError):
+        db.search_read('coords', [], ['x'], sortby= 'enemy_id.name')
+
+
+def test_transaction_rolls_back_every_write(db: DMLManager):
+
+    ( x, count ) = ( db.read('coords', [1], ['x'], output_format= 'records')[0]['x'], db.search_count('alliances') )
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.update('coords', [1], {'x': 999})
+            db.create('alliances', {'name': 'Nueva', 'logo': '1-1-1', 'level': 1})
+            # Las lecturas dentro de la transacción ven sus propias escrituras
+            assert db.search_count('alliances') == count + 1
+            raise RuntimeError
+
+    assert db.read('coords', [1], ['x'], output_format= 'records')[0]['x'] == x
+    assert db.search_count('alliances') == count
+
+
+def test_transaction_commits_once(db: DMLManager):
+
+    commits = []
+    event.listen(db._engine, 'commit', lambda conn: commits.append(conn))
+
+    with db.transaction():
+        db.update('coords', [1], {'x': 1})
+        db.update_many('coords', [{'id': 2, 'x': 2}, {'id': 3, 'x': 3}])
+        db.create('alliances', {'name': 'Nueva', 'logo': '1-1-1', 'level': 1})
+        db.delete('coords', [4])
+
+    assert len(commits) == 1
+    assert db.read('coords', [1, 2, 3], ['x'])['x'].tolist() == [1, 2, 3]
+    assert db.search('coords', [('id', '=', 4)]) == []
+
+
+def test_update_where_claim_has_a_single_winner(file_db: DMLManager):
+
+    # Planeta sin reclamar y usuarios que intentan reclamarlo al mismo tiempo
+    [ planet_id ] = file_db.search('coords', [('attacked_by', '=', None)], limit= 1)
+    user_ids = file_db.search('users') * 3
+    claims = {}
+    barrier = threading.Barrier(len(user_ids))
+
+    def claim(i: int, user_id: int):
+        barrier.wait()
+        claims[i] = file_db.update_where(
+            'coords',
+            ['&', ('id', '=', planet_id), ('attacked_by', '=', None)],
+            {'attacked_by': user_id},
+        )
+
+    threads = [ threading.Thread(target= claim, args= ( i, user_id )) for ( i, user_id ) in enumerate(user_ids) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Sólo un reclamo se aplica y el planeta queda con su usuario
+    [ winner ] = [ i for ( i, count ) in claims.items() if count == 1 ]
+    assert sorted(claims.values()) == [0] * ( len(user_ids) - 1 ) + [1]
+    assert file_db.read('coords', [planet_id], ['attacked_by'], output_format= 'records')[0]['attacked_by'] == user_ids[winner]
+
+
+def test_update_where_returning_only_matched_records(db: DMLManager):
+
+    [ planet_id ] = db.search('coords', [('attacked_by', '=', None)], limit= 1)
+    criteria = ['&', ('id', '=', planet_id), ('attacked_by', '=', None)]
+
+    assert db.update_where('coords', criteria, {'attacked_by': 1}, returning= ['attacked_by']) == [{'id': planet_id, 'attacked_by': 1}]
+    assert db.update_where('coords', criteria, {'attacked_by': 2}, returning= ['attacked_by']) == []
+
+
+def test_upsert_returns_ids_in_record_order(db: DMLManager):
+
+    # Enemigos existentes intercalados con enemigos nuevos
+    existing = db.search_read('enemies', [], ['name'], limit= 2, output_format= 'records')
+    names = ['nuevo_b', existing[1]['name'], 'nuevo_a', existing[0]['name']]
+    records = [ {'name': name, 'level': 50 + i, 'role': 'member'} for ( i, name ) in enumerate(names) ]
+
+    ids = db.upsert('enemies', records, ['name'], ['level'])
+
+    # Las IDs existentes se conservan y cada ID corresponde a su registro
+    assert ids[1] == existing[1]['id'] and ids[3] == existing[0]['id']
+    assert { record['id']: record['name'] for record in db.read('enemies', ids, ['name'], output_format= 'records') } == dict(zip(ids, names))
+    assert db.read('enemies', ids, ['level'], sortby= 'level')['level'].tolist() == [50, 51, 52, 53]
+
+
+def test_upsert_updates_composite_conflicts(db: DMLManager):
+
+    [ planet ] = db.search_read('coords', [('planet', '=', 0)], ['enemy_id', 'planet'], limit= 1, output_format= 'records')
+    record = {'enemy_id': planet['enemy_id'], 'planet': 0, 'starbase_level': 9, 'war': True, 'create_uid': 1, 'write_uid': 1}
+
+    count = db.search_count('coords')
+
+    assert db.upsert('coords', [record], ['enemy_id', 'planet'], ['starbase_level']) == [planet['id']]
+    assert db.search_count('coords') == count
+    assert db.read('coords', [planet['id']], ['starbase_level'], output_format= 'records')[0]['starbase_level'] == 9
+
+
+def test_batch_loader_deduplicates_concurrent_keys():
+
+    calls = []
+
+    async def fetch(batch_key, keys):
+        calls.append(( batch_key, keys ))
+        return { key: key * 10 for key in keys if key != 3 }
+
+    async def main():
+        loader = BatchLoader(fetch, max_batch_size= 2)
+        results = await asyncio.gather(*[ loader.load('a', key) for key in (1, 2, 1, 3) ], loader.load('b', 1))
+        return results
+
+    # Una llamada por bloque de cada llave de lote, sin llaves repetidas; las llaves sin resultado reciben None
+    assert asyncio.run(main()) == [10, 20, 10, None, 10]
+    assert sorted(calls) == [('a', [1, 2]), ('a', [3]), ('b', [1])]
+
+
+def test_batch_loader_propagates_errors_to_every_waiter():
+
+    async def fetch(batch_key, keys):
+        if batch_key == 'fail':
+            raise RuntimeError(keys)
+        return { key: key for key in keys }
+
+    async def main():
+        loader = BatchLoader(fetch)
+        results = await asyncio.gather(loader.load('fail', 1), loader.load('fail', 1), loader.load('fail', 2), loader.load('ok', 1), return_exceptions= True)
+        # El cargador sigue funcionando después del error
+        return ( results, await loader.load('fail2', 5) )
+
+    ( results, after ) = asyncio.run(main())
+
+    assert [ type(result) for result in results[:3] ] == [RuntimeError] * 3
+    assert results[0] is results[1] is results[2]
+    assert results[3] == 1
+    assert after == 5
+
+
+def test_async_load_groups_concurrent_reads(file_db: DMLManager):
+
+    async def main():
+        db = AsyncDMLManager('db_config', 'test')
+        try:
+            users = await asyncio.gather(*[ db.load('users', name, key= 'user', fields= ['name']) for name in ('user_0', 'user_1', 'user_0', 'nadie') ])
+            loads = [ stats['count'] for stats in db.query_stats() if stats['table'] == 'users' ]
+        finally:
+            await db._engine.dispose()
+        return ( users, loads )
+
+    ( users, loads ) = asyncio.run(main())
+
+    assert [ user and user['name'] for user in users ] == ['Usuario 0', 'Usuario 1', 'Usuario 0', None]
+    assert users[0] == users[2]
+    assert loads == [1]
+
+
+def test_changes_are_published_after_commit(db: DMLManager):
+
+    events = []
+
+    async def on_change(event):
+        events.append(( event['table'], event['operation'], event['ids'] ))
+
+    async def main():
+        unsubscribe = db.subscribe(on_change)
+        try:
+            # Los cambios de la transacción no se publican antes del commit
+            with db.transaction():
+                db.update('coords', [1], {'x': 1})
+                db.create('alliances', {'name': 'Nueva', 'logo': '1-1-1', 'level': 1})
+                await asyncio.sleep(0)
+                assert events == []
+            await asyncio.sleep(0)
+            published = list(events)
+
+            # Los cambios de una transacción revertida nunca se publican
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.update('coords', [2], {'x': 2})
+                    raise RuntimeError
+            await asyncio.sleep(0)
+        finally:
+            unsubscribe()
+        return published
+
+    published = asyncio.run(main())
+
+    assert published == [('coords', 'update', [1]), ('alliances', 'create', [3])]
+    assert events == published
+
+
+def test_changes_outside_transactions_are_published_immediately(db: DMLManager):
+
+    events = []
+
+    async def on_change(event):
+        events.append(( event['operation'], event['ids'], event['values'] ))
+
+    async def main():
+        unsubscribe = db.subscribe(on_change)
+        try:
+            db.update('coords', [1], {'x': 5})
+            await asyncio.sleep(0)
+        finally:
+            unsubscribe()
+
+    asyncio.run(main())
+
+    assert events == [('update', [1], [{'x': 5}])]
+
+
+@pytest.mark.parametrize(
+    ( 'search_criteria', 'sortby', 'ascending' ),
+    [
+        ([], 'attacked_at', False),
+        ([('war', '=', True)], ['color', 'attacked_at'], [True, False]),
+        ([('planet', '=', 0)], ['starbase_level', 'x'], [False, True]),
+    ],
+)
+def test_keyset_pages_match_offset_pages(db: DMLManager, search_criteria, sortby, ascending):
+
+    ids = _keyset_ids(db, search_criteria, sortby= sortby, ascending= ascending)
+    offset_ids = db.search_read_page('coords', search_criteria, ['x'], items_per_page= 0, sortby= sortby, ascending= ascending)['data']['id'].tolist()
+
+    assert ids == offset_ids
+    assert len(ids) == db.search_count('coords', search_criteria)
+
+
+def test_keyset_cursor_is_validated(db: DMLManager):
+
+    # Cantidad de valores distinta a la de los campos de ordenamiento con el ID
+    with pytest.raises(ValueError):
+        db.search_read_page('coords', sortby= 'x', cursor= [1])
+    # Valor nulo en un campo que no admite nulos
+    with pytest.raises(ValueError):
+        db.search_read_page('coords', sortby= 'x', cursor= [1, None])